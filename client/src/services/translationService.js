@@ -2,6 +2,11 @@ import axios from 'axios';
 
 const API_URL = process.env.REACT_APP_ML_API_URL || 'http://localhost:5001/api';
 
+// Identifies this page's webcam stream so the ML backend can track the hand across frames
+const REALTIME_SESSION_ID = (window.crypto && window.crypto.randomUUID)
+    ? window.crypto.randomUUID()
+    : `${Date.now()}-${Math.random().toString(36).slice(2)}`;
+
 export const translationService = {
     // Send image for translation (used for uploaded images)
     translateImage: async (imageData) => {
@@ -19,7 +24,8 @@ export const translationService = {
     translateRealtimeImage: async (imageData) => {
         try {
             const response = await axios.post(`${API_URL}/translate/realtime`, {
-                image: imageData
+                image: imageData,
+                session_id: REALTIME_SESSION_ID
             });
             return response.data;
         } catch (error) {
@@ -3,107 +3,380 @@ Flask application for ASL sign language recognition.
 Provides REST API endpoints for image-based sign language translation.
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-import cv2
-import numpy as np
 import os
-import base64
+import time
+import threading
 from dotenv import load_dotenv
-from utils.feature_extraction import extract_hand_landmarks
-from utils.predict import predict_sign, get_model_info
+from concurrent.futures import ThreadPoolExecutor
+from utils.detector_pool import get_detector_pool
+from utils.image_io import (
+    BINARY_IMAGE_TYPES, MAX_FILE_SIZE, IMAGE_TOO_LARGE, FILE_TOO_LARGE, FILE_TYPE_NOT_ALLOWED,
+    allowed_file, check_binary_frame, read_data_uri, read_body, decode_image_buffer
+)
+from utils.sessions import get_session_manager, get_request_session, MAX_SESSION_ID_LENGTH
+from utils.serving import is_draining
+from utils.process_pool import get_extraction_pool
+from utils.pipeline import extraction_error_result, extract_landmarks, process_frame
+from utils.frame_cache import get_frame_cache
+from utils.log_config import configure_logging, begin_request, end_request, current_request_id
+from utils.metrics import (
+    CONTENT_TYPE, HTTP_IN_FLIGHT, HTTP_REQUESTS, HTTP_REQUEST_SECONDS, render_metrics, timed
+)
+from utils.predict import predict_sign, predict_signs_batch, validate_feature_matrix, get_model_info, get_batcher, get_prediction_cache, get_forest_evaluator, reload_model
+from utils.model_reload import MODEL_RELOAD_TOKEN, reload_token_valid
+import json
+import uuid
 import logging
+from typing import Optional
+
+# WebSocket support is optional (flask-sock); the HTTP API works without it
+try:
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
 
 # Load environment variables
 load_dotenv()
 
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Default JSON provider that records response serialization as the "serialize" stage."""
+    
+    def dumps(self, obj, **kwargs):
+        with timed("serialize"):
+            return super().dumps(obj, **kwargs)
+
+
 app = Flask(__name__)
+app.json = TimedJSONProvider(app)
 CORS(app, resources={r"/*": {"origins": os.getenv("CLIENT_URL", "http://localhost:3000")}})
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Set up logging (queued writer thread, see utils/log_config.py)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# File size limit (2MB)
-MAX_FILE_SIZE = 2 * 1024 * 1024
-ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+# WebSocket streaming channel (see translate_stream)
+sock = None
+if Sock is not None:
+    app.config['SOCK_SERVER_OPTIONS'] = {'max_message_size': MAX_FILE_SIZE * 2}
+    sock = Sock(app)
+else:
+    logger.warning("flask-sock is not installed, /api/translate/stream is disabled")
+
+# Maximum number of images or feature vectors per batch request
+MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', 1024))
+
+# How often an idle stream checks whether the worker is draining (seconds)
+STREAM_POLL_INTERVAL = 1.0
+
+# Open WebSocket streams per worker. Each stream holds one of the worker's
+# WEB_THREADS request threads (gunicorn.conf.py) for its whole life, so the
+# cap stays below WEB_THREADS to leave threads for HTTP requests
+MAX_STREAMS = int(os.getenv('MAX_STREAMS', max(1, int(os.getenv('WEB_THREADS', 4)) // 2)))
+_open_streams = 0
+_streams_lock = threading.Lock()
+
+
+@app.before_request
+def start_request_logging():
+    """Assign the request id and sampling decision used by log records."""
+    g.log_tokens = begin_request(request.headers.get('X-Request-Id'))
 
 
-def allowed_file(filename):
-    """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+@app.teardown_request
+def end_request_logging(exc):
+    """Restore the logging context of the request thread."""
+    tokens = g.pop('log_tokens', None)
+    if tokens is not None:
+        end_request(tokens)
+
+
+@app.before_request
+def start_request_metrics():
+    """Count the request as in flight and start its latency timer."""
+    g.request_started = time.perf_counter()
+    HTTP_IN_FLIGHT.inc()
+
+
+@app.after_request
+def record_request_metrics(response):
+    """Record request latency and status code per route."""
+    started = g.get('request_started')
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule is not None else "unmatched"
+        HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, route)
+        HTTP_REQUESTS.inc(route, str(response.status_code))
+    
+    request_id = current_request_id()
+    if request_id is not None:
+        response.headers['X-Request-Id'] = request_id
+    return response
+
+
+@app.teardown_request
+def end_request_metrics(exc):
+    """Remove the request from the in-flight count, also when it failed."""
+    if g.pop('request_started', None) is not None:
+        HTTP_IN_FLIGHT.dec()
+
+
+def read_binary_frame():
+    """
+    Read an image sent as the raw request body instead of base64 JSON:
+    - image/jpeg or image/png: encoded image bytes
+    - application/octet-stream: uncompressed RGB frame, with X-Frame-Width
+      and X-Frame-Height headers
+    
+    The size limit is checked against Content-Length before the body is read,
+    and the body is read into a single buffer that NumPy wraps without copying.
+    The frame is decoded by process_frame, after the frame cache lookup.
+    
+    Returns:
+        Tuple of (buffer, raw_size, error_message); buffer is None on error
+        and raw_size is (width, height) for raw RGB frames
+    """
+    length = request.content_length
+    raw_size, error = check_binary_frame(
+        request.mimetype, length,
+        request.headers.get('X-Frame-Width'), request.headers.get('X-Frame-Height')
+    )
+    if error:
+        return None, None, error
+    
+    with timed("parse"):
+        return read_body(request.stream, length), raw_size, None
 
 
-def process_image(image: np.ndarray) -> dict:
+def process_batch(extracted: list) -> list:
     """
-    Common processing function for both endpoints.
-    Extracts features and makes prediction.
+    Make predictions for a batch of extraction outcomes with one model call.
     
     Args:
-        image: Input image as numpy array (BGR format)
+        extracted: List of (features, error_info) tuples, one per item
         
     Returns:
-        Dictionary with prediction results or error information
+        List of per-item result dictionaries (same format as process_image)
+    """
+    results = [None] * len(extracted)
+    rows = []
+    positions = []
+    
+    for i, (features, error_info) in enumerate(extracted):
+        if error_info:
+            results[i] = extraction_error_result(error_info)
+        else:
+            rows.append(features)
+            positions.append(i)
+    
+    if rows:
+        # Step 2: One predict_proba call on the (N, 42) feature matrix
+        predictions = predict_signs_batch(rows)
+        for i, (predicted_sign, confidence) in zip(positions, predictions):
+            results[i] = {
+                "status": "success",
+                "predicted_sign": predicted_sign,
+                "confidence": float(confidence)
+            }
+    
+    return results
+
+
+def _extract_from_upload(image_bytes: Optional[bytes]) -> tuple:
+    """Decode an uploaded image file and extract its features."""
+    if image_bytes is None:
+        return None, {
+            "status": "error",
+            "message": FILE_TYPE_NOT_ALLOWED
+        }
+    
+    if len(image_bytes) > MAX_FILE_SIZE:
+        return None, {
+            "status": "error",
+            "message": FILE_TOO_LARGE
+        }
+    
+    image = decode_image_buffer(image_bytes, rgb=True)
+    if image is None:
+        return None, {"status": "error", "message": "Invalid image file"}
+    return extract_landmarks(image, is_rgb=True)
+
+
+def _extract_from_data_uri(image_data_base64) -> tuple:
+    """Validate a base64 data URI and extract its features."""
+    image_bytes, error = read_data_uri(image_data_base64)
+    if image_bytes is None:
+        return None, {"status": "error", "message": error}
+    
+    image = decode_image_buffer(image_bytes, rgb=True)
+    if image is None:
+        return None, {"status": "error", "message": "Failed to decode base64 image"}
+    return extract_landmarks(image, is_rgb=True)
+
+
+def _validate_feature_row(row) -> tuple:
+    """Validate one client-supplied feature vector."""
+    try:
+        return validate_feature_matrix([row])[0], None
+    except ValueError as e:
+        return None, {"status": "error", "message": str(e)}
+
+
+@app.route('/api/translate/batch', methods=['POST'])
+def translate_batch():
+    """
+    Endpoint for batch translation.
+    Accepts many images or precomputed feature vectors in one request:
+    - multipart/form-data with several 'images' file fields
+    - JSON {"images": ["data:image/jpeg;base64,...", ...]}
+    - JSON {"features": [[42 floats], ...]}
+    
+    Landmarks are extracted concurrently on the detector pool and all
+    feature vectors are classified with a single predict_proba call.
+    
+    Returns:
+        JSON {status: "success", count: int, results: [...]}, where each
+        result has the same format as /api/translate, in request order
     """
     try:
-        # Step 1: Extract hand landmarks (42 features)
-        features, error_info = extract_hand_landmarks(image)
+        uploads = request.files.getlist('images')
+        data = None if uploads else request.get_json(silent=True)
         
-        # Handle no hand detected (not an error, just no hand in frame)
-        if error_info and error_info.get("status") == "no_hand":
-            logger.info("No hand detected in frame")
-            return {
-                "status": "no_hand",
-                "message": error_info.get("message", "No hand detected"),
-                "predicted_sign": None,
-                "confidence": 0.0
-            }
+        if uploads:
+            items = uploads
+        elif isinstance(data, dict) and ('images' in data) != ('features' in data):
+            items = data.get('images', data.get('features'))
+        else:
+            logger.error("Batch request needs either 'images' or 'features'")
+            return jsonify({
+                "status": "error",
+                "error": "Provide either 'images' or 'features' for batch translation"
+            }), 400
         
-        # Handle actual errors
-        if error_info:
-            error_msg = error_info.get("message", "Feature extraction failed")
-            logger.error(f"Feature extraction error: {error_msg}")
-            return {
+        if not isinstance(items, list) or len(items) == 0:
+            return jsonify({"status": "error", "error": "Batch is empty"}), 400
+        
+        if len(items) > MAX_BATCH_SIZE:
+            logger.error(f"Batch size {len(items)} exceeds limit")
+            return jsonify({
                 "status": "error",
-                "error": error_msg,
-                "predicted_sign": None,
-                "confidence": 0.0
-            }
+                "error": f"Batch size exceeds limit. Max batch size is {MAX_BATCH_SIZE}."
+            }), 400
         
-        # Step 2: Make prediction using RandomForest model
-        logger.info("Making prediction with extracted features")
-        predicted_sign, confidence = predict_sign(features)
+        logger.info(f"Processing batch of {len(items)} items")
         
-        logger.info(f"Prediction successful: {predicted_sign} (confidence: {confidence:.4f})")
+        if data is not None and 'features' in data:
+            extracted = [_validate_feature_row(row) for row in items]
+        else:
+            if uploads:
+                extract = _extract_from_upload
+                # Read one byte past the limit so oversized files are detected without reading them fully
+                sources = [
+                    file.read(MAX_FILE_SIZE + 1) if allowed_file(file.filename) else None
+                    for file in uploads
+                ]
+            else:
+                extract = _extract_from_data_uri
+                sources = items
+            
+            # Step 1: Extract landmarks concurrently, bounded by the detector or extraction pool size
+            pool = get_extraction_pool()
+            concurrency = pool.max_pending if pool is not None else get_detector_pool().max_size
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                extracted = list(executor.map(extract, sources))
+        
+        results = process_batch(extracted)
         
-        # Return result
-        return {
+        return jsonify({
             "status": "success",
-            "predicted_sign": predicted_sign,
-            "confidence": float(confidence)
-        }
+            "count": len(results),
+            "results": results
+        }), 200
         
     except Exception as e:
         error_message = str(e)
-        logger.error(f"Error in process_image: {error_message}")
+        logger.error(f"Unhandled error in /api/translate/batch: {error_message}")
         import traceback
         logger.error(traceback.format_exc())
-        return {
+        return jsonify({
             "status": "error",
-            "error": f"Processing failed: {error_message}",
-            "predicted_sign": None,
-            "confidence": 0.0
-        }
+            "error": f"Batch translation failed: {error_message}"
+        }), 500
+
+
+@app.route('/api/translate/landmarks', methods=['POST'])
+def translate_landmarks():
+    """
+    Endpoint for clients that already run hand tracking.
+    Accepts precomputed landmark feature vectors (21 landmarks × (x, y),
+    normalized like MediaPipe output) and skips image decoding and MediaPipe:
+    - JSON {"features": [42 floats]} for a single frame
+    - JSON {"features": [[42 floats], ...]} for a batch
+    
+    Returns:
+        - single: JSON with prediction results (same format as /api/translate)
+        - batch: JSON {status: "success", count: int, results: [...]} (same as /api/translate/batch)
+    """
+    try:
+        data = request.get_json(silent=True)
+        features = data.get('features') if isinstance(data, dict) else None
+        
+        if not isinstance(features, list) or len(features) == 0:
+            logger.error("No landmark features received")
+            return jsonify({
+                "status": "error",
+                "error": "No landmark features provided"
+            }), 400
+        
+        # Single vector: same validation, threshold and class mapping as image requests
+        if not isinstance(features[0], list):
+            try:
+                row = validate_feature_matrix([features])[0]
+            except ValueError as e:
+                logger.error(f"Invalid landmark features: {str(e)}")
+                return jsonify({"status": "error", "error": str(e)}), 400
+            
+            predicted_sign, confidence = predict_sign(row)
+            return jsonify({
+                "status": "success",
+                "predicted_sign": predicted_sign,
+                "confidence": float(confidence)
+            }), 200
+        
+        if len(features) > MAX_BATCH_SIZE:
+            logger.error(f"Landmark batch size {len(features)} exceeds limit")
+            return jsonify({
+                "status": "error",
+                "error": f"Batch size exceeds limit. Max batch size is {MAX_BATCH_SIZE}."
+            }), 400
+        
+        results = process_batch([_validate_feature_row(row) for row in features])
+        
+        return jsonify({
+            "status": "success",
+            "count": len(results),
+            "results": results
+        }), 200
+        
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Unhandled error in /api/translate/landmarks: {error_message}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return jsonify({
+            "status": "error",
+            "error": f"Landmark translation failed: {error_message}"
+        }), 500
 
 
 @app.route('/api/translate', methods=['POST'])
 def translate():
     """
     Endpoint for image upload translation.
-    Accepts either file upload or base64 encoded image.
+    Accepts a raw binary body (image/jpeg, image/png, or an RGB
+    application/octet-stream frame), a file upload or a base64 encoded image.
     
     Returns:
         JSON with prediction results:
@@ -111,12 +384,20 @@ def translate():
         - no_hand: {status: "no_hand", message: str, predicted_sign: null, confidence: 0}
         - error: {status: "error", error: str}
     """
-    image = None
+    buffer = None
+    raw_size = None
+    decode_error = "Invalid image file"
     
     try:
-        # Priority 1: Check for direct file upload
-        if 'image' in request.files:
-            logger.info("Processing direct file upload")
+        # Priority 1: Raw binary body (no multipart/base64 overhead)
+        if request.mimetype in BINARY_IMAGE_TYPES:
+            buffer, raw_size, error = read_binary_frame()
+            if buffer is None:
+                return jsonify({"status": "error", "error": error}), 400
+        
+        # Priority 2: Check for direct file upload
+        elif 'image' in request.files:
+            logger.debug("Processing direct file upload")
             file = request.files['image']
             
             if file.filename == '':
@@ -127,7 +408,7 @@ def translate():
                 logger.error(f"File type not allowed: {file.filename}")
                 return jsonify({
                     "status": "error",
-                    "error": "File type not allowed. Only png, jpg, jpeg are accepted."
+                    "error": FILE_TYPE_NOT_ALLOWED
                 }), 400
             
             # Check file size
@@ -139,66 +420,24 @@ def translate():
                 logger.error(f"File size ({file_length} bytes) exceeds limit")
                 return jsonify({
                     "status": "error",
-                    "error": f"File size exceeds limit. Max size is {MAX_FILE_SIZE // (1024*1024)}MB."
+                    "error": FILE_TOO_LARGE
                 }), 400
             
-            # Read and decode file
-            image_bytes = file.read()
-            image_array = np.frombuffer(image_bytes, np.uint8)
-            image = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-            
-            if image is None or image.size == 0:
-                logger.error("Failed to decode image from file upload")
-                return jsonify({"status": "error", "error": "Invalid image file"}), 400
-            
-            logger.info(f"Successfully decoded image from file: {image.shape}")
+            # Read file (decoded by process_frame)
+            with timed("parse"):
+                buffer = file.read()
         
-        # Priority 2: Check for base64 encoded image in JSON
+        # Priority 3: Check for base64 encoded image in JSON
         else:
-            logger.info("Checking for JSON base64 data")
-            data = request.get_json(silent=True)
+            logger.debug("Checking for JSON base64 data")
+            with timed("parse"):
+                data = request.get_json(silent=True)
             
             if data and 'image' in data:
-                image_data_base64 = data['image']
-                logger.info(f"Received base64 image data with length: {len(image_data_base64)}")
-                
-                if not image_data_base64.startswith('data:image'):
-                    logger.error("Invalid base64 image format")
-                    return jsonify({
-                        "status": "error",
-                        "error": "Invalid base64 image format."
-                    }), 400
-                
-                try:
-                    # Remove data URI prefix
-                    image_data_base64 = image_data_base64.split(',')[1]
-                    image_bytes = base64.b64decode(image_data_base64)
-                    
-                    if len(image_bytes) > MAX_FILE_SIZE:
-                        logger.error(f"Decoded base64 image size exceeds limit")
-                        return jsonify({
-                            "status": "error",
-                            "error": f"Image size exceeds limit. Max size is {MAX_FILE_SIZE // (1024*1024)}MB."
-                        }), 400
-                    
-                    image_array = np.frombuffer(image_bytes, np.uint8)
-                    image = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-                    
-                    if image is None or image.size == 0:
-                        logger.error("Failed to decode base64 image")
-                        return jsonify({
-                            "status": "error",
-                            "error": "Failed to decode base64 image"
-                        }), 400
-                    
-                    logger.info(f"Successfully decoded base64 image: {image.shape}")
-                    
-                except Exception as e:
-                    logger.error(f"Error decoding base64 image: {str(e)}")
-                    return jsonify({
-                        "status": "error",
-                        "error": f"Error decoding base64 image: {str(e)}"
-                    }), 400
+                buffer, error = read_data_uri(data['image'])
+                if buffer is None:
+                    return jsonify({"status": "error", "error": error}), 400
+                decode_error = "Failed to decode base64 image"
             else:
                 logger.error("No image data received")
                 return jsonify({
@@ -206,8 +445,8 @@ def translate():
                     "error": "No image data provided"
                 }), 400
         
-        # Process the image
-        result = process_image(image)
+        # Process the image (repeated frames are served from the frame cache)
+        result = process_frame(buffer, raw_size=raw_size, decode_error=decode_error)
         
         # Return appropriate status code based on result
         if result["status"] == "error":
@@ -230,7 +469,12 @@ def translate():
 def translate_realtime():
     """
     Endpoint for real-time webcam translation.
-    Accepts base64 encoded images from webcam.
+    Accepts base64 encoded images from webcam, or a raw binary body
+    (image/jpeg, image/png, or an RGB application/octet-stream frame).
+    An optional session id (X-Session-Id header or "session_id" field) lets
+    consecutive frames reuse the hand tracker instead of full detection, and
+    adds a "sequence" object with the smoothed, stable sign and the text
+    committed so far (see utils/temporal_decoder.py).
     
     Note: This endpoint uses the same processing pipeline as /api/translate
     but is kept separate for frontend compatibility and potential future optimizations.
@@ -238,61 +482,37 @@ def translate_realtime():
     Returns:
         JSON with prediction results (same format as /api/translate)
     """
-    image = None
+    buffer = None
+    raw_size = None
+    decode_error = "Invalid image file"
+    data = None
     
     try:
-        data = request.get_json(silent=True)
-        
-        if data and 'image' in data:
-            image_data_base64 = data['image']
-            logger.info(f"Received real-time base64 image data with length: {len(image_data_base64)}")
-            
-            if not image_data_base64.startswith('data:image'):
-                logger.error("Invalid base64 image format")
-                return jsonify({
-                    "status": "error",
-                    "error": "Invalid base64 image format."
-                }), 400
+        if request.mimetype in BINARY_IMAGE_TYPES:
+            buffer, raw_size, error = read_binary_frame()
+            if buffer is None:
+                return jsonify({"status": "error", "error": error}), 400
+        else:
+            with timed("parse"):
+                data = request.get_json(silent=True)
             
-            try:
-                # Remove data URI prefix
-                image_data_base64 = image_data_base64.split(',')[1]
-                image_bytes = base64.b64decode(image_data_base64)
-                
-                if len(image_bytes) > MAX_FILE_SIZE:
-                    logger.error(f"Decoded base64 image size exceeds limit")
-                    return jsonify({
-                        "status": "error",
-                        "error": f"Image size exceeds limit. Max size is {MAX_FILE_SIZE // (1024*1024)}MB."
-                    }), 400
-                
-                image_array = np.frombuffer(image_bytes, np.uint8)
-                image = cv2.imdecode(image_array, cv2.IMREAD_COLOR)
-                
-                if image is None or image.size == 0:
-                    logger.error("Failed to decode base64 image")
-                    return jsonify({
-                        "status": "error",
-                        "error": "Failed to decode base64 image"
-                    }), 400
-                
-                logger.info(f"Successfully decoded real-time base64 image: {image.shape}")
-                
-            except Exception as e:
-                logger.error(f"Error decoding base64 image: {str(e)}")
+            if data and 'image' in data:
+                buffer, error = read_data_uri(data['image'])
+                if buffer is None:
+                    return jsonify({"status": "error", "error": error}), 400
+                decode_error = "Failed to decode base64 image"
+            else:
+                logger.error("No image data received in JSON payload")
                 return jsonify({
                     "status": "error",
-                    "error": f"Error decoding base64 image: {str(e)}"
+                    "error": "No image data provided"
                 }), 400
-        else:
-            logger.error("No image data received in JSON payload")
-            return jsonify({
-                "status": "error",
-                "error": "No image data provided"
-            }), 400
         
-        # Process the image (same pipeline as /api/translate)
-        result = process_image(image)
+        # Process the image (same pipeline as /api/translate), tracking
+        # the hand across frames when the client sends a session id
+        session = get_request_session(request.headers.get('X-Session-Id'), data)
+        result = process_frame(buffer, session=session, raw_size=raw_size,
+                               decode_error=decode_error)
         
         # Return appropriate status code based on result
         if result["status"] == "error":
@@ -311,6 +531,127 @@ def translate_realtime():
         }), 500
 
 
+def _read_stream_frame(message):
+    """
+    Read one WebSocket frame: binary JPEG/PNG bytes or a base64 data URI string.
+    The encoded bytes are decoded by process_frame.
+    
+    Returns:
+        Tuple of (encoded_bytes, error_message)
+    """
+    try:
+        if isinstance(message, str):
+            return read_data_uri(message)
+        
+        if len(message) > MAX_FILE_SIZE:
+            return None, IMAGE_TOO_LARGE
+        
+        return message, None
+        
+    except Exception as e:
+        return None, f"Error decoding image frame: {str(e)}"
+
+
+def _claim_stream() -> bool:
+    """Count a new stream in, unless MAX_STREAMS are already open."""
+    global _open_streams
+    with _streams_lock:
+        if _open_streams >= MAX_STREAMS:
+            return False
+        _open_streams += 1
+        return True
+
+
+def _release_stream():
+    global _open_streams
+    with _streams_lock:
+        _open_streams -= 1
+
+
+if sock is not None:
+    @sock.route('/api/translate/stream')
+    def translate_stream(ws):
+        """
+        WebSocket channel for continuous webcam translation.
+        The client sends frames as binary JPEG/PNG messages (or base64 data URI
+        text messages); each processed frame is answered with a JSON message in
+        the /api/translate format plus "frame" (sequence number of the frame
+        that was processed) and "dropped" (frames skipped so far).
+        
+        When frames arrive faster than they can be processed, only the newest
+        queued frame is processed and older ones are dropped, so latency stays
+        bounded. The connection is a realtime session (optional ?session_id=).
+        
+        Beyond MAX_STREAMS open streams in this worker, new connections are
+        closed with code 1013 (try again later).
+        """
+        if not _claim_stream():
+            logger.warning(f"Rejecting stream: {MAX_STREAMS} streams already open in this worker")
+            ws.close(reason=1013, message="Too many open streams, try again later")
+            return
+        
+        try:
+            _serve_stream(ws)
+        finally:
+            _release_stream()
+    
+    def _serve_stream(ws):
+        """Run one stream until the client disconnects or the worker drains."""
+        session_id = request.args.get('session_id')
+        owns_session = not session_id or len(session_id) > MAX_SESSION_ID_LENGTH
+        if owns_session:
+            session_id = f"ws-{uuid.uuid4().hex}"
+        
+        received = 0
+        dropped = 0
+        logger.info(f"Stream opened for session {session_id}")
+        
+        try:
+            while not is_draining():
+                message = ws.receive(timeout=STREAM_POLL_INTERVAL)
+                if message is None:
+                    continue
+                received += 1
+                
+                # Skip to the newest frame; anything queued behind it is stale
+                while True:
+                    newer = ws.receive(timeout=0)
+                    if newer is None:
+                        break
+                    message = newer
+                    received += 1
+                    dropped += 1
+                
+                # Each frame gets its own request id and log sampling decision
+                log_tokens = begin_request(f"{session_id}:{received}")
+                try:
+                    buffer, error = _read_stream_frame(message)
+                    if buffer is None:
+                        result = {"status": "error", "error": error}
+                    else:
+                        result = process_frame(buffer, session=get_session_manager().get(session_id),
+                                               decode_error="Failed to decode image frame")
+                finally:
+                    end_request(log_tokens)
+                
+                # Stream errors always carry the prediction fields
+                result.setdefault("predicted_sign", None)
+                result.setdefault("confidence", 0.0)
+                
+                result["frame"] = received
+                result["dropped"] = dropped
+                with timed("serialize"):
+                    message = json.dumps(result)
+                ws.send(message)
+            
+            # Worker is shutting down: 1001 tells the client to reconnect elsewhere
+            ws.close(reason=1001, message="Server shutting down")
+        finally:
+            logger.info(f"Stream closed for session {session_id} ({received} frames, {dropped} dropped)")
+            if owns_session:
+                get_session_manager().remove(session_id)
+
+
 @app.route('/api/model/info', methods=['GET'])
 def model_info():
     """
@@ -334,14 +675,117 @@ def model_info():
         }), 500
 
 
+@app.route('/api/model/reload', methods=['POST'])
+def model_reload():
+    """
+    Admin endpoint to load a new model from MODEL_PATH now instead of
+    waiting for the file watcher. Needs the MODEL_RELOAD_TOKEN in an
+    X-Admin-Token header and is disabled when no token is configured.
+    Send {"force": true} to reload an unchanged file.
+    
+    Only the worker handling the request reloads; the file watcher
+    (MODEL_WATCH_INTERVAL) reloads every worker.
+    
+    Returns:
+        JSON with "reloaded" and the active model information; on failure
+        the previous model stays active
+    """
+    if not MODEL_RELOAD_TOKEN:
+        return jsonify({
+            "status": "error",
+            "error": "Model reload endpoint is disabled (MODEL_RELOAD_TOKEN is not set)"
+        }), 403
+    
+    if not reload_token_valid(request.headers.get('X-Admin-Token')):
+        return jsonify({
+            "status": "error",
+            "error": "Invalid admin token"
+        }), 403
+    
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        result = reload_model(force=bool(data.get('force')))
+        return jsonify({
+            "status": "success",
+            "reloaded": result["reloaded"],
+            "model_info": get_model_info()
+        }), 200
+    except Exception as e:
+        logger.error(f"Model reload failed: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "error": f"Model reload failed, previous model still active: {str(e)}"
+        }), 500
+
+
+@app.route('/api/stats', methods=['GET'])
+def stats():
+    """
+    Endpoint to get runtime statistics of the processing pipeline.
+    Reports detector pool wait time and utilization, realtime sessions,
+    prediction batch-size / queue-delay histograms, extraction process
+    pool counters, frame / prediction cache hit rates, early-exit forest
+    evaluation (trees evaluated per prediction) and open WebSocket streams
+    for this worker.
+    
+    Returns:
+        JSON with pipeline statistics
+    """
+    try:
+        batcher = get_batcher()
+        extraction_pool = get_extraction_pool()
+        frame_cache = get_frame_cache()
+        prediction_cache = get_prediction_cache()
+        evaluator = get_forest_evaluator()
+        return jsonify({
+            "status": "success",
+            "pid": os.getpid(),
+            "detector_pool": get_detector_pool().stats(),
+            "sessions": get_session_manager().stats(),
+            "predict_batcher": batcher.stats() if batcher is not None else None,
+            "extraction_pool": extraction_pool.stats() if extraction_pool is not None else None,
+            "frame_cache": frame_cache.stats() if frame_cache is not None else None,
+            "prediction_cache": prediction_cache.stats() if prediction_cache is not None else None,
+            "forest_evaluation": evaluator.stats() if evaluator is not None else None,
+            "streams": {"open": _open_streams, "max": MAX_STREAMS} if sock is not None else None
+        }), 200
+    except Exception as e:
+        logger.error(f"Error getting stats: {str(e)}")
+        return jsonify({
+            "status": "error",
+            "error": str(e)
+        }), 500
+
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """
+    Endpoint exposing per-stage latency histograms, frame outcome counters
+    and HTTP request metrics of this worker in the Prometheus text format.
+    
+    Returns:
+        Prometheus text exposition
+    """
+    return Response(render_metrics(), content_type=CONTENT_TYPE)
+
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """
     Health check endpoint.
+    Returns 503 while the worker is draining so load balancers stop routing to it.
     
     Returns:
         JSON with service status
     """
+    if is_draining():
+        return jsonify({
+            "status": "draining",
+            "service": "ASL Sign Language Recognition",
+            "version": "2.0 (RandomForest)"
+        }), 503
+    
     return jsonify({
         "status": "healthy",
         "service": "ASL Sign Language Recognition",
@@ -350,7 +794,9 @@ def health_check():
 
 
 if __name__ == '__main__':
+    # Development server only; in production run: gunicorn -c gunicorn.conf.py app:app
     port = int(os.getenv('PORT', 5001))
-    logger.info(f"Starting Flask server on port {port}")
+    debug = os.getenv('FLASK_DEBUG', 'false').lower() in ('1', 'true', 'yes')
+    logger.info(f"Starting Flask development server on port {port} (debug={debug})")
     logger.info(f"CORS enabled for: {os.getenv('CLIENT_URL', 'http://localhost:3000')}")
-    app.run(host='0.0.0.0', port=port, debug=True)
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
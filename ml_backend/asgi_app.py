@@ -0,0 +1,342 @@
+"""
+ASGI application for ASL sign language recognition.
+Async variant of app.py with the same routes and response schema: request
+parsing and I/O run on the event loop, decoding, landmark extraction and
+prediction run on a thread pool, so idle realtime clients do not each hold
+a thread.
+
+Usage (from ml_backend/):
+    uvicorn asgi_app:app --host 0.0.0.0 --port 5001 --workers 4
+"""
+
+import os
+import json
+import time
+import asyncio
+import contextvars
+import logging
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from utils.image_io import (
+    BINARY_IMAGE_TYPES, MAX_FILE_SIZE, FILE_TOO_LARGE, FILE_TYPE_NOT_ALLOWED,
+    allowed_file, check_binary_frame, read_data_uri
+)
+from utils.log_config import configure_logging, begin_request, end_request, current_request_id
+from utils.metrics import (
+    CONTENT_TYPE, HTTP_IN_FLIGHT, HTTP_REQUESTS, HTTP_REQUEST_SECONDS, render_metrics, timed
+)
+from utils.pipeline import process_frame
+from utils.model_reload import MODEL_RELOAD_TOKEN, reload_token_valid
+from utils.predict import get_model_info, reload_model
+from utils.serving import warm_up, shutdown, is_draining
+from utils.sessions import get_request_session
+
+# Load environment variables
+load_dotenv()
+
+# Set up logging (queued writer thread, see utils/log_config.py)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# Multipart bodies add boundaries and part headers around the file; larger
+# uploads are rejected from Content-Length before the form is read
+MAX_FORM_SIZE = MAX_FILE_SIZE + 64 * 1024
+
+# Threads for the CPU stages (decode, extraction, prediction); requests
+# beyond this wait on the event loop without holding a thread
+CPU_THREADS = int(os.getenv('ASYNC_CPU_THREADS', os.cpu_count() or 1))
+
+_executor = ThreadPoolExecutor(max_workers=CPU_THREADS, thread_name_prefix="asgi-cpu")
+
+
+async def run_cpu(func, *args):
+    """
+    Run a CPU-bound function on the executor without blocking the event loop.
+    The request's context (log request id and sampling) goes with it.
+    """
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(_executor, context.run, func, *args)
+
+
+class TimedJSONResponse(JSONResponse):
+    """JSONResponse that records serialization as the "serialize" stage."""
+
+    def render(self, content) -> bytes:
+        with timed("serialize"):
+            return super().render(content)
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware recording in-flight requests, latency and status codes
+    per route, and setting the request's logging context (see app.py hooks).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        headers = dict(scope.get("headers") or ())
+        request_id = headers.get(b"x-request-id", b"").decode("latin-1") or None
+        log_tokens = begin_request(request_id)
+        request_id = current_request_id()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", ())) + [(b"x-request-id", request_id.encode("latin-1"))]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            end_request(log_tokens)
+            HTTP_IN_FLIGHT.dec()
+            route = scope["path"] if scope["path"] in ROUTE_PATHS else "unmatched"
+            HTTP_REQUEST_SECONDS.observe(time.perf_counter() - started, route)
+            HTTP_REQUESTS.inc(route, str(status_code))
+
+
+def error_response(error: str, status_code: int = 400) -> JSONResponse:
+    """Build an error response in the app.py format."""
+    return TimedJSONResponse({"status": "error", "error": error}, status_code=status_code)
+
+
+def result_response(result: dict) -> JSONResponse:
+    """Return a pipeline result with the app.py status codes."""
+    return TimedJSONResponse(result, status_code=400 if result["status"] == "error" else 200)
+
+
+def _mimetype(request: Request) -> str:
+    return request.headers.get('content-type', '').split(';')[0].strip().lower()
+
+
+async def read_json(request: Request):
+    """Parse a JSON body, returning None if it is missing or invalid (like get_json(silent=True))."""
+    try:
+        # Only the parse is timed; awaiting the body yields to other requests
+        body = await request.body()
+        with timed("parse"):
+            return json.loads(body)
+    except Exception:
+        return None
+
+
+async def read_binary_frame(request: Request):
+    """
+    Read an image sent as the raw request body (see app.read_binary_frame).
+    The body is received on the event loop; decoding happens in process_frame.
+
+    Returns:
+        Tuple of (buffer, raw_size, error_message); buffer is None on error
+    """
+    try:
+        length = int(request.headers['content-length'])
+    except (KeyError, ValueError):
+        length = None
+
+    raw_size, error = check_binary_frame(
+        _mimetype(request), length,
+        request.headers.get('x-frame-width'), request.headers.get('x-frame-height')
+    )
+    if error:
+        return None, None, error
+
+    return await request.body(), raw_size, None
+
+
+async def translate(request: Request) -> JSONResponse:
+    """
+    Endpoint for image upload translation (same inputs and output as app.translate):
+    a raw binary body, a multipart file upload or a base64 encoded image.
+    """
+    try:
+        mimetype = _mimetype(request)
+
+        raw_size = None
+        decode_error = "Invalid image file"
+
+        # Priority 1: Raw binary body
+        if mimetype in BINARY_IMAGE_TYPES:
+            buffer, raw_size, error = await read_binary_frame(request)
+            if buffer is None:
+                return error_response(error)
+
+        # Priority 2: Direct file upload
+        elif mimetype == 'multipart/form-data':
+            try:
+                length = int(request.headers['content-length'])
+            except (KeyError, ValueError):
+                return error_response("Content-Length header is required for file uploads")
+
+            if length > MAX_FORM_SIZE:
+                logger.error(f"Upload size ({length} bytes) exceeds limit")
+                return error_response(FILE_TOO_LARGE)
+
+            form = await request.form()
+            file = form.get('image')
+            if file is None or isinstance(file, str):
+                return error_response("No image data provided")
+
+            if file.filename == '':
+                logger.error("No selected file in file upload part")
+                return error_response("No selected file")
+
+            if not allowed_file(file.filename):
+                logger.error(f"File type not allowed: {file.filename}")
+                return error_response(FILE_TYPE_NOT_ALLOWED)
+
+            buffer = await file.read()
+            if len(buffer) > MAX_FILE_SIZE:
+                logger.error(f"File size ({len(buffer)} bytes) exceeds limit")
+                return error_response(FILE_TOO_LARGE)
+
+        # Priority 3: Base64 encoded image in JSON
+        else:
+            data = await read_json(request)
+            if not data or 'image' not in data:
+                logger.error("No image data received")
+                return error_response("No image data provided")
+
+            buffer, error = read_data_uri(data['image'])
+            if buffer is None:
+                return error_response(error)
+            decode_error = "Failed to decode base64 image"
+
+        result = await run_cpu(process_frame, buffer, None, raw_size, decode_error)
+        return result_response(result)
+
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Unhandled error in /api/translate: {error_message}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return error_response(f"Translation failed: {error_message}", 500)
+
+
+async def translate_realtime(request: Request) -> JSONResponse:
+    """
+    Endpoint for real-time webcam translation (same inputs and output as
+    app.translate_realtime, including realtime sessions and "sequence").
+    """
+    data = None
+    raw_size = None
+    decode_error = "Invalid image file"
+
+    try:
+        if _mimetype(request) in BINARY_IMAGE_TYPES:
+            buffer, raw_size, error = await read_binary_frame(request)
+            if buffer is None:
+                return error_response(error)
+        else:
+            data = await read_json(request)
+            if not data or 'image' not in data:
+                logger.error("No image data received in JSON payload")
+                return error_response("No image data provided")
+
+            buffer, error = read_data_uri(data['image'])
+            if buffer is None:
+                return error_response(error)
+            decode_error = "Failed to decode base64 image"
+
+        session = get_request_session(request.headers.get('x-session-id'), data)
+        result = await run_cpu(process_frame, buffer, session, raw_size, decode_error)
+        return result_response(result)
+
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Unhandled error in /api/translate/realtime: {error_message}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return error_response(f"Real-time translation failed: {error_message}", 500)
+
+
+async def model_info(request: Request) -> JSONResponse:
+    """Endpoint to get information about the loaded model."""
+    try:
+        info = await run_cpu(get_model_info)
+        return TimedJSONResponse({"status": "success", "model_info": info})
+    except Exception as e:
+        logger.error(f"Error getting model info: {str(e)}")
+        return error_response(str(e), 500)
+
+
+async def model_reload(request: Request) -> JSONResponse:
+    """Admin endpoint to reload the model of this worker (see app.model_reload)."""
+    if not MODEL_RELOAD_TOKEN:
+        return error_response("Model reload endpoint is disabled (MODEL_RELOAD_TOKEN is not set)", 403)
+    if not reload_token_valid(request.headers.get('x-admin-token')):
+        return error_response("Invalid admin token", 403)
+
+    data = await read_json(request)
+    force = bool(data.get('force')) if isinstance(data, dict) else False
+
+    try:
+        result = await run_cpu(reload_model, force)
+        info = await run_cpu(get_model_info)
+        return TimedJSONResponse({"status": "success", "reloaded": result["reloaded"], "model_info": info})
+    except Exception as e:
+        logger.error(f"Model reload failed: {str(e)}")
+        return error_response(f"Model reload failed, previous model still active: {str(e)}", 500)
+
+
+async def metrics(request: Request) -> Response:
+    """Endpoint exposing this worker's metrics in the Prometheus text format (see app.metrics)."""
+    return Response(render_metrics(), headers={"content-type": CONTENT_TYPE})
+
+
+async def health_check(request: Request) -> JSONResponse:
+    """Health check endpoint; 503 while the worker is draining."""
+    draining = is_draining()
+    return TimedJSONResponse({
+        "status": "draining" if draining else "healthy",
+        "service": "ASL Sign Language Recognition",
+        "version": "2.0 (RandomForest)"
+    }, status_code=503 if draining else 200)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    """Warm up before serving, release per-worker resources on shutdown."""
+    await run_cpu(warm_up)
+    yield
+    await run_cpu(shutdown)
+    _executor.shutdown(wait=True)
+
+
+app = Starlette(
+    routes=[
+        Route('/api/translate', translate, methods=['POST']),
+        Route('/api/translate/realtime', translate_realtime, methods=['POST']),
+        Route('/api/model/info', model_info, methods=['GET']),
+        Route('/api/model/reload', model_reload, methods=['POST']),
+        Route('/api/metrics', metrics, methods=['GET']),
+        Route('/api/health', health_check, methods=['GET'])
+    ],
+    middleware=[
+        Middleware(RequestMetricsMiddleware),
+        Middleware(CORSMiddleware, allow_origins=[os.getenv("CLIENT_URL", "http://localhost:3000")])
+    ],
+    lifespan=lifespan
+)
+
+# Paths used as the route label of request metrics (anything else is "unmatched")
+ROUTE_PATHS = {route.path for route in app.routes}
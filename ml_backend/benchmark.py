@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Stage-level benchmark suite for the ASL sign language recognition backend.
+Times each pipeline stage on its own and process_image end to end on
+synthetic frames, with a small fixture model, and compares the results with
+a saved baseline to catch performance regressions.
+
+Usage (from ml_backend/):
+    python benchmark.py --output bench.json
+    python benchmark.py --baseline bench.json --threshold 0.2
+"""
+
+import os
+import sys
+import json
+import time
+import base64
+import pickle
+import argparse
+import platform
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+# Measure the stages themselves: no result caches, no micro-batching wait,
+# no per-request log I/O (overridable from the environment)
+os.environ.setdefault('FRAME_CACHE', 'false')
+os.environ.setdefault('PREDICTION_CACHE_SIZE', '0')
+os.environ.setdefault('PREDICT_BATCHING', 'false')
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import cv2
+
+# Synthetic frame sizes (width, height)
+RESOLUTIONS = [(320, 240), (640, 480), (1280, 720), (1920, 1080)]
+
+# Batch sizes for the predict stage
+PREDICT_BATCH_SIZES = [1, 32, 1024]
+
+# Sample hand image pasted into the synthetic frames, so MediaPipe runs its
+# full detection + landmark path rather than stopping at "no hand"
+HAND_IMAGE = Path(__file__).resolve().parent.parent / "client" / "src" / "assets" / "ASLsigns" / "4.jpeg"
+
+# Fixture model: same shape of input and output as the real model, but small
+FIXTURE_TREES = 20
+FIXTURE_CLASSES = 28
+FIXTURE_FEATURES = 42
+
+# Default allowed slowdown before a stage counts as a regression (20%), and
+# the minimum absolute slowdown, so sub-millisecond jitter is not a regression
+DEFAULT_THRESHOLD = 0.2
+DEFAULT_MIN_DELTA_MS = 0.1
+
+
+def make_fixture_model(path: str, seed: int = 0):
+    """Train a small RandomForest on synthetic landmarks and pickle it like the real model."""
+    from sklearn.ensemble import RandomForestClassifier
+
+    rng = np.random.default_rng(seed)
+    centers = rng.random((FIXTURE_CLASSES, FIXTURE_FEATURES))
+    labels = np.repeat(np.arange(FIXTURE_CLASSES), 40)
+    samples = centers[labels] + rng.normal(0, 0.05, (len(labels), FIXTURE_FEATURES))
+
+    model = RandomForestClassifier(n_estimators=FIXTURE_TREES, max_depth=12, random_state=seed)
+    model.fit(samples, labels)
+
+    with open(path, 'wb') as f:
+        pickle.dump({'model': model}, f)
+
+
+def make_frame(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """
+    Build a deterministic BGR test frame: a smooth background with sensor-like
+    noise and, if available, the sample hand image in the middle.
+    """
+    rng = np.random.default_rng(seed)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    frame = np.stack([(x + y) / 2, np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width))], axis=2)
+    frame = np.clip(frame + rng.normal(0, 4, frame.shape), 0, 255).astype(np.uint8)
+
+    hand = cv2.imread(str(HAND_IMAGE)) if HAND_IMAGE.exists() else None
+    if hand is not None:
+        side = int(min(width, height) * 0.8)
+        hand = cv2.resize(hand, (side, side), interpolation=cv2.INTER_AREA)
+        top = (height - side) // 2
+        left = (width - side) // 2
+        frame[top:top + side, left:left + side] = hand
+
+    return frame
+
+
+def measure(func, iterations: int, warmup: int, items: int = 1) -> dict:
+    """
+    Time repeated calls of a function.
+
+    Args:
+        func: Callable without arguments
+        iterations: Timed calls
+        warmup: Untimed calls first (lazy initialization, caches)
+        items: Work items per call (batch size), for throughput
+
+    Returns:
+        Dictionary with latency percentiles (ms) and throughput (items/s)
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = np.empty(iterations)
+    for i in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings[i] = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99]) * 1000
+    return {
+        "iterations": iterations,
+        "items_per_call": items,
+        "mean_ms": float(timings.mean() * 1000),
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "throughput_per_s": float(items * iterations / timings.sum())
+    }
+
+
+def run_benchmarks(iterations: int, warmup: int, stage_filter=None) -> dict:
+    """
+    Run every stage benchmark.
+
+    Args:
+        iterations: Timed calls per stage (slow stages use a fifth of it)
+        warmup: Untimed calls per stage
+        stage_filter: Optional substring; only matching stages are run
+
+    Returns:
+        Dictionary from stage name to measure() results
+    """
+    from utils.image_io import decode_data_uri, decode_image_buffer
+    from utils.feature_extraction import extract_hand_landmarks
+    from utils.pipeline import process_image
+    from utils.predict import predict_sign, predict_signs_batch
+    from app import app
+
+    slow_iterations = max(5, iterations // 5)
+    stages = {}
+
+    def bench(name, func, items=1, slow=False):
+        if stage_filter and stage_filter not in name:
+            return
+        stages[name] = result = measure(func, slow_iterations if slow else iterations, warmup, items)
+        print(f"{name:<36} p50 {result['p50_ms']:9.3f}ms  p95 {result['p95_ms']:9.3f}ms  "
+              f"p99 {result['p99_ms']:9.3f}ms  {result['throughput_per_s']:10.1f}/s")
+
+    for width, height in RESOLUTIONS:
+        label = f"{width}x{height}"
+        frame = make_frame(width, height)
+        jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])[1].tobytes()
+        data_uri = "data:image/jpeg;base64," + base64.b64encode(jpeg).decode('ascii')
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        swap = frame.copy()
+
+        bench(f"base64_decode/{label}", lambda: decode_data_uri(data_uri))
+        bench(f"imdecode/{label}", lambda: decode_image_buffer(jpeg))
+        bench(f"imdecode_full/{label}", lambda: decode_image_buffer(jpeg, target_size=0))
+        bench(f"color_convert/{label}", lambda: cv2.cvtColor(swap, cv2.COLOR_BGR2RGB, dst=swap))
+        bench(f"extract_hand_landmarks/{label}", lambda: extract_hand_landmarks(rgb, is_rgb=True), slow=True)
+        bench(f"process_image/{label}", lambda: process_image(frame), slow=True)
+
+    rng = np.random.default_rng(0)
+    for batch_size in PREDICT_BATCH_SIZES:
+        rows = rng.random((batch_size, FIXTURE_FEATURES))
+        if batch_size == 1:
+            bench("predict_sign/1", lambda: predict_sign(rows[0]))
+        else:
+            bench(f"predict_signs_batch/{batch_size}", lambda: predict_signs_batch(rows), items=batch_size)
+
+    client = app.test_client()
+    jpeg = cv2.imencode('.jpg', make_frame(640, 480), [cv2.IMWRITE_JPEG_QUALITY, 85])[1].tobytes()
+    bench("flask_translate/640x480", lambda: client.post(
+        '/api/translate', data=jpeg, headers={'Content-Type': 'image/jpeg'}
+    ), slow=True)
+    bench("flask_health", lambda: client.get('/api/health'))
+
+    return stages
+
+
+def compare(results: dict, baseline: dict, threshold: float, metric: str = "p50_ms",
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> list:
+    """
+    Find stages that got slower than the baseline by more than ``threshold``.
+
+    Args:
+        results: Current run (output of the suite)
+        baseline: Earlier run to compare against
+        threshold: Allowed relative slowdown (0.2 = 20%)
+        metric: Latency field to compare
+        min_delta_ms: Slowdowns smaller than this many milliseconds are ignored
+
+    Returns:
+        List of (stage, baseline value, current value, relative change) for regressions
+    """
+    regressions = []
+    for stage, current in results["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if previous is None or previous[metric] <= 0:
+            continue
+        change = current[metric] / previous[metric] - 1
+        if change > threshold and current[metric] - previous[metric] >= min_delta_ms:
+            regressions.append((stage, previous[metric], current[metric], change))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ASL recognition pipeline stage by stage.")
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    parser.add_argument('--baseline', help="Compare against results saved earlier with --output")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown per stage before failing (default 0.2 = 20%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore slowdowns smaller than this many milliseconds (default 0.1)")
+    parser.add_argument('--metric', default="p50_ms", choices=["p50_ms", "p95_ms", "p99_ms", "mean_ms"],
+                        help="Latency statistic compared with the baseline")
+    parser.add_argument('--iterations', type=int, default=200, help="Timed calls per fast stage")
+    parser.add_argument('--warmup', type=int, default=5, help="Untimed calls per stage")
+    parser.add_argument('--stage', help="Only run stages whose name contains this text")
+    parser.add_argument('--model', help="Model to benchmark instead of the fixture model")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.model:
+            os.environ['MODEL_PATH'] = args.model
+        else:
+            os.environ['MODEL_PATH'] = os.path.join(tmp, "fixture_model.p")
+            make_fixture_model(os.environ['MODEL_PATH'])
+
+        stages = run_benchmarks(args.iterations, args.warmup, args.stage)
+
+    results = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "model": args.model or f"fixture ({FIXTURE_TREES} trees)",
+        "stages": stages
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold, args.metric, args.min_delta_ms)
+    if not regressions:
+        print(f"\n✅ No stage regressed more than {args.threshold:.0%} ({args.metric}) against {args.baseline}")
+        return 0
+
+    print(f"\n❌ {len(regressions)} stage(s) regressed more than {args.threshold:.0%} ({args.metric}):")
+    for stage, previous, current, change in regressions:
+        print(f"   {stage}: {previous:.3f}ms -> {current:.3f}ms ({change:+.0%})")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
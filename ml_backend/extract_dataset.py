@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Dataset landmark extraction for retraining the ASL sign language model.
+Walks a class-per-folder dataset (folder names as in CLASSES), extracts
+hand landmarks on every core with a process pool and writes them to a
+resumable feature store (see utils/feature_store.py). Images whose content
+hash is already in the store are skipped, so re-runs only extract new files.
+
+Usage (from ml_backend/):
+    python extract_dataset.py path/to/asl_alphabet_train --store features/
+    python extract_dataset.py path/to/asl_alphabet_train --store features/ --workers 8
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Extraction workers only need warnings (overridable from the environment)
+os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from utils.predict import CLASSES
+from utils.image_io import DECODE_TARGET_SIZE
+from utils.feature_store import FeatureStore, STATUS_CODES, content_hash
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Image files picked up in the class folders
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.bmp', '.webp'}
+
+# Records per shard; an interrupted run loses at most one shard of work
+DEFAULT_SHARD_SIZE = 2000
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 10
+
+
+def _init_worker():
+    """Create this process's detector (one task runs at a time per process)."""
+    logging.basicConfig(level=os.environ['LOG_LEVEL'])
+
+    from utils.detector_pool import configure_detector_pool
+    configure_detector_pool(max_size=1, min_size=1)
+
+
+def _extract_file(path: str, decode_size: int) -> Tuple[str, Optional[List[float]], Optional[str]]:
+    """
+    Extract landmarks from one image file (runs in a worker process).
+    Decodes like the server does, so training features match serving.
+
+    Returns:
+        Tuple of (status, features, message); status is success, no_hand or error
+    """
+    from utils.image_io import decode_image_buffer
+    from utils.feature_extraction import extract_hand_landmarks
+
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError as e:
+        return "error", None, f"Cannot read file: {e}"
+
+    image = decode_image_buffer(data, rgb=True, target_size=decode_size)
+    if image is None:
+        return "error", None, "Failed to decode image"
+
+    features, error_info = extract_hand_landmarks(image, is_rgb=True)
+    if features is not None:
+        return "success", features, None
+    return error_info.get("status", "error"), None, error_info.get("message")
+
+
+def find_images(root: Path) -> Tuple[List[Tuple[Path, int]], List[str], List[str]]:
+    """
+    List the images of a class-per-folder dataset.
+
+    Args:
+        root: Dataset directory with one folder per class
+
+    Returns:
+        Tuple of (list of (image path, class index), classes without a folder,
+        folders that are not a class)
+    """
+    images = []
+    found = set()
+    unknown = []
+    for folder in sorted(path for path in root.iterdir() if path.is_dir()):
+        if folder.name not in CLASSES:
+            unknown.append(folder.name)
+            continue
+        found.add(folder.name)
+        label = CLASSES.index(folder.name)
+        for path in sorted(folder.rglob('*')):
+            if path.suffix.lower() in IMAGE_EXTENSIONS and path.is_file():
+                images.append((path, label))
+
+    missing = [name for name in CLASSES if name not in found]
+    return images, missing, unknown
+
+
+def print_report(counts: Dict[int, Dict[str, int]], elapsed: float, processed: int):
+    """Print per-class counts and overall extraction throughput."""
+    columns = ("files", "cached", "extracted", "no_hand", "errors")
+    print(f"\n{'class':<8}" + "".join(f"{name:>10}" for name in columns))
+    totals = dict.fromkeys(columns, 0)
+    for label in sorted(counts):
+        row = counts[label]
+        print(f"{CLASSES[label]:<8}" + "".join(f"{row[name]:>10}" for name in columns))
+        for name in columns:
+            totals[name] += row[name]
+    print(f"{'total':<8}" + "".join(f"{totals[name]:>10}" for name in columns))
+
+    rate = processed / elapsed if elapsed > 0 else 0.0
+    print(f"\nProcessed {processed} images in {elapsed:.1f}s ({rate:.1f} images/s)")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Extract hand landmarks from a class-per-folder ASL dataset.")
+    parser.add_argument('dataset', help="Dataset directory with one folder per class (A-Z, Space, nothing)")
+    parser.add_argument('--store', required=True, help="Feature store directory (created or resumed)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help="Extraction processes (default: all cores)")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                        help=f"Records written per shard (default {DEFAULT_SHARD_SIZE})")
+    parser.add_argument('--decode-size', type=int, default=DECODE_TARGET_SIZE,
+                        help="Decode large images at reduced resolution like the server (0 = full resolution)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=os.environ['LOG_LEVEL'], format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    root = Path(args.dataset)
+    if not root.is_dir():
+        print(f"❌ Dataset directory not found: {root}")
+        return 1
+
+    images, missing, unknown = find_images(root)
+    if unknown:
+        print(f"⚠️  Skipping folders that are not classes: {', '.join(unknown)}")
+    if missing:
+        print(f"⚠️  No folder for classes: {', '.join(missing)}")
+    if not images:
+        print("❌ No images found")
+        return 1
+
+    try:
+        store = FeatureStore(args.store, CLASSES)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    by_hash, done = store.load_index()
+
+    counts = {}
+    # Images to extract, grouped by content hash (duplicates are extracted once)
+    tasks: Dict[str, List[Tuple[str, int]]] = {}
+    task_paths: Dict[str, Path] = {}
+
+    for path, label in images:
+        row = counts.setdefault(label, {"files": 0, "cached": 0, "extracted": 0, "no_hand": 0, "errors": 0})
+        row["files"] += 1
+        hash_ = content_hash(path)
+        relative = path.relative_to(root).as_posix()
+
+        if (hash_, label) in done:
+            row["cached"] += 1
+        elif hash_ in by_hash:
+            # Same image already extracted under another class: reuse the features
+            status, features = by_hash[hash_]
+            store.add(hash_, relative, label, status, None if status != STATUS_CODES["success"] else features)
+            done.add((hash_, label))
+            row["cached"] += 1
+        else:
+            tasks.setdefault(hash_, []).append((relative, label))
+            task_paths.setdefault(hash_, path)
+
+    print(f"{len(images)} images in {len(counts)} classes: {len(images) - sum(map(len, tasks.values()))} cached, "
+          f"{len(tasks)} to extract with {args.workers} processes")
+
+    meta = {"dataset": str(root.resolve()), "decode_size": args.decode_size}
+    started = time.perf_counter()
+    processed = 0
+    interrupted = False
+
+    # spawn: MediaPipe does not survive fork() (same as utils/process_pool.py)
+    executor = ProcessPoolExecutor(
+        max_workers=args.workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker
+    )
+    try:
+        queued = iter(tasks.items())
+        in_flight = {}
+        last_progress = started
+
+        while True:
+            # Keep a bounded number of files queued per worker
+            while len(in_flight) < 4 * args.workers:
+                item = next(queued, None)
+                if item is None:
+                    break
+                hash_, entries = item
+                future = executor.submit(_extract_file, str(task_paths[hash_]), args.decode_size)
+                in_flight[future] = (hash_, entries)
+            if not in_flight:
+                break
+
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                hash_, entries = in_flight.pop(future)
+                status, features, message = future.result()
+                processed += 1
+
+                for relative, label in entries:
+                    row = counts[label]
+                    if status == "error":
+                        # Not stored, so the next run retries it
+                        row["errors"] += 1
+                        logger.warning(f"{relative}: {message}")
+                        continue
+                    row["extracted"] += 1
+                    if status == "no_hand":
+                        row["no_hand"] += 1
+                    store.add(hash_, relative, label, STATUS_CODES[status], features)
+
+            if store.pending_count >= args.shard_size:
+                store.flush(meta)
+
+            now = time.perf_counter()
+            if now - last_progress >= PROGRESS_INTERVAL:
+                last_progress = now
+                print(f"  {processed}/{len(tasks)} processed ({processed / (now - started):.1f} images/s)")
+    except KeyboardInterrupt:
+        interrupted = True
+        print("\nInterrupted: saving extracted features (run again to resume)")
+    finally:
+        executor.shutdown(wait=not interrupted, cancel_futures=True)
+        store.flush(meta)
+
+    print_report(counts, time.perf_counter() - started, processed)
+    print(f"Feature store {args.store}: {store.record_count} records")
+    return 130 if interrupted else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
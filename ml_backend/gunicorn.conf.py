@@ -0,0 +1,68 @@
+"""
+Gunicorn configuration for ASL sign language recognition (production serving).
+Landmark extraction is CPU-bound and only scales across processes, so the
+server pre-forks one worker per core; threads per worker overlap request I/O.
+
+Usage (from ml_backend/):
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+import signal
+import multiprocessing
+
+# Server socket
+bind = f"0.0.0.0:{os.getenv('PORT', 5001)}"
+
+# Worker processes (overridable through environment variables)
+# WEB_WORKERS: number of pre-forked worker processes (default: one per core)
+# WEB_THREADS: request threads per worker (gthread worker); every open
+#   /api/translate/stream WebSocket holds a thread, so app.py caps streams per
+#   worker at MAX_STREAMS (default WEB_THREADS // 2)
+# With EXTRACT_PROCESSES > 0 (utils/process_pool.py) a worker offloads
+# extraction to its own processes; use fewer workers and more threads then
+workers = int(os.getenv('WEB_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.getenv('WEB_THREADS', 4))
+worker_class = 'gthread'
+
+# Each worker loads its own model, detectors and batcher thread after the
+# fork; MediaPipe and background threads do not survive fork()
+preload_app = False
+
+# Timeouts
+timeout = int(os.getenv('WEB_TIMEOUT', 60))
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+
+# Recycle workers periodically (0 disables)
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+# Logging
+accesslog = os.getenv('WEB_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('WEB_LOG_LEVEL', 'info')
+
+
+def post_worker_init(worker):
+    """Warm up the worker before it accepts its first connection."""
+    from utils.serving import warm_up, begin_drain
+
+    warm_up()
+
+    # Flag the drain as soon as SIGTERM arrives so health checks fail and
+    # streams close while gunicorn waits for in-flight requests
+    handle_exit = worker.handle_exit
+
+    def drain_and_exit(sig, frame):
+        begin_drain()
+        handle_exit(sig, frame)
+
+    signal.signal(signal.SIGTERM, drain_and_exit)
+
+
+def worker_exit(server, worker):
+    """Release per-worker resources once in-flight requests are done."""
+    from utils.serving import shutdown
+
+    shutdown()
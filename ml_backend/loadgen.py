@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+Realtime load generator for the ASL sign language recognition backend.
+Simulates concurrent webcam sessions that post frames to
+/api/translate/realtime at a fixed frame rate, like the web client, and
+reports end-to-end latency, dropped and late frames, the no_hand ratio and,
+with --ramp, the session count at which the server saturates.
+
+Each session sends its next frame only after the previous response arrived
+(like the client), so frames whose slot passes while a request is still in
+flight are dropped, as a webcam would skip them. Every request carries a
+unique tag in the image metadata, so replaying the sequence never hits the
+server's frame cache (see --reuse-frames).
+
+Usage (from ml_backend/, against a running server):
+    python loadgen.py --sessions 4 --fps 10 --duration 30
+    python loadgen.py --frames recorded/ --ramp 1,2,4,8,16 --output load.json
+"""
+
+import os
+import sys
+import json
+import time
+import zlib
+import base64
+import argparse
+import platform
+import threading
+import struct
+import http.client
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import numpy as np
+
+# Recorded frame files picked up from --frames, and their content types
+FRAME_TYPES = {'.jpg': 'image/jpeg', '.jpeg': 'image/jpeg', '.png': 'image/png'}
+
+# Sample hand image moved across the synthetic frames, so every frame has a
+# hand to detect and the hand moves between frames (no motion gate reuse)
+HAND_IMAGE = Path(__file__).resolve().parent.parent / "client" / "src" / "assets" / "ASLsigns" / "4.jpeg"
+
+# Synthetic sequence length; sessions loop over it. Repeats would be answered
+# from the frame cache (FRAME_CACHE_TTL) if requests were not tagged, see tag_frame()
+SYNTHETIC_FRAMES = 30
+
+# A step counts as saturated when more than this fraction of frames is
+# dropped or fails, or when p95 latency exceeds the frame interval
+DEFAULT_MAX_DROP_RATIO = 0.05
+DEFAULT_MAX_ERROR_RATIO = 0.01
+
+REALTIME_PATH = '/api/translate/realtime'
+
+
+def load_recorded_frames(directory: str) -> list:
+    """
+    Read recorded frames (JPEG/PNG files) from a directory in name order.
+
+    Args:
+        directory: Directory with one image file per frame
+
+    Returns:
+        List of (encoded bytes, content type) tuples
+
+    Raises:
+        ValueError: If the directory holds no frame files
+    """
+    frames = []
+    for path in sorted(Path(directory).iterdir()):
+        content_type = FRAME_TYPES.get(path.suffix.lower())
+        if content_type and path.is_file():
+            frames.append((path.read_bytes(), content_type))
+
+    if not frames:
+        raise ValueError(f"No .jpg/.jpeg/.png frames found in {directory}")
+    return frames
+
+
+def synthesize_frames(width: int, height: int, count: int = SYNTHETIC_FRAMES, quality: int = 80) -> list:
+    """
+    Build a JPEG sequence with the sample hand moving on a noisy background.
+
+    Args:
+        width: Frame width
+        height: Frame height
+        count: Number of frames in the sequence
+        quality: JPEG quality
+
+    Returns:
+        List of (encoded bytes, content type) tuples
+    """
+    import cv2
+
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    background = np.stack([(x + y) / 2, np.broadcast_to(x, (height, width)), np.broadcast_to(y, (height, width))], axis=2)
+
+    hand = cv2.imread(str(HAND_IMAGE)) if HAND_IMAGE.exists() else None
+    side = int(min(width, height) * 0.6)
+    if hand is not None:
+        hand = cv2.resize(hand, (side, side), interpolation=cv2.INTER_AREA)
+
+    frames = []
+    for i in range(count):
+        frame = np.clip(background + rng.normal(0, 4, background.shape), 0, 255).astype(np.uint8)
+        if hand is not None:
+            # Sway left and right over the sequence
+            angle = 2 * np.pi * i / count
+            left = int((width - side) / 2 + np.sin(angle) * (width - side) / 4)
+            top = (height - side) // 2
+            frame[top:top + side, left:left + side] = hand
+        encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])[1].tobytes()
+        frames.append((encoded, 'image/jpeg'))
+
+    return frames
+
+
+def tag_frame(frame: tuple, tag: str) -> tuple:
+    """
+    Make a frame's bytes unique without changing its pixels, by adding a JPEG
+    comment segment or a PNG text chunk. The server's frame cache keys on the
+    exact bytes, so tagged replays are processed like new camera frames.
+
+    Args:
+        frame: (encoded bytes, content type)
+        tag: Text stored in the image metadata
+
+    Returns:
+        (tagged bytes, content type)
+    """
+    data, content_type = frame
+    text = tag.encode('ascii')
+
+    if content_type == 'image/jpeg':
+        # COM segment right after the SOI marker
+        segment = b'\xff\xfe' + struct.pack('>H', len(text) + 2) + text
+        return data[:2] + segment + data[2:], content_type
+
+    # tEXt chunk right after the 8-byte signature and the IHDR chunk
+    ihdr_end = 8 + 12 + struct.unpack('>I', data[8:12])[0]
+    chunk_data = b'Comment\x00' + text
+    chunk = (struct.pack('>I', len(chunk_data)) + b'tEXt' + chunk_data
+             + struct.pack('>I', zlib.crc32(b'tEXt' + chunk_data)))
+    return data[:ihdr_end] + chunk + data[ihdr_end:], content_type
+
+
+def encode_request(frame: tuple, session_id: str, mode: str) -> tuple:
+    """
+    Build the request body and headers for one frame.
+
+    Args:
+        frame: (encoded bytes, content type)
+        session_id: Realtime session id, or empty for sessionless requests
+        mode: "json" (base64 data URI, like the web client) or "binary" (raw body)
+
+    Returns:
+        Tuple of (body bytes, headers dict)
+    """
+    data, content_type = frame
+    headers = {}
+    if session_id:
+        headers['X-Session-Id'] = session_id
+
+    if mode == 'binary':
+        headers['Content-Type'] = content_type
+        return data, headers
+
+    payload = {"image": f"data:{content_type};base64," + base64.b64encode(data).decode('ascii')}
+    if session_id:
+        payload["session_id"] = session_id
+    headers['Content-Type'] = 'application/json'
+    return json.dumps(payload).encode('utf-8'), headers
+
+
+class SessionWorker(threading.Thread):
+    """
+    One simulated webcam: sends frames on a fixed schedule over a keep-alive
+    connection and records what happened to each frame slot.
+    """
+
+    def __init__(self, url: str, session_id: str, frames: list, mode: str, fps: float,
+                 start_at: float, stop_at: float, timeout: float, tag: str = ""):
+        super().__init__(daemon=True)
+        parts = urlsplit(url)
+        self.host = parts.hostname
+        self.port = parts.port
+        self.https = parts.scheme == 'https'
+        self.path = (parts.path.rstrip('/') or '') + REALTIME_PATH
+
+        self.session_id = session_id
+        self.frames = frames
+        self.mode = mode
+        self.tag = tag
+        self.interval = 1.0 / fps
+        self.start_at = start_at
+        self.stop_at = stop_at
+        self.timeout = timeout
+
+        self.latencies = []
+        self.statuses = {}
+        self.sent = 0
+        self.dropped = 0
+        self.late = 0
+        self.errors = 0
+
+    def _connect(self):
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def _post(self, connection, body: bytes, headers: dict) -> tuple:
+        connection.request('POST', self.path, body=body, headers=headers)
+        response = connection.getresponse()
+        payload = response.read()
+        try:
+            status = json.loads(payload).get("status", "unknown")
+        except (ValueError, AttributeError):
+            status = "invalid_response"
+        return response.status, status
+
+    def run(self):
+        connection = self._connect()
+        slot = 0
+
+        while True:
+            due = self.start_at + slot * self.interval
+            if due >= self.stop_at:
+                break
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            frame = self.frames[slot % len(self.frames)]
+            if self.tag:
+                frame = tag_frame(frame, f"{self.tag}-{slot}")
+            body, headers = encode_request(frame, self.session_id, self.mode)
+            start = time.perf_counter()
+            self.sent += 1
+            try:
+                code, status = self._post(connection, body, headers)
+            except (OSError, http.client.HTTPException) as e:
+                code, status = None, f"connection_error: {type(e).__name__}"
+                connection.close()
+                connection = self._connect()
+            latency = time.perf_counter() - start
+
+            self.latencies.append(latency)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            if code != 200:
+                self.errors += 1
+            if latency > self.interval:
+                self.late += 1
+
+            # Slots that passed while this frame was in flight are skipped
+            next_slot = int((time.perf_counter() - self.start_at) / self.interval) + 1
+            next_slot = max(next_slot, slot + 1)
+            stop_slot = int(np.ceil((self.stop_at - self.start_at) / self.interval))
+            self.dropped += max(0, min(next_slot, stop_slot) - slot - 1)
+            slot = next_slot
+
+        connection.close()
+
+
+def run_step(url: str, frames: list, sessions: int, fps: float, duration: float,
+             mode: str, timeout: float, use_sessions: bool = True, reuse_frames: bool = False) -> dict:
+    """
+    Run one load level: ``sessions`` concurrent webcams for ``duration`` seconds.
+
+    Args:
+        url: Server base URL
+        frames: Frame sequence from load_recorded_frames() or synthesize_frames()
+        sessions: Concurrent simulated sessions
+        fps: Frames per second per session
+        duration: Seconds to run
+        mode: Request encoding ("json" or "binary")
+        timeout: Socket timeout per request in seconds
+        use_sessions: Send a session id (tracking, smoothing) with each frame
+        reuse_frames: Send the same bytes on every loop over the sequence,
+                      so repeats can be answered from the frame cache
+
+    Returns:
+        Dictionary with frame counts, latency percentiles (ms) and ratios
+    """
+    run_id = f"{os.getpid()}-{int(time.time())}"
+    start_at = time.perf_counter() + 0.2
+    workers = []
+    for i in range(sessions):
+        session_id = f"load-{run_id}-{sessions}-{i}" if use_sessions else ""
+        # Start the sessions at different points of the sequence and spread
+        # their frame slots over one interval, like independent cameras
+        offset = i * len(frames) // sessions
+        sequence = frames[offset:] + frames[:offset]
+        tag = "" if reuse_frames else f"load-{run_id}-{sessions}-{i}"
+        stagger = (i / sessions) / fps
+        workers.append(SessionWorker(url, session_id, sequence, mode, fps,
+                                     start_at + stagger, start_at + duration, timeout, tag=tag))
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start_at
+
+    latencies = np.array([latency for worker in workers for latency in worker.latencies])
+    statuses = {}
+    for worker in workers:
+        for status, count in worker.statuses.items():
+            statuses[status] = statuses.get(status, 0) + count
+
+    sent = sum(worker.sent for worker in workers)
+    dropped = sum(worker.dropped for worker in workers)
+    late = sum(worker.late for worker in workers)
+    errors = sum(worker.errors for worker in workers)
+    slots = sent + dropped
+    completed = sent - errors
+
+    if len(latencies):
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+        max_ms = float(latencies.max() * 1000)
+    else:
+        p50 = p95 = p99 = max_ms = 0.0
+
+    return {
+        "sessions": sessions,
+        "fps": fps,
+        "duration_s": round(elapsed, 3),
+        "frame_slots": slots,
+        "sent": sent,
+        "completed": completed,
+        "dropped": dropped,
+        "late": late,
+        "errors": errors,
+        "statuses": statuses,
+        "drop_ratio": dropped / slots if slots else 0.0,
+        "late_ratio": late / sent if sent else 0.0,
+        "error_ratio": errors / sent if sent else 0.0,
+        "no_hand_ratio": statuses.get("no_hand", 0) / completed if completed else 0.0,
+        "throughput_per_s": completed / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "max_ms": max_ms
+    }
+
+
+def is_saturated(step: dict, max_drop_ratio: float, max_error_ratio: float) -> bool:
+    """
+    Check whether a load level is beyond what the server keeps up with.
+
+    Args:
+        step: Output of run_step()
+        max_drop_ratio: Allowed fraction of dropped frame slots
+        max_error_ratio: Allowed fraction of failed requests
+
+    Returns:
+        True if frames are dropped, fail, or p95 latency exceeds the frame interval
+    """
+    return (
+        step["drop_ratio"] > max_drop_ratio
+        or step["error_ratio"] > max_error_ratio
+        or step["p95_ms"] > 1000.0 / step["fps"]
+    )
+
+
+def check_server(url: str, timeout: float):
+    """
+    Make sure the server answers /api/health before generating load.
+
+    Raises:
+        RuntimeError: If the server is unreachable or unhealthy
+    """
+    parts = urlsplit(url)
+    connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+    connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+    try:
+        connection.request('GET', (parts.path.rstrip('/') or '') + '/api/health')
+        response = connection.getresponse()
+        response.read()
+    except (OSError, http.client.HTTPException) as e:
+        raise RuntimeError(f"Server at {url} is not reachable: {e}")
+    finally:
+        connection.close()
+
+    if response.status != 200:
+        raise RuntimeError(f"Server at {url} is unhealthy (GET /api/health returned {response.status})")
+
+
+def print_step(step: dict, saturated: bool):
+    flag = "  SATURATED" if saturated else ""
+    print(f"{step['sessions']:>4} sessions @ {step['fps']:g} fps: "
+          f"{step['throughput_per_s']:7.1f} frames/s  "
+          f"p50 {step['p50_ms']:7.1f}ms  p95 {step['p95_ms']:7.1f}ms  p99 {step['p99_ms']:7.1f}ms  "
+          f"dropped {step['drop_ratio']:6.1%}  late {step['late_ratio']:6.1%}  "
+          f"errors {step['error_ratio']:5.1%}  no_hand {step['no_hand_ratio']:6.1%}{flag}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate realtime webcam load against a running ASL backend.")
+    parser.add_argument('--url', default="http://localhost:5001", help="Server base URL (default http://localhost:5001)")
+    parser.add_argument('--sessions', type=int, default=4, help="Concurrent sessions (ignored with --ramp)")
+    parser.add_argument('--ramp', help="Comma-separated session counts to step through, e.g. 1,2,4,8,16")
+    parser.add_argument('--fps', type=float, default=10.0, help="Frames per second per session")
+    parser.add_argument('--duration', type=float, default=20.0, help="Seconds per load level")
+    parser.add_argument('--frames', help="Directory of recorded JPEG/PNG frames (default: synthesized frames)")
+    parser.add_argument('--width', type=int, default=640, help="Synthesized frame width")
+    parser.add_argument('--height', type=int, default=480, help="Synthesized frame height")
+    parser.add_argument('--mode', default="json", choices=["json", "binary"],
+                        help="Send base64 JSON like the web client, or raw image bodies")
+    parser.add_argument('--no-session', action='store_true', help="Send frames without a session id")
+    parser.add_argument('--reuse-frames', action='store_true',
+                        help="Resend identical bytes on every loop over the frames (measures frame cache hits)")
+    parser.add_argument('--timeout', type=float, default=10.0, help="Socket timeout per request in seconds")
+    parser.add_argument('--max-drop-ratio', type=float, default=DEFAULT_MAX_DROP_RATIO,
+                        help="Dropped-frame ratio above which a level counts as saturated (default 0.05)")
+    parser.add_argument('--max-error-ratio', type=float, default=DEFAULT_MAX_ERROR_RATIO,
+                        help="Error ratio above which a level counts as saturated (default 0.01)")
+    parser.add_argument('--keep-going', action='store_true', help="Keep ramping after the first saturated level")
+    parser.add_argument('--output', help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.fps <= 0 or args.duration <= 0:
+        parser.error("--fps and --duration must be positive")
+
+    if args.ramp:
+        try:
+            levels = [int(level) for level in args.ramp.split(',') if level.strip()]
+        except ValueError:
+            parser.error("--ramp must be a comma-separated list of session counts")
+    else:
+        levels = [args.sessions]
+    if not levels or min(levels) <= 0:
+        parser.error("Session counts must be positive")
+
+    try:
+        check_server(args.url, args.timeout)
+        frames = load_recorded_frames(args.frames) if args.frames else synthesize_frames(args.width, args.height)
+    except (RuntimeError, ValueError, OSError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    source = args.frames or f"synthetic {args.width}x{args.height}"
+    print(f"Target {args.url}{REALTIME_PATH}, {len(frames)} frames ({source}), {args.mode} requests\n")
+
+    steps = []
+    saturation = None
+    for sessions in levels:
+        step = run_step(args.url, frames, sessions, args.fps, args.duration, args.mode,
+                        args.timeout, use_sessions=not args.no_session, reuse_frames=args.reuse_frames)
+        saturated = is_saturated(step, args.max_drop_ratio, args.max_error_ratio)
+        step["saturated"] = saturated
+        steps.append(step)
+        print_step(step, saturated)
+
+        if saturated and saturation is None:
+            saturation = sessions
+            if not args.keep_going:
+                break
+
+    healthy = [step["sessions"] for step in steps if not step["saturated"]]
+    capacity = max(healthy) if healthy else 0
+
+    print()
+    if saturation is None:
+        print(f"✅ No saturation up to {levels[-1]} sessions at {args.fps:g} fps")
+    else:
+        print(f"⚠️  Saturated at {saturation} sessions; highest healthy level: {capacity} sessions at {args.fps:g} fps")
+
+    if args.output:
+        results = {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            "url": args.url,
+            "frames": source,
+            "frame_count": len(frames),
+            "mode": args.mode,
+            "reuse_frames": args.reuse_frames,
+            "client_platform": platform.platform(),
+            "saturation_sessions": saturation,
+            "capacity_sessions": capacity,
+            "steps": steps
+        }
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,14 +7,28 @@ Tests model loading, feature extraction, and prediction functionality.
 import os
 import sys
 import logging
+import tempfile
 from dotenv import load_dotenv
 import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.predict import predict_sign, get_model_info, _load_model
+from utils.predict import predict_sign, get_model_info, _load_model, reload_model
+from utils.detector_pool import HandsDetectorPool, DetectorPoolTimeout
 from utils.feature_extraction import extract_hand_landmarks
+from utils.compiled_forest import CompiledForest
+from utils.model_artifact import export_artifact, load_artifact
+from utils.temporal_decoder import TemporalDecoder
+from utils.sessions import SessionManager
+from utils.motion_gate import MotionGate, motion_thumbnail
+from utils.metrics import MetricsRegistry, Counter, HistogramFamily
+from utils.feature_store import FeatureStore, STATUS_SUCCESS, STATUS_NO_HAND, content_hash, load_features
+from utils.frame_cache import FrameCache, frame_key
+from utils.prediction_cache import PredictionCache
+from utils.early_exit import EarlyExitEvaluator
+from utils.batching import MicroBatcher
+from utils.process_pool import ExtractionProcessPool
 
 # Set up logging
 logging.basicConfig(
@@ -173,6 +187,902 @@ def test_feature_extraction_no_image():
         return False
 
 
+def test_compiled_forest_matches_sklearn():
+    """Test 6: Compiled forest reproduces sklearn predict_proba"""
+    print("\n" + "="*60)
+    print("TEST 6: Compiled Forest Equivalence")
+    print("="*60)
+    
+    try:
+        from sklearn.ensemble import RandomForestClassifier
+        
+        # Small synthetic forest with the production feature/class layout
+        rng = np.random.default_rng(0)
+        X = rng.random((600, 42))
+        y = rng.integers(0, 28, 600)
+        forest = RandomForestClassifier(n_estimators=20, random_state=0).fit(X, y)
+        
+        compiled = CompiledForest.from_sklearn(forest)
+        probe = rng.random((300, 42))
+        
+        if not np.array_equal(compiled.predict_proba(probe), forest.predict_proba(probe)):
+            print("❌ FAILED: Compiled probabilities differ from predict_proba")
+            return False
+        
+        if not np.array_equal(compiled.predict_proba(probe[:1]), forest.predict_proba(probe[:1])):
+            print("❌ FAILED: Single-row compiled probabilities differ from predict_proba")
+            return False
+        
+        # Round-trip through the memory-mapped artifact format
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path = os.path.join(tmp_dir, "model.forest")
+            export_artifact(compiled, artifact_path)
+            mapped = load_artifact(artifact_path)
+            if not np.array_equal(mapped.predict_proba(probe), forest.predict_proba(probe)):
+                print("❌ FAILED: Memory-mapped artifact probabilities differ from predict_proba")
+                return False
+            del mapped
+        
+        print("✅ PASSED: Compiled forest and artifact output is identical to predict_proba")
+        print(f"   Trees: {compiled.n_estimators}, depth: {compiled.tree_depth}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_temporal_decoder():
+    """Test 7: Temporal decoder commits stable letters once"""
+    print("\n" + "="*60)
+    print("TEST 7: Temporal Decoder")
+    print("="*60)
+    
+    try:
+        from utils.predict import CLASSES
+        
+        def frame(label, confidence=0.9):
+            probabilities = np.full(len(CLASSES), (1 - confidence) / (len(CLASSES) - 1))
+            probabilities[CLASSES.index(label)] = confidence
+            return probabilities
+        
+        decoder = TemporalDecoder(alpha=0.5, enter=0.6, exit=0.4, min_frames=2)
+        # Held letters commit once; a no-hand frame lets the same letter repeat
+        stream = [frame("H")] * 4 + [frame("I")] * 4 + [None] + [frame("I")] * 3 + [frame("Space")] * 3
+        
+        for probabilities in stream:
+            output = decoder.update(probabilities)
+        
+        if output["committed_text"] != "HII ":
+            print(f"❌ FAILED: Expected committed text 'HII ', got '{output['committed_text']}'")
+            return False
+        
+        print("✅ PASSED: Decoder produced the expected text")
+        print(f"   Committed text: '{output['committed_text']}'")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_frame_cache():
+    """Test 8: Frame cache scoping and LRU eviction"""
+    print("\n" + "="*60)
+    print("TEST 8: Frame Cache")
+    print("="*60)
+    
+    try:
+        cache = FrameCache(max_entries=2, ttl=60)
+        key = frame_key(b"frame-bytes")
+        result = {"status": "success", "predicted_sign": "A", "confidence": 0.9}
+        
+        cache.put("session-1", key, result, None)
+        
+        if cache.get("session-1", key) is None:
+            print("❌ FAILED: Repeated frame was not served from the cache")
+            return False
+        
+        if cache.get("session-2", key) is not None:
+            print("❌ FAILED: Cached result leaked into another session")
+            return False
+        
+        # Two newer frames push the least recently used one out
+        cache.put("session-1", frame_key(b"frame-2"), result, None)
+        cache.put("session-1", frame_key(b"frame-3"), result, None)
+        
+        if cache.get("session-1", key) is not None:
+            print("❌ FAILED: Least recently used frame was not evicted")
+            return False
+        
+        stats = cache.stats()
+        print("✅ PASSED: Cache hits, misses and evictions behave as expected")
+        print(f"   Hits: {stats['hits']}, misses: {stats['misses']}, evictions: {stats['evictions']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_model_reload():
+    """Test 9: Model hot reload validates and swaps versioned models"""
+    print("\n" + "="*60)
+    print("TEST 9: Model Hot Reload")
+    print("="*60)
+    
+    original_path = os.environ.get('MODEL_PATH')
+    
+    try:
+        import pickle
+        from sklearn.ensemble import RandomForestClassifier
+        from utils.predict import CLASSES
+        
+        rng = np.random.default_rng(0)
+        
+        def write_model(path, version, n_features=42):
+            X = rng.random((300, n_features))
+            y = np.arange(300) % 28
+            forest = RandomForestClassifier(n_estimators=5, random_state=0).fit(X, y)
+            # Replace the file with a rename, like a deployment would
+            with open(path + ".tmp", 'wb') as f:
+                pickle.dump({'model': forest, 'version': version}, f)
+            os.replace(path + ".tmp", path)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            model_path = os.path.join(tmp_dir, "model.p")
+            os.environ['MODEL_PATH'] = model_path
+            
+            write_model(model_path, "v1")
+            reload_model(force=True)
+            
+            # A model with the wrong input width is rejected, v1 stays active
+            write_model(model_path, "bad", n_features=10)
+            try:
+                reload_model()
+                print("❌ FAILED: Model with 10 features was accepted")
+                return False
+            except ValueError:
+                pass
+            
+            if get_model_info().get("model_version") != "v1":
+                print("❌ FAILED: Rejected model replaced the active one")
+                return False
+            
+            write_model(model_path, "v2")
+            if not reload_model()["reloaded"] or reload_model()["reloaded"]:
+                print("❌ FAILED: Changed file was not reloaded exactly once")
+                return False
+            
+            info = get_model_info()
+            if info.get("model_version") != "v2" or len(info.get("content_hash") or "") != 64:
+                print("❌ FAILED: Model info does not report the new version and content hash")
+                return False
+            
+            if predict_sign([0.5] * 42)[0] not in CLASSES + ["uncertain"]:
+                print("❌ FAILED: Reloaded model does not predict")
+                return False
+        
+        print("✅ PASSED: Invalid model rejected, new version swapped in once")
+        print(f"   Version: {info['model_version']}, sha256: {info['content_hash'][:12]}, reloads: {info['reloads']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    
+    finally:
+        # Put the configured model back for the other tests
+        if original_path is None:
+            os.environ.pop('MODEL_PATH', None)
+        else:
+            os.environ['MODEL_PATH'] = original_path
+        # Without a configured model file the last test model stays active
+        if original_path and os.path.exists(original_path):
+            reload_model(force=True)
+
+
+def test_early_exit_evaluation():
+    """Test 10: Early-exit forest evaluation keeps the full forest's decisions"""
+    print("\n" + "="*60)
+    print("TEST 10: Early-Exit Forest Evaluation")
+    print("="*60)
+    
+    try:
+        from sklearn.ensemble import RandomForestClassifier
+        from utils.predict import CONFIDENCE_THRESHOLD, _label_for
+        
+        # Clustered synthetic landmarks: most rows are easy, some lie between classes
+        rng = np.random.default_rng(0)
+        centers = rng.random((28, 42))
+        y = np.repeat(np.arange(28), 30)
+        X = centers[y] + rng.normal(0, 0.08, (len(y), 42))
+        forest = RandomForestClassifier(n_estimators=60, random_state=0).fit(X, y)
+        
+        weights = rng.random((200, 1))
+        probe = np.vstack([
+            centers[rng.integers(0, 28, 200)] + rng.normal(0, 0.08, (200, 42)),
+            centers[rng.integers(0, 28, 200)] * weights + centers[rng.integers(0, 28, 200)] * (1 - weights)
+        ])
+        
+        for name, model in (("sklearn", forest), ("compiled", CompiledForest.from_sklearn(forest))):
+            evaluator = EarlyExitEvaluator(CONFIDENCE_THRESHOLD, chunk_size=4, early_exit=True)
+            probabilities, trees = evaluator.predict_proba(model, probe)
+            full = model.predict_proba(probe)
+            
+            changed = sum(_label_for(probabilities[i])[0] != _label_for(full[i])[0] for i in range(len(probe)))
+            if changed:
+                print(f"❌ FAILED: {changed} {name} predictions differ from the full forest")
+                return False
+            
+            if trees.mean() >= 60:
+                print(f"❌ FAILED: {name} evaluation never exited early")
+                return False
+            
+            print(f"   {name}: {trees.mean():.1f} of 60 trees per row on average")
+        
+        print("✅ PASSED: Early exit returns the same signs with fewer trees")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_micro_batcher():
+    """Test 11: Micro-batcher routes results back to their callers"""
+    print("\n" + "="*60)
+    print("TEST 11: Prediction Micro-Batcher")
+    print("="*60)
+    
+    try:
+        import time
+        import threading
+        
+        batch_sizes = []
+        
+        def predict_fn(rows):
+            batch_sizes.append(len(rows))
+            time.sleep(0.002)
+            return rows * 2
+        
+        batcher = MicroBatcher(predict_fn, max_batch_size=8, max_wait_ms=200)
+        
+        # A lone row must not wait for max_wait_ms
+        start = time.perf_counter()
+        batcher.predict(np.ones(42))
+        if time.perf_counter() - start > 0.1:
+            print("❌ FAILED: Single row waited for the batch window")
+            return False
+        
+        results = {}
+        
+        def caller(i):
+            results[i] = batcher.predict(np.full(42, float(i)))
+        
+        threads = [threading.Thread(target=caller, args=(i,)) for i in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        if any(not np.array_equal(results[i], np.full(42, 2.0 * i)) for i in range(20)):
+            print("❌ FAILED: A caller received another row's result")
+            return False
+        
+        if max(batch_sizes) > 8:
+            print("❌ FAILED: Batch exceeded max_batch_size")
+            return False
+        
+        batcher.shutdown()
+        try:
+            batcher.submit(np.ones(42))
+            print("❌ FAILED: Row accepted after shutdown")
+            return False
+        except RuntimeError:
+            pass
+        
+        print("✅ PASSED: Rows batched, routed to their callers and rejected after shutdown")
+        print(f"   Batches: {len(batch_sizes)}, largest: {max(batch_sizes)} rows")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_process_pool_recovery():
+    """Test 12: Extraction process pool survives a dead process"""
+    print("\n" + "="*60)
+    print("TEST 12: Extraction Process Pool Recovery")
+    print("="*60)
+    
+    pool = None
+    try:
+        import signal
+        
+        pool = ExtractionProcessPool(processes=1, max_pending=2, task_timeout=60,
+                                     slot_size=256 * 256 * 3)
+        pool.warm_up()
+        frame = np.zeros((256, 256, 3), dtype=np.uint8)
+        
+        # Kill the extraction process as an OOM kill would
+        for process in list(pool._executor._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+        
+        features, error_info = pool.extract(frame)
+        if features is not None or error_info.get("status") != "error":
+            print(f"❌ FAILED: Expected an error for the lost frame, got {error_info}")
+            return False
+        
+        stats = pool.stats()
+        if stats["crashes"] != 1 or stats["restarts"] != 1:
+            print(f"❌ FAILED: Crash not counted: {stats}")
+            return False
+        
+        # The restarted processes reuse the same slots
+        features, error_info = pool.extract(frame)
+        if error_info is None or error_info.get("status") != "no_hand":
+            print(f"❌ FAILED: Pool did not recover, got {error_info}")
+            return False
+        
+        if pool.stats()["pending"] != 0:
+            print("❌ FAILED: Shared memory slot leaked")
+            return False
+        
+        print("✅ PASSED: Lost frame reported, pool restarted and extracting again")
+        print(f"   Stats: {pool.stats()}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def test_prediction_cache():
+    """Test 13: Prediction cache hits, LRU eviction and model-change invalidation"""
+    print("\n" + "="*60)
+    print("TEST 13: Prediction Cache")
+    print("="*60)
+    
+    try:
+        class Model:
+            pass
+        
+        model = Model()
+        cache = PredictionCache(max_entries=2, grid=0.01)
+        a = np.full(42, 0.5)
+        b = np.full(42, 0.25)
+        c = np.full(42, 0.75)
+        
+        if cache.get(model, cache.key(a)) is not None:
+            print("❌ FAILED: Hit on an empty cache")
+            return False
+        
+        cache.put(model, cache.key(a), np.array([0.9, 0.1]))
+        # A vector in the same grid cell shares the prediction
+        hit = cache.get(model, cache.key(a + 0.001))
+        if hit is None or not np.allclose(hit, [0.9, 0.1]):
+            print("❌ FAILED: Nearby vector missed the cached prediction")
+            return False
+        if cache.get(model, cache.key(a + 0.02)) is not None:
+            print("❌ FAILED: Vector in another grid cell hit the cache")
+            return False
+        
+        # a was used last, so adding c evicts b
+        cache.put(model, cache.key(b), np.array([0.2, 0.8]))
+        cache.get(model, cache.key(a))
+        cache.put(model, cache.key(c), np.array([0.5, 0.5]))
+        if cache.get(model, cache.key(b)) is not None or cache.get(model, cache.key(a)) is None:
+            print("❌ FAILED: Least recently used entry was not the one evicted")
+            return False
+        
+        # Another model must not see the previous model's predictions
+        if cache.get(Model(), cache.key(a)) is not None:
+            print("❌ FAILED: Prediction served to a different model")
+            return False
+        
+        stats = cache.stats()
+        if stats["evictions"] != 1 or stats["invalidations"] != 1 or stats["entries"] != 0:
+            print(f"❌ FAILED: Unexpected cache statistics: {stats}")
+            return False
+        
+        print("✅ PASSED: Grid-cell hits, LRU eviction and invalidation on model change")
+        print(f"   Stats: {stats}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_websocket_stream():
+    """Test 14: WebSocket stream answers a frame and enforces MAX_STREAMS"""
+    print("\n" + "="*60)
+    print("TEST 14: WebSocket Stream")
+    print("="*60)
+    
+    server = None
+    try:
+        import json
+        import threading
+        from pathlib import Path
+        from werkzeug.serving import make_server
+        import app as app_module
+        
+        if app_module.sock is None:
+            print("⚠️  SKIPPED: flask-sock is not installed")
+            return True
+        
+        from simple_websocket import Client, ConnectionClosed
+        
+        server = make_server('127.0.0.1', 0, app_module.app, threaded=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"ws://127.0.0.1:{server.server_port}/api/translate/stream"
+        
+        hand_image = Path(__file__).resolve().parent.parent / "client" / "src" / "assets" / "ASLsigns" / "4.jpeg"
+        ws = Client.connect(url)
+        try:
+            ws.send(hand_image.read_bytes())
+            result = json.loads(ws.receive(timeout=30))
+            
+            if result.get("status") not in ("success", "no_hand") or result.get("frame") != 1:
+                print(f"❌ FAILED: Unexpected stream result: {result}")
+                return False
+            if "predicted_sign" not in result or "confidence" not in result:
+                print("❌ FAILED: Stream result lacks the prediction fields")
+                return False
+            
+            # With the cap reached, the next stream is closed with 1013
+            max_streams = app_module.MAX_STREAMS
+            app_module.MAX_STREAMS = 1
+            try:
+                rejected = Client.connect(url)
+                try:
+                    rejected.receive(timeout=5)
+                except ConnectionClosed:
+                    pass
+                if rejected.close_reason != 1013:
+                    print(f"❌ FAILED: Stream over the cap not rejected (close code {rejected.close_reason})")
+                    return False
+            finally:
+                app_module.MAX_STREAMS = max_streams
+        finally:
+            ws.close()
+        
+        print("✅ PASSED: Frame answered over the stream, stream over the cap rejected")
+        print(f"   Result: {result.get('status')}, sign {result.get('predicted_sign')}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+def test_detector_pool():
+    """Test 15: Detector pool times out when exhausted and evicts idle detectors"""
+    print("\n" + "="*60)
+    print("TEST 15: Hands Detector Pool")
+    print("="*60)
+    
+    pool = None
+    try:
+        import time
+        
+        pool = HandsDetectorPool(max_size=2, min_size=0, idle_timeout=0.05, acquire_timeout=0.1)
+        
+        with pool.acquire() as first, pool.acquire() as second:
+            if first is second:
+                print("❌ FAILED: Two callers got the same detector")
+                return False
+            
+            # Both detectors are checked out, so a third caller times out
+            try:
+                with pool.acquire():
+                    pass
+                print("❌ FAILED: Acquired a detector beyond max_size")
+                return False
+            except DetectorPoolTimeout:
+                pass
+        
+        # Both return to the pool; after the idle timeout the next checkout
+        # takes one and closes the other (min_size is 0)
+        time.sleep(0.1)
+        with pool.acquire():
+            stats = pool.stats()
+        
+        if stats["timeouts"] != 1 or stats["evictions"] != 1 or stats["created"] != 1:
+            print(f"❌ FAILED: Unexpected pool statistics: {stats}")
+            return False
+        
+        pool.shutdown()
+        try:
+            with pool.acquire():
+                pass
+            print("❌ FAILED: Acquired a detector after shutdown")
+            return False
+        except RuntimeError:
+            pass
+        
+        print("✅ PASSED: Exhausted pool timed out, idle detector evicted")
+        print(f"   Stats: timeouts {stats['timeouts']}, evictions {stats['evictions']}, created {stats['created']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+
+def test_realtime_sessions():
+    """Test 16: Realtime sessions track the hand and are capped and expired"""
+    print("\n" + "="*60)
+    print("TEST 16: Realtime Sessions")
+    print("="*60)
+    
+    manager = None
+    try:
+        import time
+        import cv2
+        from pathlib import Path
+        
+        manager = SessionManager(ttl=0.2, max_sessions=2)
+        first = manager.get("a")
+        if manager.get("a") is not first:
+            print("❌ FAILED: Same session id returned a different session")
+            return False
+        
+        manager.get("b")
+        if manager.get("c") is not None:
+            print("❌ FAILED: Session created beyond max_sessions")
+            return False
+        
+        # Consecutive frames of a session go through its tracker
+        hand_image = Path(__file__).resolve().parent.parent / "client" / "src" / "assets" / "ASLsigns" / "4.jpeg"
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[100:300, 50:250] = cv2.resize(cv2.imread(str(hand_image)), (200, 200))
+        detected = [extract_hand_landmarks(frame, session=first)[0] is not None for _ in range(3)]
+        if not all(detected) or first.tracked_frames != 3 or first.fallback_frames != 0:
+            print(f"❌ FAILED: Frames not tracked (detected {detected}, tracked {first.tracked_frames})")
+            return False
+        
+        # Idle sessions expire and free their slot
+        time.sleep(0.3)
+        if manager.get("c") is None or not first.closed:
+            print("❌ FAILED: Idle sessions did not expire")
+            return False
+        
+        stats = manager.stats()
+        if stats["rejected"] != 1 or stats["expired"] != 2 or stats["active"] != 1:
+            print(f"❌ FAILED: Unexpected session statistics: {stats}")
+            return False
+        
+        print("✅ PASSED: Frames tracked per session, cap enforced, idle sessions expired")
+        print(f"   Stats: created {stats['created']}, rejected {stats['rejected']}, expired {stats['expired']}")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if manager is not None:
+            manager.shutdown()
+
+
+def test_batch_endpoint():
+    """Test 17: Batch endpoint keeps request order and reports per-item errors"""
+    print("\n" + "="*60)
+    print("TEST 17: Batch Translation Endpoint")
+    print("="*60)
+    
+    try:
+        import base64
+        import cv2
+        from pathlib import Path
+        import app as app_module
+        
+        client = app_module.app.test_client()
+        
+        hand_image = Path(__file__).resolve().parent.parent / "client" / "src" / "assets" / "ASLsigns" / "4.jpeg"
+        hand_uri = "data:image/jpeg;base64," + base64.b64encode(hand_image.read_bytes()).decode('ascii')
+        blank = cv2.imencode('.jpg', np.zeros((240, 320, 3), dtype=np.uint8))[1].tobytes()
+        blank_uri = "data:image/jpeg;base64," + base64.b64encode(blank).decode('ascii')
+        
+        response = client.post('/api/translate/batch', json={"images": [hand_uri, "not an image", blank_uri]})
+        results = response.get_json()["results"]
+        statuses = [result["status"] for result in results]
+        if response.status_code != 200 or statuses != ["success", "error", "no_hand"]:
+            print(f"❌ FAILED: Unexpected image batch results: {response.status_code} {statuses}")
+            return False
+        if any("predicted_sign" not in result or "confidence" not in result for result in results):
+            print("❌ FAILED: Batch result lacks the prediction fields")
+            return False
+        
+        # Feature rows: a bad row fails alone, the others match single predictions
+        rows = [[0.5] * 42, [0.1, 0.2], [0.25] * 42]
+        response = client.post('/api/translate/batch', json={"features": rows})
+        results = response.get_json()["results"]
+        if [result["status"] for result in results] != ["success", "error", "success"]:
+            print(f"❌ FAILED: Unexpected feature batch results: {results}")
+            return False
+        
+        for row, result in ((rows[0], results[0]), (rows[2], results[2])):
+            sign, confidence = predict_sign(row)
+            if result["predicted_sign"] != sign or abs(result["confidence"] - confidence) > 1e-6:
+                print("❌ FAILED: Batch prediction differs from the single-row prediction")
+                return False
+        
+        response = client.post('/api/translate/batch', json={"images": []})
+        if response.status_code != 400:
+            print("❌ FAILED: Empty batch accepted")
+            return False
+        
+        print("✅ PASSED: Results in request order, bad items fail individually")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_landmarks_endpoint():
+    """Test 18: Landmark-only endpoint validates and classifies feature vectors"""
+    print("\n" + "="*60)
+    print("TEST 18: Landmark Translation Endpoint")
+    print("="*60)
+    
+    try:
+        import app as app_module
+        
+        client = app_module.app.test_client()
+        row = [0.5] * 42
+        
+        response = client.post('/api/translate/landmarks', json={"features": row})
+        result = response.get_json()
+        sign, confidence = predict_sign(row)
+        matches = result.get("predicted_sign") == sign and abs(result.get("confidence", -1) - confidence) <= 1e-6
+        if response.status_code != 200 or not matches:
+            print(f"❌ FAILED: Single vector result differs from predict_sign: {result}")
+            return False
+        
+        for bad in ([0.5] * 41, ["x"] * 42, [], None):
+            response = client.post('/api/translate/landmarks', json={"features": bad})
+            if response.status_code != 400 or response.get_json()["status"] != "error":
+                print(f"❌ FAILED: Invalid features {str(bad)[:20]} accepted")
+                return False
+        
+        response = client.post('/api/translate/landmarks', json={"features": [row, [0.1] * 42]})
+        result = response.get_json()
+        if response.status_code != 200 or result["count"] != 2:
+            print(f"❌ FAILED: Unexpected batch result: {result}")
+            return False
+        
+        print("✅ PASSED: Single and batched vectors classified, invalid vectors rejected")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_motion_gate():
+    """Test 19: Motion gate reuses results of unchanged frames up to its cap"""
+    print("\n" + "="*60)
+    print("TEST 19: Motion Gate")
+    print("="*60)
+    
+    try:
+        frame = np.random.default_rng(0).integers(0, 256, (240, 320, 3), dtype=np.uint8)
+        thumbnail = motion_thumbnail(frame)
+        result = {"status": "success", "predicted_sign": "A", "confidence": 0.9}
+        
+        gate = MotionGate(threshold=2.0, max_reuse=3)
+        if gate.check(thumbnail) is not None:
+            print("❌ FAILED: Reused a result before any frame was processed")
+            return False
+        
+        gate.update(thumbnail, result, None)
+        reused = [gate.check(thumbnail) for _ in range(4)]
+        if any(r is None or r[0] is not result for r in reused[:3]) or reused[3] is not None:
+            print("❌ FAILED: Unchanged frames not reused exactly max_reuse times")
+            return False
+        
+        # Drift is measured against the processed frame, so small steps add up
+        gate.update(thumbnail, result, None)
+        if gate.check(thumbnail + 1.5) is None or gate.check(thumbnail + 3.0) is not None:
+            print("❌ FAILED: Drift from the processed frame not detected")
+            return False
+        
+        gate.reset()
+        if gate.check(thumbnail) is not None:
+            print("❌ FAILED: Result reused after reset")
+            return False
+        
+        # A result from before a model reload is not reused for the new model
+        gate.update(thumbnail, result, None, generation=1)
+        if gate.check(thumbnail, generation=2) is not None or gate.check(thumbnail, generation=1) is None:
+            print("❌ FAILED: Result reused across a model generation change")
+            return False
+        
+        print("✅ PASSED: Unchanged frames reused up to the cap, motion, drift and reloads detected")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_metrics_rendering():
+    """Test 20: Metrics render in the Prometheus text format"""
+    print("\n" + "="*60)
+    print("TEST 20: Metrics Rendering")
+    print("="*60)
+    
+    try:
+        registry = MetricsRegistry()
+        latency = registry.register(HistogramFamily("test_seconds", "Test latency", labels=("stage",),
+                                                    buckets=(0.1, 1.0)))
+        frames = registry.register(Counter("test_frames_total", "Test frames", labels=("status",)))
+        
+        # A value on a bucket bound is counted in that bucket
+        for value in (0.05, 0.1, 0.5, 2.0):
+            latency.observe(value, "decode")
+        frames.inc('say "hi"')
+        frames.inc('say "hi"', amount=2)
+        
+        lines = set(registry.render().splitlines())
+        expected = {
+            "# TYPE test_seconds histogram",
+            'test_seconds_bucket{stage="decode",le="0.1"} 2',
+            'test_seconds_bucket{stage="decode",le="1.0"} 3',
+            'test_seconds_bucket{stage="decode",le="+Inf"} 4',
+            'test_seconds_sum{stage="decode"} 2.65',
+            'test_seconds_count{stage="decode"} 4',
+            "# TYPE test_frames_total counter",
+            'test_frames_total{status="say \\"hi\\""} 3',
+        }
+        missing = expected - lines
+        if missing:
+            print(f"❌ FAILED: Missing exposition lines: {sorted(missing)}")
+            return False
+        
+        try:
+            registry.register(Counter("test_frames_total", "Duplicate"))
+            print("❌ FAILED: Duplicate metric name accepted")
+            return False
+        except ValueError:
+            pass
+        
+        try:
+            frames.inc("a", "b")
+            print("❌ FAILED: Wrong label count accepted")
+            return False
+        except ValueError:
+            pass
+        
+        print("✅ PASSED: Cumulative buckets, sums, counters and label escaping rendered")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_feature_store_resume():
+    """Test 21: Feature store survives a reopen and resumes by content hash"""
+    print("\n" + "="*60)
+    print("TEST 21: Feature Store Resume")
+    print("="*60)
+    
+    try:
+        classes = ["A", "B", "C"]
+        hand = [0.5] * 42
+        
+        with tempfile.TemporaryDirectory() as store_dir:
+            image_path = os.path.join(store_dir, "image.jpg")
+            with open(image_path, 'wb') as f:
+                f.write(b"image bytes")
+            image_hash = content_hash(image_path)
+            
+            store = FeatureStore(store_dir, classes)
+            store.add(image_hash, "A/image.jpg", 0, STATUS_SUCCESS, hand)
+            store.add("0" * 32, "B/empty.jpg", 1, STATUS_NO_HAND, None)
+            store.flush({"dataset": "test"})
+            # Pending records are not written by an interrupted run
+            store.add("1" * 32, "C/lost.jpg", 2, STATUS_SUCCESS, hand)
+            
+            # A new run sees what was written and skips it
+            store = FeatureStore(store_dir, classes)
+            by_hash, done = store.load_index()
+            if done != {(image_hash, 0), ("0" * 32, 1)} or store.record_count != 2:
+                print(f"❌ FAILED: Unexpected index after reopen: {done}")
+                return False
+            if by_hash[image_hash][0] != STATUS_SUCCESS or not np.allclose(by_hash[image_hash][1], hand):
+                print("❌ FAILED: Stored features differ from the extracted ones")
+                return False
+            
+            # Same image under another class reuses the features; a second shard is added
+            store.add(image_hash, "C/copy.jpg", 2, STATUS_SUCCESS, by_hash[image_hash][1])
+            store.add(image_hash, "A/again.jpg", 0, STATUS_SUCCESS, hand)
+            store.flush()
+            
+            X, y, loaded_classes = load_features(store_dir)
+            if X.shape != (2, 42) or sorted(y.tolist()) != [0, 2] or loaded_classes != classes:
+                print(f"❌ FAILED: Training set has shape {X.shape} and labels {y.tolist()}")
+                return False
+            
+            try:
+                FeatureStore(store_dir, ["A", "B"])
+                print("❌ FAILED: Store reopened with different classes")
+                return False
+            except ValueError:
+                pass
+        
+        print("✅ PASSED: Written shards reloaded, duplicates and no_hand records left out of training")
+        
+        return True
+        
+    except Exception as e:
+        print(f"❌ FAILED: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def run_all_tests():
     """Run all tests and report results"""
     print("\n" + "="*60)
@@ -185,6 +1095,22 @@ def run_all_tests():
         ("Dummy Feature Prediction", test_prediction_with_dummy_features),
         ("Invalid Feature Handling", test_prediction_with_invalid_features),
         ("Feature Extraction Error Handling", test_feature_extraction_no_image),
+        ("Compiled Forest Equivalence", test_compiled_forest_matches_sklearn),
+        ("Temporal Decoder", test_temporal_decoder),
+        ("Frame Cache", test_frame_cache),
+        ("Model Hot Reload", test_model_reload),
+        ("Early-Exit Forest Evaluation", test_early_exit_evaluation),
+        ("Prediction Micro-Batcher", test_micro_batcher),
+        ("Extraction Process Pool Recovery", test_process_pool_recovery),
+        ("Prediction Cache", test_prediction_cache),
+        ("WebSocket Stream", test_websocket_stream),
+        ("Hands Detector Pool", test_detector_pool),
+        ("Realtime Sessions", test_realtime_sessions),
+        ("Batch Translation Endpoint", test_batch_endpoint),
+        ("Landmark Translation Endpoint", test_landmarks_endpoint),
+        ("Motion Gate", test_motion_gate),
+        ("Metrics Rendering", test_metrics_rendering),
+        ("Feature Store Resume", test_feature_store_resume),
     ]
     
     results = []
@@ -0,0 +1,217 @@
+"""
+Micro-batching module for ASL sign language recognition.
+Collects single-row predictions from concurrent requests and runs them as one
+batched predict_proba call, then routes each row's result back to its caller.
+"""
+
+import os
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable
+
+import numpy as np
+
+from utils.metrics import REGISTRY, Histogram, HistogramFamily, LATENCY_BUCKETS_MS
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Batching configuration (overridable through environment variables)
+BATCHING_ENABLED = os.getenv('PREDICT_BATCHING', 'true').lower() in ('1', 'true', 'yes')
+MAX_BATCH_ROWS = int(os.getenv('PREDICT_BATCH_MAX_ROWS', 32))
+MAX_WAIT_MS = float(os.getenv('PREDICT_BATCH_MAX_WAIT_MS', 5))
+# PREDICT_BATCH_TIMEOUT: seconds a caller waits for its row before giving up
+RESULT_TIMEOUT = float(os.getenv('PREDICT_BATCH_TIMEOUT', 5))
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+# Exported at /api/metrics (the per-batcher Histograms below feed /api/stats)
+BATCH_ROWS = REGISTRY.register(HistogramFamily(
+    "asl_predict_batch_rows",
+    "Rows per batched predict_proba call of the micro-batcher",
+    buckets=BATCH_SIZE_BUCKETS
+))
+BATCH_QUEUE_SECONDS = REGISTRY.register(HistogramFamily(
+    "asl_predict_batch_queue_seconds",
+    "Time a row waited in the micro-batcher before its batch ran"
+))
+
+
+class _Request:
+    """One pending row and the future its caller waits on."""
+
+    __slots__ = ("row", "future", "enqueued_at")
+
+    def __init__(self, row: np.ndarray):
+        self.row = row
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class MicroBatcher:
+    """
+    Dynamic micro-batching scheduler.
+
+    A background thread takes the first waiting row, keeps collecting rows
+    until the batch holds ``max_batch_size`` rows or ``max_wait_ms`` has passed
+    since the first row arrived, and then calls ``predict_fn`` once on the
+    stacked (N, n_features) matrix. A row that is alone (nothing queued and
+    no other caller waiting) runs right away instead of waiting.
+    """
+
+    def __init__(self, predict_fn: Callable[[np.ndarray], np.ndarray],
+                 max_batch_size: int = MAX_BATCH_ROWS, max_wait_ms: float = MAX_WAIT_MS):
+        if max_batch_size < 1:
+            raise ValueError(f"Batch size must be at least 1, got {max_batch_size}")
+
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        # Metrics
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_delay_ms = Histogram(LATENCY_BUCKETS_MS)
+
+        self._queue = queue.Queue()
+        self._stopped = False
+        # Rows submitted and not resolved yet; guards submit against shutdown
+        self._outstanding = 0
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="predict-batcher", daemon=True)
+        self._thread.start()
+
+        logger.info(f"Prediction micro-batcher started (max {max_batch_size} rows, {max_wait_ms}ms max wait)")
+
+    def submit(self, row: np.ndarray) -> Future:
+        """
+        Queue one feature row for prediction.
+
+        Args:
+            row: Feature vector of shape (n_features,)
+
+        Returns:
+            Future resolving to the row's probability vector
+        """
+        request = _Request(row)
+        request.future.add_done_callback(self._resolved)
+
+        # Checked and queued under the lock, so no row lands after the shutdown sentinel
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Prediction batcher is shut down")
+            self._outstanding += 1
+            self._queue.put(request)
+        return request.future
+
+    def _resolved(self, future: Future):
+        with self._lock:
+            self._outstanding -= 1
+
+    def predict(self, row: np.ndarray, timeout: float = RESULT_TIMEOUT) -> np.ndarray:
+        """
+        Queue one feature row and wait for its probability vector.
+
+        Raises:
+            TimeoutError: If the row was not predicted within ``timeout`` seconds
+        """
+        future = self.submit(row)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeoutError(f"Batched prediction did not finish within {timeout:g}s")
+
+    def _collect(self, first: _Request) -> list:
+        batch = [first]
+        deadline = first.enqueued_at + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            # Nobody else is waiting for a prediction: do not hold the row back
+            if self._queue.empty():
+                with self._lock:
+                    alone = self._outstanding <= len(batch)
+                if alone:
+                    break
+
+            remaining = deadline - time.monotonic()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                # Shutdown sentinel: put it back so the main loop sees it
+                self._queue.put(None)
+                break
+            batch.append(request)
+
+        return batch
+
+    def _fail_queued(self):
+        """Fail rows still queued after the shutdown sentinel."""
+        while True:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            if request is not None and request.future.set_running_or_notify_cancel():
+                request.future.set_exception(RuntimeError("Prediction batcher is shut down"))
+
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                self._fail_queued()
+                break
+
+            batch = [
+                request for request in self._collect(first)
+                if request.future.set_running_or_notify_cancel()  # skip rows whose caller gave up
+            ]
+            if not batch:
+                continue
+            started = time.monotonic()
+
+            for request in batch:
+                delay = started - request.enqueued_at
+                self.queue_delay_ms.observe(delay * 1000)
+                BATCH_QUEUE_SECONDS.observe(delay)
+            self.batch_sizes.observe(len(batch))
+            BATCH_ROWS.observe(len(batch))
+
+            try:
+                probabilities = self.predict_fn(np.vstack([request.row for request in batch]))
+            except Exception as e:
+                logger.error(f"Batched prediction failed for {len(batch)} rows: {str(e)}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            for request, row_probabilities in zip(batch, probabilities):
+                request.future.set_result(row_probabilities)
+
+    def stats(self) -> dict:
+        """
+        Get batcher metrics (batch-size and queue-delay histograms).
+
+        Returns:
+            Dictionary with batcher metrics
+        """
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": self._queue.qsize(),
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_delay_ms": self.queue_delay_ms.snapshot()
+        }
+
+    def shutdown(self, timeout: float = 5.0):
+        """Stop accepting rows, finish queued ones and stop the worker thread."""
+        with self._lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            self._queue.put(None)
+        self._thread.join(timeout)
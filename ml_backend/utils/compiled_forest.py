@@ -0,0 +1,224 @@
+"""
+Compiled forest module for ASL sign language recognition.
+Flattens a fitted sklearn RandomForestClassifier into contiguous NumPy arrays
+and predicts with a vectorized traversal of all trees at once.
+"""
+
+import logging
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# sklearn marks leaves with this child index
+TREE_LEAF = -1
+
+# Rows per traversal chunk, bounds the (rows, trees, classes) temporary
+PREDICT_CHUNK_ROWS = 256
+
+
+class CompiledForest:
+    """
+    Array-backed tree ensemble with the same predict_proba output as the
+    sklearn forest it was built from.
+
+    All trees share one node table. Leaves point to themselves, so every
+    tree can be advanced the same number of steps without branching.
+    Children are stored interleaved as [right, left] pairs, so the next node
+    is ``children[2 * node + go_left]``. The arrays are only read, so they
+    can be views into a read-only memory map (see utils/model_artifact.py).
+    """
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, children: np.ndarray,
+                 leaf_value: np.ndarray, roots: np.ndarray, classes: np.ndarray,
+                 n_features: int, tree_depth: int, max_depth=None):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.leaf_value = leaf_value
+        self.roots = roots
+        self.classes_ = classes
+        self.n_classes_ = len(classes)
+        self.n_features_in_ = n_features
+        self.n_estimators = len(roots)
+        self.tree_depth = tree_depth
+        self.max_depth = max_depth
+
+    @classmethod
+    def from_sklearn(cls, model) -> "CompiledForest":
+        """
+        Build a compiled forest from a fitted RandomForestClassifier.
+
+        Args:
+            model: Fitted sklearn forest classifier with ``estimators_``
+
+        Returns:
+            CompiledForest instance
+
+        Raises:
+            ValueError: If the model is not a fitted single-output forest
+        """
+        if not hasattr(model, 'estimators_'):
+            raise ValueError("Model has no fitted estimators_ to compile")
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError("Only single-output forests can be compiled")
+
+        n_classes = len(model.classes_)
+        features, thresholds, children, values, roots = [], [], [], [], []
+        offset = 0
+        tree_depth = 0
+
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            node_ids = np.arange(n_nodes, dtype=np.int32) + offset
+            is_leaf = tree.children_left == TREE_LEAF
+
+            # Leaves loop back to themselves so extra traversal steps are no-ops
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold).astype(np.float64))
+            left = np.where(is_leaf, node_ids, tree.children_left + offset)
+            right = np.where(is_leaf, node_ids, tree.children_right + offset)
+            children.append(np.stack([right, left], axis=1).ravel().astype(np.int32))
+
+            # Per-tree class distribution, normalized exactly as DecisionTreeClassifier.predict_proba
+            proba = tree.value[:, 0, :n_classes].astype(np.float64)
+            normalizer = proba.sum(axis=1)[:, np.newaxis]
+            normalizer[normalizer == 0.0] = 1.0
+            values.append(proba / normalizer)
+
+            roots.append(offset)
+            offset += n_nodes
+            tree_depth = max(tree_depth, tree.max_depth)
+
+        compiled = cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            children=np.concatenate(children),
+            leaf_value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.int32),
+            classes=np.asarray(model.classes_),
+            n_features=int(model.n_features_in_),
+            tree_depth=int(tree_depth),
+            max_depth=getattr(model, 'max_depth', None)
+        )
+
+        logger.info(f"Compiled forest: {compiled.n_estimators} trees, {offset} nodes, depth {tree_depth}, "
+                    f"{compiled.nbytes / (1024 * 1024):.1f}MB")
+
+        return compiled
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the node and leaf arrays in bytes."""
+        return sum(a.nbytes for a in (self.feature, self.threshold, self.children,
+                                      self.leaf_value, self.roots))
+
+    def _check_input(self, X) -> np.ndarray:
+        # sklearn trees compare float32 inputs against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f"Expected input of shape (n_samples, {self.n_features_in_}), got {X.shape}")
+        return X
+
+    def apply(self, X, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        Find the leaf reached in every tree, or in trees ``start:stop``.
+
+        Args:
+            X: Input array of shape (n_samples, n_features)
+            start: First tree
+            stop: End of the tree range (default: all trees)
+
+        Returns:
+            Global leaf node indices of shape (n_samples, n_trees)
+        """
+        X = self._check_input(X)
+        n_samples, n_features = X.shape
+        nodes = np.repeat(self.roots[np.newaxis, start:stop], n_samples, axis=0)
+        # Flat offsets of each sample's row, so feature lookups are 1-D takes
+        row_offsets = (np.arange(n_samples) * n_features)[:, np.newaxis]
+        X_flat = X.ravel()
+
+        for _ in range(self.tree_depth):
+            go_left = X_flat[row_offsets + self.feature[nodes]] <= self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_left]
+
+        return nodes
+
+    def predict_proba(self, X) -> np.ndarray:
+        """
+        Predict class probabilities (mean of per-tree leaf distributions).
+
+        Args:
+            X: Input array of shape (n_samples, n_features)
+
+        Returns:
+            Array of shape (n_samples, n_classes)
+        """
+        X = self._check_input(X)
+        proba = np.empty((X.shape[0], self.n_classes_), dtype=np.float64)
+
+        for start in range(0, X.shape[0], PREDICT_CHUNK_ROWS):
+            chunk = X[start:start + PREDICT_CHUNK_ROWS]
+            leaves = self.apply(chunk)
+            # Summing over the tree axis adds trees in order, like sklearn's accumulation
+            proba[start:start + len(chunk)] = self.leaf_value[leaves].sum(axis=1)
+
+        proba /= self.n_estimators
+        return proba
+
+    def tree_proba_sum(self, X, start: int, stop: int) -> np.ndarray:
+        """
+        Sum the leaf distributions of trees ``start:stop`` (for evaluating
+        the forest in chunks, see utils/early_exit.py).
+
+        Args:
+            X: Input array of shape (n_samples, n_features)
+            start: First tree
+            stop: End of the tree range
+
+        Returns:
+            Array of shape (n_samples, n_classes)
+        """
+        return self.leaf_value[self.apply(X, start, stop)].sum(axis=1)
+
+    def predict(self, X) -> np.ndarray:
+        """Predict class labels."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def verify_compiled(compiled: CompiledForest, model, n_samples: int = 512, seed: int = 0) -> bool:
+    """
+    Check that a compiled forest reproduces the sklearn model's predict_proba.
+
+    Probe rows are drawn from the range of the model's split thresholds so
+    both branches of most splits are exercised.
+
+    Args:
+        compiled: CompiledForest built from ``model``
+        model: Original sklearn forest
+        n_samples: Number of probe rows
+        seed: Random seed for the probe rows
+
+    Returns:
+        True if both produce identical probabilities
+    """
+    rng = np.random.default_rng(seed)
+    internal = np.isfinite(compiled.threshold)
+    low = compiled.threshold[internal].min() if internal.any() else 0.0
+    high = compiled.threshold[internal].max() if internal.any() else 1.0
+    probes = rng.uniform(low - 0.1, high + 0.1, size=(n_samples, compiled.n_features_in_))
+
+    expected = model.predict_proba(probes)
+    actual = compiled.predict_proba(probes)
+
+    if not np.array_equal(expected, actual):
+        max_diff = float(np.abs(expected - actual).max())
+        logger.error(f"Compiled forest output differs from predict_proba (max abs diff {max_diff:.3e})")
+        return False
+
+    return True
@@ -0,0 +1,325 @@
+"""
+Detector pool module for ASL sign language recognition.
+Keeps a set of pre-initialized MediaPipe Hands detectors alive so the TFLite
+graph is loaded once per worker instead of once per request.
+"""
+
+import atexit
+import os
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+import mediapipe as mp
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+mp_hands = mp.solutions.hands
+
+# Pool configuration (overridable through environment variables)
+DEFAULT_POOL_SIZE = int(os.getenv('HANDS_POOL_SIZE', 2))
+DEFAULT_MIN_SIZE = int(os.getenv('HANDS_POOL_MIN_SIZE', DEFAULT_POOL_SIZE))
+DEFAULT_IDLE_TIMEOUT = float(os.getenv('HANDS_POOL_IDLE_TIMEOUT', 300))
+DEFAULT_ACQUIRE_TIMEOUT = float(os.getenv('HANDS_POOL_ACQUIRE_TIMEOUT', 10))
+
+# Detector settings - must match the settings used for feature extraction
+# static_image_mode=True for better accuracy on single images
+# min_detection_confidence=0.5 for better real-world image detection
+HANDS_OPTIONS = {
+    "static_image_mode": True,
+    "max_num_hands": 2,  # Detect up to 2 hands, we'll pick the largest
+    "min_detection_confidence": 0.5  # Lowered from 0.9 for production use
+}
+
+
+class DetectorPoolTimeout(Exception):
+    """Raised when no detector becomes available within the acquire timeout."""
+
+
+class _PooledDetector:
+    """A Hands instance plus the bookkeeping the pool needs for eviction."""
+
+    def __init__(self, hands):
+        self.hands = hands
+        self.last_used = time.monotonic()
+        self.checked_out_at = self.last_used
+
+
+class HandsDetectorPool:
+    """
+    Thread-safe pool of long-lived MediaPipe Hands detectors.
+
+    Detectors are created up front (``min_size``) and on demand up to
+    ``max_size``. Detectors above ``min_size`` that stay idle longer than
+    ``idle_timeout`` seconds are closed the next time the pool is touched.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_POOL_SIZE, min_size: int = DEFAULT_MIN_SIZE,
+                 idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+                 hands_options: Optional[dict] = None):
+        if max_size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {max_size}")
+
+        self.max_size = max_size
+        self.min_size = max(0, min(min_size, max_size))
+        self.idle_timeout = idle_timeout
+        self.acquire_timeout = acquire_timeout
+        self.hands_options = dict(hands_options or HANDS_OPTIONS)
+
+        self._idle = deque()
+        self._created = 0
+        self._in_use = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Statistics
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._evictions = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._busy_time = 0.0
+        self._started_at = time.monotonic()
+
+        for _ in range(self.min_size):
+            self._idle.append(self._create_detector())
+            self._created += 1
+
+        logger.info(f"Hands detector pool ready ({self.min_size} pre-initialized, max {self.max_size})")
+
+    def _create_detector(self) -> _PooledDetector:
+        """Create a new Hands instance. Caller accounts for it in ``_created``."""
+        return _PooledDetector(mp_hands.Hands(**self.hands_options))
+
+    @staticmethod
+    def _close_detector(detector: _PooledDetector):
+        try:
+            detector.hands.close()
+        except Exception as e:
+            logger.warning(f"Error closing Hands detector: {str(e)}")
+
+    def _evict_idle(self) -> list:
+        """Remove detectors idle past the timeout. Must hold ``_cond``."""
+        if self.idle_timeout <= 0:
+            return []
+
+        now = time.monotonic()
+        evicted = []
+        # Oldest detectors sit at the left end of the deque
+        while self._idle and self._created > self.min_size:
+            if now - self._idle[0].last_used < self.idle_timeout:
+                break
+            evicted.append(self._idle.popleft())
+            self._created -= 1
+            self._evictions += 1
+        return evicted
+
+    def _checkout(self) -> _PooledDetector:
+        start = time.monotonic()
+        deadline = start + self.acquire_timeout
+        create = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Hands detector pool is shut down")
+                if self._idle:
+                    detector = self._idle.pop()
+                    break
+                if self._created < self.max_size:
+                    # Reserve the slot now, build the detector outside the lock
+                    self._created += 1
+                    create = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise DetectorPoolTimeout(
+                        f"No hand detector available after {self.acquire_timeout:.1f}s"
+                    )
+                self._cond.wait(remaining)
+
+            evicted = self._evict_idle()
+            self._in_use += 1
+            waited = time.monotonic() - start
+            self._acquisitions += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+
+        for old in evicted:
+            self._close_detector(old)
+
+        if create:
+            try:
+                detector = self._create_detector()
+            except Exception:
+                with self._cond:
+                    self._created -= 1
+                    self._in_use -= 1
+                    self._cond.notify()
+                raise
+
+        detector.checked_out_at = time.monotonic()
+        return detector
+
+    def _checkin(self, detector: _PooledDetector):
+        now = time.monotonic()
+        close = False
+
+        with self._cond:
+            self._in_use -= 1
+            self._busy_time += now - detector.checked_out_at
+            detector.last_used = now
+            if self._closed:
+                self._created -= 1
+                close = True
+            else:
+                self._idle.append(detector)
+            self._cond.notify()
+
+        if close:
+            self._close_detector(detector)
+
+    @contextmanager
+    def acquire(self):
+        """
+        Check out a Hands detector for the duration of a ``with`` block.
+
+        Yields:
+            mediapipe Hands instance
+
+        Raises:
+            DetectorPoolTimeout: If no detector frees up within the acquire timeout
+        """
+        detector = self._checkout()
+        try:
+            yield detector.hands
+        finally:
+            self._checkin(detector)
+
+    def warm_up(self, image):
+        """
+        Run one frame through each of the ``min_size`` pre-initialized
+        detectors; the first process() call of a detector loads its TFLite graph.
+
+        Args:
+            image: RGB frame to process
+        """
+        # Hold them all at once, so each checkout returns a different detector
+        detectors = []
+        try:
+            for _ in range(max(1, self.min_size)):
+                detectors.append(self._checkout())
+            for detector in detectors:
+                detector.hands.process(image)
+        finally:
+            for detector in detectors:
+                self._checkin(detector)
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics (sizes, wait time and utilization).
+
+        Returns:
+            Dictionary with pool statistics
+        """
+        with self._cond:
+            elapsed = max(time.monotonic() - self._started_at, 1e-9)
+            acquisitions = self._acquisitions
+            return {
+                "max_size": self.max_size,
+                "min_size": self.min_size,
+                "created": self._created,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "acquisitions": acquisitions,
+                "timeouts": self._timeouts,
+                "evictions": self._evictions,
+                "avg_wait_ms": (self._total_wait / acquisitions * 1000) if acquisitions else 0.0,
+                "max_wait_ms": self._max_wait * 1000,
+                # Share of detector capacity spent processing since the pool started
+                "utilization": self._busy_time / (elapsed * self.max_size),
+                "closed": self._closed
+            }
+
+    def shutdown(self):
+        """Close all idle detectors; checked-out detectors close on return."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._created -= len(idle)
+            self._cond.notify_all()
+
+        for detector in idle:
+            self._close_detector(detector)
+
+        logger.info("Hands detector pool shut down")
+
+
+# Global pool (one per worker process)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_detector_pool() -> HandsDetectorPool:
+    """
+    Get the process-wide detector pool, creating it on first use.
+    Created lazily so that forked workers build their own detectors.
+
+    Returns:
+        HandsDetectorPool instance
+    """
+    global _pool
+
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = HandsDetectorPool()
+        return _pool
+
+
+def configure_detector_pool(**pool_options) -> HandsDetectorPool:
+    """
+    Create the process-wide detector pool with non-default options.
+    Must be called before the pool is first used.
+
+    Args:
+        **pool_options: Keyword arguments for HandsDetectorPool
+
+    Returns:
+        HandsDetectorPool instance
+
+    Raises:
+        RuntimeError: If the pool has already been created
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            raise RuntimeError("Hands detector pool is already created")
+        _pool = HandsDetectorPool(**pool_options)
+        return _pool
+
+
+def shutdown_detector_pool():
+    """Shut down the process-wide detector pool if it was created."""
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_detector_pool)
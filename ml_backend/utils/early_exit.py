@@ -0,0 +1,238 @@
+"""
+Early-exit forest evaluation module for ASL sign language recognition.
+Scores the trees of the forest in chunks and stops for a row as soon as the
+remaining trees can no longer change its predicted label or its confidence
+threshold decision, optionally after a small-forest first stage that
+accepts very confident rows on its own.
+"""
+
+import os
+import logging
+import threading
+from typing import Tuple
+
+import numpy as np
+
+from utils.compiled_forest import CompiledForest
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Evaluation configuration (overridable through environment variables)
+# FOREST_EARLY_EXIT: evaluate trees in chunks and stop once the result is decided;
+#   the predicted sign is always the one the full forest would give
+# FOREST_EARLY_EXIT_CHUNK: trees evaluated between two exit checks
+# FOREST_CASCADE_TREES: trees of the first stage (0 = no first stage); a row
+#   whose first-stage confidence reaches FOREST_CASCADE_CONFIDENCE is accepted
+#   without the other trees, so its sign may differ from the full forest's
+EARLY_EXIT_ENABLED = os.getenv('FOREST_EARLY_EXIT', 'false').lower() in ('1', 'true', 'yes')
+EARLY_EXIT_CHUNK = int(os.getenv('FOREST_EARLY_EXIT_CHUNK', 8))
+CASCADE_TREES = int(os.getenv('FOREST_CASCADE_TREES', 0))
+CASCADE_CONFIDENCE = float(os.getenv('FOREST_CASCADE_CONFIDENCE', 0.9))
+
+# A CompiledForest walks all trees in one vectorized pass whose cost for a
+# few rows is mostly per-call overhead, so chunks only pay off for batches
+COMPILED_MIN_ROWS = 32
+
+# Slack for float rounding in the exit bounds; errs on evaluating more trees
+BOUND_EPSILON = 1e-9
+
+
+def tree_proba_sum(model, X: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """
+    Sum the per-tree class distributions of trees ``start:stop``.
+
+    Args:
+        model: CompiledForest or fitted sklearn RandomForestClassifier
+        X: float32 input of shape (n_samples, n_features)
+        start: First tree
+        stop: End of the tree range
+
+    Returns:
+        Array of shape (n_samples, n_classes)
+    """
+    if isinstance(model, CompiledForest):
+        return model.tree_proba_sum(X, start, stop)
+
+    # Same per-tree calls and summation order as RandomForestClassifier.predict_proba
+    total = np.zeros((X.shape[0], len(model.classes_)), dtype=np.float64)
+    for estimator in model.estimators_[start:stop]:
+        total += estimator.predict_proba(X, check_input=False)
+    return total
+
+
+def supports_early_exit(model, n_rows: int = 1) -> bool:
+    """
+    Check whether chunked evaluation is possible and pays off.
+
+    Args:
+        model: Loaded model
+        n_rows: Rows predicted in one call
+
+    Returns:
+        True for sklearn forests, and for CompiledForest batches of at
+        least COMPILED_MIN_ROWS rows
+    """
+    if isinstance(model, CompiledForest):
+        return n_rows >= COMPILED_MIN_ROWS
+    return hasattr(model, 'estimators_')
+
+
+class EarlyExitEvaluator:
+    """
+    Chunked forest evaluation with exact exit bounds.
+
+    After k of n trees a row has per-class vote sums S (each tree adds a
+    distribution summing to 1). The final mean is (S + R) / n with the
+    remaining votes R between 0 and n - k per class, so:
+    - the argmax is fixed once top - second > n - k
+    - the row is accepted once top >= threshold * n
+    - the row is "uncertain" once top + (n - k) < threshold * n
+    Since the top class alone can never exceed k, no exit is possible before
+    about min(1/2, 1 - threshold) of the trees; the first check is made there.
+
+    Returned probabilities are the mean over the trees evaluated for the row.
+    """
+
+    def __init__(self, threshold: float, chunk_size: int = EARLY_EXIT_CHUNK,
+                 early_exit: bool = EARLY_EXIT_ENABLED, cascade_trees: int = CASCADE_TREES,
+                 cascade_confidence: float = CASCADE_CONFIDENCE):
+        self.threshold = threshold
+        self.chunk_size = max(1, chunk_size)
+        self.early_exit = early_exit
+        self.cascade_trees = max(0, cascade_trees)
+        self.cascade_confidence = cascade_confidence
+
+        self._rows = 0
+        self._trees_evaluated = 0
+        self._trees_total = 0
+        self._exits = {"early": 0, "cascade": 0, "full": 0}
+        self._lock = threading.Lock()
+
+    def checkpoints(self, n_trees: int) -> list:
+        """
+        Tree counts after which rows are checked for an exit.
+
+        Args:
+            n_trees: Trees in the forest
+
+        Returns:
+            Increasing list of tree counts, ending with n_trees
+        """
+        points = []
+        if 0 < self.cascade_trees < n_trees:
+            points.append(self.cascade_trees)
+
+        if self.early_exit:
+            # Before this many trees neither bound can hold
+            first = int(n_trees * min(0.5, 1.0 - self.threshold)) + 1
+            point = max(first, points[-1] + self.chunk_size if points else self.chunk_size)
+            while point < n_trees:
+                points.append(point)
+                point += self.chunk_size
+
+        points.append(n_trees)
+        return points
+
+    def _decided(self, sums: np.ndarray, evaluated: int, n_trees: int) -> np.ndarray:
+        """Rows whose label and threshold decision can no longer change."""
+        remaining = n_trees - evaluated
+        if sums.shape[1] > 1:
+            top_two = np.partition(sums, -2, axis=1)[:, -2:]
+            second, top = top_two[:, 0], top_two[:, 1]
+        else:
+            top = sums[:, 0]
+            second = np.zeros_like(top)
+
+        needed = self.threshold * n_trees
+        argmax_fixed = top - second > remaining + BOUND_EPSILON
+        accepted = top >= needed + BOUND_EPSILON
+        rejected = top + remaining < needed - BOUND_EPSILON
+        return rejected | (argmax_fixed & accepted)
+
+    def predict_proba(self, model, X) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Predict class probabilities, evaluating only as many trees per row as needed.
+
+        Args:
+            model: CompiledForest or fitted sklearn RandomForestClassifier
+            X: Input array of shape (n_samples, n_features)
+
+        Returns:
+            Tuple of (probabilities of shape (n_samples, n_classes),
+            trees evaluated per row)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        n_trees = len(model.estimators_) if hasattr(model, 'estimators_') else model.n_estimators
+        n_rows = X.shape[0]
+        sums = np.zeros((n_rows, len(model.classes_)), dtype=np.float64)
+        trees = np.full(n_rows, n_trees, dtype=np.int64)
+        active = np.arange(n_rows)
+        evaluated = 0
+        cascade_exits = 0
+        early_exits = 0
+
+        for point in self.checkpoints(n_trees):
+            rows = X if len(active) == n_rows else X[active]
+            sums[active] += tree_proba_sum(model, rows, evaluated, point)
+            evaluated = point
+            if evaluated >= n_trees:
+                break
+
+            partial = sums[active]
+            if self.early_exit:
+                decided = self._decided(partial, evaluated, n_trees)
+            else:
+                decided = np.zeros(len(active), dtype=bool)
+            early_exits += int(np.count_nonzero(decided))
+
+            if evaluated == self.cascade_trees:
+                # First stage: accept rows its trees are confident about
+                confident = ~decided & (partial.max(axis=1) >= self.cascade_confidence * evaluated)
+                cascade_exits += int(np.count_nonzero(confident))
+                decided |= confident
+
+            trees[active[decided]] = evaluated
+            active = active[~decided]
+            if not len(active):
+                break
+
+        probabilities = sums / trees[:, np.newaxis]
+
+        with self._lock:
+            self._rows += n_rows
+            self._trees_evaluated += int(trees.sum())
+            self._trees_total += n_rows * n_trees
+            self._exits["early"] += early_exits
+            self._exits["cascade"] += cascade_exits
+            self._exits["full"] += n_rows - early_exits - cascade_exits
+
+        return probabilities, trees
+
+    def stats(self) -> dict:
+        """
+        Get evaluation statistics.
+
+        Returns:
+            Dictionary with rows, mean trees evaluated per row, the fraction
+            of trees skipped and exit counts by kind
+        """
+        with self._lock:
+            rows = self._rows
+            evaluated = self._trees_evaluated
+            total = self._trees_total
+            exits = dict(self._exits)
+
+        return {
+            "early_exit": self.early_exit,
+            "chunk_size": self.chunk_size,
+            "cascade_trees": self.cascade_trees,
+            "cascade_confidence": self.cascade_confidence,
+            "rows": rows,
+            "mean_trees_evaluated": evaluated / rows if rows else 0.0,
+            "trees_skipped_ratio": 1 - evaluated / total if total else 0.0,
+            "exits": exits
+        }
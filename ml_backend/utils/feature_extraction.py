@@ -8,6 +8,8 @@ import numpy as np
 import mediapipe as mp
 import logging
 from typing import Tuple, Optional, Dict, List
+from utils.detector_pool import get_detector_pool
+from utils.metrics import timed
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -48,13 +50,119 @@ def get_hand_bounding_box(hand_landmarks, image_width: int, image_height: int) -
     return area
 
 
-def extract_hand_landmarks(image: np.ndarray) -> Tuple[Optional[List[float]], Optional[Dict[str, str]]]:
+def features_from_results(results, image_shape) -> Tuple[Optional[List[float]], Optional[Dict[str, str]]]:
+    """
+    Turn MediaPipe Hands results into the 42-feature vector used by the model.
+    
+    Args:
+        results: Output of Hands.process()
+        image_shape: Shape of the image that was processed (height, width, ...)
+        
+    Returns:
+        Tuple of (features, error_info) - same as extract_hand_landmarks()
+    """
+    # Check if any hands were detected
+    if not results.multi_hand_landmarks:
+        logger.debug("No hand landmarks detected in the image")
+        return None, {
+            "status": "no_hand",
+            "message": "No hand detected in the frame. Please show your hand clearly."
+        }
+    
+    # If multiple hands detected, select the largest one
+    selected_hand = None
+    if len(results.multi_hand_landmarks) > 1:
+        logger.debug(f"Multiple hands detected ({len(results.multi_hand_landmarks)}), selecting largest")
+        h, w = image_shape[:2]
+        
+        largest_area = 0
+        for hand_landmarks in results.multi_hand_landmarks:
+            area = get_hand_bounding_box(hand_landmarks, w, h)
+            if area > largest_area:
+                largest_area = area
+                selected_hand = hand_landmarks
+        
+        logger.debug(f"Selected hand with bounding box area: {largest_area:.2f} pixels")
+    else:
+        selected_hand = results.multi_hand_landmarks[0]
+        logger.debug("Single hand detected")
+    
+    # Extract features: 21 landmarks × 2 coordinates (x, y) = 42 features
+    # This matches the exact preprocessing done during training
+    features = []
+    for landmark in selected_hand.landmark:
+        features.append(landmark.x)
+        features.append(landmark.y)
+    
+    logger.debug(f"Extracted {len(features)} features from hand landmarks")
+    
+    # Verify we have exactly 42 features
+    if len(features) != 42:
+        logger.error(f"Expected 42 features, got {len(features)}")
+        return None, {
+            "status": "error",
+            "message": f"Feature extraction error: expected 42 features, got {len(features)}"
+        }
+    
+    return features, None
+
+
+def _extract_tracked(image_rgb: np.ndarray, session) -> Tuple[Optional[List[float]], Optional[Dict[str, str]]]:
+    """
+    Run the session's landmark tracker on a frame, falling back to static
+    detection on the shared pool when tracking is lost.
+    
+    A tracker that had no hand on its previous frame runs palm detection
+    itself, so its "no hand" is final; only a lost track (a hand on its
+    previous frame, none now) is retried with static detection.
+    
+    Args:
+        image_rgb: Frame in RGB format
+        session: RealtimeSession the frame belongs to
+        
+    Returns:
+        Tuple of (features, error_info) - same as extract_hand_landmarks()
+    """
+    with session.lock:
+        if not session.closed:
+            session.frames += 1
+            
+            with timed("mediapipe"):
+                results = session.tracker.process(image_rgb)
+            
+            was_tracking = session.tracking_hand
+            session.tracking_hand = bool(results.multi_hand_landmarks)
+            
+            if results.multi_hand_landmarks:
+                session.tracked_frames += 1
+                with timed("features"):
+                    return features_from_results(results, image_rgb.shape)
+            
+            if not was_tracking:
+                # The tracker already ran palm detection on this frame
+                return features_from_results(results, image_rgb.shape)
+            
+            session.fallback_frames += 1
+            logger.debug(f"Tracking lost for session {session.session_id}, falling back to static detection")
+    
+    with get_detector_pool().acquire() as hands:
+        with timed("mediapipe"):
+            results = hands.process(image_rgb)
+    
+    with timed("features"):
+        return features_from_results(results, image_rgb.shape)
+
+
+def extract_hand_landmarks(image: np.ndarray, session=None, is_rgb: bool = False) -> Tuple[Optional[List[float]], Optional[Dict[str, str]]]:
     """
     Extract hand landmarks from an image using MediaPipe.
     Matches the preprocessing done during model training.
     
     Args:
         image: Input image as numpy array (BGR format from OpenCV)
+        session: Optional RealtimeSession; consecutive frames of a session
+                 use the landmark tracker instead of full detection
+        is_rgb: True if a 3-channel image is already in RGB order (skips conversion)
         
     Returns:
         Tuple of (features, error_info)
@@ -72,17 +180,22 @@ def extract_hand_landmarks(image: np.ndarray) -> Tuple[Optional[List[float]], Op
             }
         
         # Log image details
-        logger.info(f"Input image shape: {image.shape}, dtype: {image.dtype}")
+        logger.debug(f"Input image shape: {image.shape}, dtype: {image.dtype}")
         
         # Convert BGR to RGB (MediaPipe expects RGB)
         if len(image.shape) == 2:  # Grayscale
-            logger.info("Converting grayscale image to RGB")
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
+            logger.debug("Converting grayscale image to RGB")
+            with timed("color_convert"):
+                image_rgb = cv2.cvtColor(image, cv2.COLOR_GRAY2RGB)
         elif image.shape[2] == 4:  # RGBA
-            logger.info("Converting RGBA image to RGB")
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+            logger.debug("Converting RGBA image to RGB")
+            with timed("color_convert"):
+                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+        elif image.shape[2] == 3 and is_rgb:  # Raw RGB frame
+            image_rgb = image
         elif image.shape[2] == 3:  # BGR
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            with timed("color_convert"):
+                image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
         else:
             logger.error(f"Unexpected image format: {image.shape}")
             return None, {
@@ -90,66 +203,18 @@ def extract_hand_landmarks(image: np.ndarray) -> Tuple[Optional[List[float]], Op
                 "message": f"Unexpected image format: {image.shape}"
             }
         
-
-
-        #Comments
-        # Initialize MediaPipe Hands
-        # static_image_mode=True for better accuracy on single images
-        # min_detection_confidence=0.5 for better real-world image detection
-        with mp_hands.Hands(
-            static_image_mode=True,
-            max_num_hands=2,  # Detect up to 2 hands, we'll pick the largest
-            min_detection_confidence=0.5  # Lowered from 0.9 for production use
-        ) as hands:
-            
-            # Process the image
-            results = hands.process(image_rgb)
-            
-            # Check if any hands were detected
-            if not results.multi_hand_landmarks:
-                logger.warning("No hand landmarks detected in the image")
-                return None, {
-                    "status": "no_hand",
-                    "message": "No hand detected in the frame. Please show your hand clearly."
-                }
-            
-            # If multiple hands detected, select the largest one
-            selected_hand = None
-            if len(results.multi_hand_landmarks) > 1:
-                logger.info(f"Multiple hands detected ({len(results.multi_hand_landmarks)}), selecting largest")
-                h, w, _ = image_rgb.shape
-                
-                largest_area = 0
-                for hand_landmarks in results.multi_hand_landmarks:
-                    area = get_hand_bounding_box(hand_landmarks, w, h)
-                    if area > largest_area:
-                        largest_area = area
-                        selected_hand = hand_landmarks
-                
-                logger.info(f"Selected hand with bounding box area: {largest_area:.2f} pixels")
-            else:
-                selected_hand = results.multi_hand_landmarks[0]
-                logger.info("Single hand detected")
-            
-            # Extract features: 21 landmarks × 2 coordinates (x, y) = 42 features
-            # This matches the exact preprocessing done during training
-            features = []
-            for landmark in selected_hand.landmark:
-                features.append(landmark.x)
-                features.append(landmark.y)
-            
-            logger.info(f"Extracted {len(features)} features from hand landmarks")
-            
-            # Verify we have exactly 42 features
-            if len(features) != 42:
-                logger.error(f"Expected 42 features, got {len(features)}")
-                return None, {
-                    "status": "error",
-                    "message": f"Feature extraction error: expected 42 features, got {len(features)}"
-                }
-            
-            return features, None
-            
+        if session is not None:
+            return _extract_tracked(image_rgb, session)
+        
+        # Run detection on a pooled, pre-initialized Hands instance
+        # (see utils/detector_pool.py for the detector settings)
+        with get_detector_pool().acquire() as hands:
+            with timed("mediapipe"):
+                results = hands.process(image_rgb)
+        
+        with timed("features"):
+            return features_from_results(results, image_rgb.shape)
+        
     except Exception as e:
         error_message = str(e)
         logger.error(f"Error during feature extraction: {error_message}")
@@ -0,0 +1,228 @@
+"""
+Feature store module for ASL sign language recognition.
+Keeps extracted training landmarks on disk as compressed NPZ shards plus a
+JSON manifest, keyed by image content hash, so dataset extraction can be
+resumed and unchanged images are never extracted twice.
+"""
+
+import os
+import json
+import hashlib
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+STORE_VERSION = 1
+
+# Features per image (21 landmarks x (x, y))
+FEATURE_COUNT = 42
+
+# Content hash of the image files (hex digest stored per record)
+HASH_ALGORITHM = "blake2b-128"
+
+# Record status codes stored in the shards
+STATUS_SUCCESS = 0
+STATUS_NO_HAND = 1
+STATUS_CODES = {"success": STATUS_SUCCESS, "no_hand": STATUS_NO_HAND}
+
+
+def content_hash(path) -> str:
+    """
+    Hash an image file's bytes.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest (see HASH_ALGORITHM)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, write):
+    """Write a file through a temporary name, so readers never see a partial file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'wb') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class FeatureStore:
+    """
+    Append-only landmark store: each flush writes one shard
+    (shard-NNNNN.npz) and then the manifest listing it, so an interrupted
+    run loses at most the records of the shard being written.
+
+    Shard arrays:
+        hashes:   content hash per image (str)
+        paths:    image path relative to the dataset root (str)
+        labels:   class index into the manifest's classes (int16)
+        status:   STATUS_SUCCESS or STATUS_NO_HAND (uint8)
+        features: landmarks, NaN for no_hand records (float32, N x 42)
+    """
+
+    def __init__(self, directory, classes: List[str]):
+        """
+        Open a store, creating it if needed.
+
+        Args:
+            directory: Store directory
+            classes: Class names; record labels index into this list
+
+        Raises:
+            ValueError: If an existing store uses a different version or classes
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.directory / MANIFEST_NAME
+        self.classes = list(classes)
+
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as f:
+                self.manifest = json.load(f)
+            if self.manifest.get("version") != STORE_VERSION:
+                raise ValueError(f"Unsupported feature store version {self.manifest.get('version')}")
+            if self.manifest.get("classes") != self.classes:
+                raise ValueError("Feature store was created with different classes; use a new store directory")
+        else:
+            self.manifest = {
+                "version": STORE_VERSION,
+                "classes": self.classes,
+                "feature_count": FEATURE_COUNT,
+                "hash": HASH_ALGORITHM,
+                "created_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+                "shards": []
+            }
+
+        self._pending = []
+
+    @property
+    def record_count(self) -> int:
+        """Records written to shards (excluding pending ones)."""
+        return sum(shard["count"] for shard in self.manifest["shards"])
+
+    def load_index(self) -> Tuple[Dict[str, Tuple[int, np.ndarray]], set]:
+        """
+        Read the hashes already in the store.
+
+        Returns:
+            Tuple of (features by hash as (status, features), set of (hash, label) pairs)
+        """
+        by_hash = {}
+        done = set()
+        for shard in self.iter_shards():
+            for hash_, label, status, features in zip(shard["hashes"], shard["labels"],
+                                                      shard["status"], shard["features"]):
+                by_hash[str(hash_)] = (int(status), features)
+                done.add((str(hash_), int(label)))
+        return by_hash, done
+
+    def iter_shards(self):
+        """Yield each shard's arrays as a dict."""
+        for shard in self.manifest["shards"]:
+            with np.load(self.directory / shard["file"], allow_pickle=False) as data:
+                yield {name: data[name] for name in data.files}
+
+    def add(self, hash_: str, path: str, label: int, status: int, features: Optional[List[float]]):
+        """
+        Queue one record for the next shard.
+
+        Args:
+            hash_: Content hash of the image
+            path: Image path relative to the dataset root
+            label: Class index
+            status: STATUS_SUCCESS or STATUS_NO_HAND
+            features: 42 landmark features, or None for no_hand
+        """
+        self._pending.append((hash_, path, label, status, features))
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def flush(self, meta: Optional[dict] = None):
+        """
+        Write pending records as a new shard and update the manifest.
+
+        Args:
+            meta: Optional fields merged into the manifest (e.g. extraction settings)
+        """
+        if meta:
+            self.manifest.update(meta)
+        if not self._pending:
+            return
+
+        records = self._pending
+        features = np.full((len(records), FEATURE_COUNT), np.nan, dtype=np.float32)
+        for i, record in enumerate(records):
+            if record[4] is not None:
+                features[i] = record[4]
+
+        name = f"shard-{len(self.manifest['shards']):05d}.npz"
+        arrays = {
+            "hashes": np.array([record[0] for record in records]),
+            "paths": np.array([record[1] for record in records]),
+            "labels": np.array([record[2] for record in records], dtype=np.int16),
+            "status": np.array([record[3] for record in records], dtype=np.uint8),
+            "features": features
+        }
+        _write_atomic(self.directory / name, lambda f: np.savez_compressed(f, **arrays))
+
+        self.manifest["shards"].append({"file": name, "count": len(records)})
+        self.manifest["updated_at"] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        manifest = json.dumps(self.manifest, indent=2).encode('utf-8')
+        _write_atomic(self.manifest_path, lambda f: f.write(manifest))
+
+        self._pending = []
+        logger.debug(f"Wrote {name} ({len(records)} records)")
+
+
+def load_features(directory) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Load the training set from a feature store.
+    no_hand records are left out, and an image listed twice under the same
+    class (same content hash) is returned once.
+
+    Args:
+        directory: Store directory
+
+    Returns:
+        Tuple of (features N x 42 float32, labels N int, class names)
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest
+    """
+    manifest_path = Path(directory) / MANIFEST_NAME
+    with open(manifest_path) as f:
+        classes = json.load(f)["classes"]
+
+    store = FeatureStore(directory, classes)
+    seen = set()
+    rows = []
+    labels = []
+    for shard in store.iter_shards():
+        for hash_, label, status, features in zip(shard["hashes"], shard["labels"],
+                                                  shard["status"], shard["features"]):
+            key = (str(hash_), int(label))
+            if status != STATUS_SUCCESS or key in seen:
+                continue
+            seen.add(key)
+            rows.append(features)
+            labels.append(int(label))
+
+    if not rows:
+        return np.empty((0, FEATURE_COUNT), dtype=np.float32), np.empty(0, dtype=int), classes
+    return np.stack(rows), np.array(labels), classes
@@ -0,0 +1,261 @@
+"""
+Frame cache module for ASL sign language recognition.
+Remembers recent per-frame results so repeated webcam frames (static hand,
+paused video) skip decoding and MediaPipe.
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict, deque
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Cache configuration (overridable through environment variables)
+# FRAME_CACHE: enable the cache
+# FRAME_CACHE_SIZE: maximum number of cached frames (LRU beyond that)
+# FRAME_CACHE_TTL: seconds a cached result stays valid
+# FRAME_CACHE_NEAR_DUPLICATES: also match visually near-identical frames within a session
+# FRAME_CACHE_NEAR_DISTANCE: max differing perceptual hash bits for a near-duplicate
+FRAME_CACHE_ENABLED = os.getenv('FRAME_CACHE', 'true').lower() in ('1', 'true', 'yes')
+FRAME_CACHE_SIZE = int(os.getenv('FRAME_CACHE_SIZE', 1024))
+FRAME_CACHE_TTL = float(os.getenv('FRAME_CACHE_TTL', 10))
+NEAR_DUPLICATES = os.getenv('FRAME_CACHE_NEAR_DUPLICATES', 'false').lower() in ('1', 'true', 'yes')
+NEAR_DISTANCE = int(os.getenv('FRAME_CACHE_NEAR_DISTANCE', 4))
+
+# Perceptual hash is a HASH_SIZE x HASH_SIZE difference hash (256 bits)
+HASH_SIZE = 16
+
+# Recent frames per session compared against for near-duplicates
+NEAR_WINDOW = 4
+
+
+def frame_key(buffer, raw_size: Optional[Tuple[int, int]] = None) -> str:
+    """
+    Hash a frame exactly as received (encoded bytes or raw RGB buffer).
+
+    Args:
+        buffer: Frame bytes
+        raw_size: (width, height) for raw RGB frames, None for encoded images
+
+    Returns:
+        Hex digest identifying the frame
+    """
+    digest = hashlib.blake2b(buffer, digest_size=16)
+    if raw_size is not None:
+        digest.update(f"raw:{raw_size[0]}x{raw_size[1]}".encode())
+    return digest.hexdigest()
+
+
+def perceptual_hash(image: np.ndarray, is_rgb: bool = False) -> np.ndarray:
+    """
+    Difference hash of a downscaled grayscale copy of the image. Frames that
+    look alike differ in only a few bits.
+
+    Args:
+        image: Decoded image (BGR, or RGB with ``is_rgb``)
+        is_rgb: True if a 3-channel image is in RGB order
+
+    Returns:
+        Packed hash bits (uint8 array of HASH_SIZE * HASH_SIZE / 8 bytes)
+    """
+    if image.ndim == 2:
+        gray = image
+    elif image.shape[2] == 4:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    else:
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY if is_rgb else cv2.COLOR_BGR2GRAY)
+
+    small = cv2.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    return np.packbits(small[:, 1:] > small[:, :-1])
+
+
+class _Entry:
+    """A cached frame result."""
+
+    __slots__ = ("result", "probabilities", "expires_at")
+
+    def __init__(self, result: dict, probabilities: Optional[np.ndarray], expires_at: float):
+        self.result = result
+        self.probabilities = probabilities
+        self.expires_at = expires_at
+
+
+class FrameCache:
+    """
+    Bounded LRU/TTL cache of per-frame pipeline results.
+
+    Entries are keyed by (scope, frame key), where the scope is the realtime
+    session id, so sessions never see each other's results. Stateless
+    requests share the ``None`` scope for exact repeats only: the same bytes
+    always give the same result. Near-duplicate matching compares a frame's
+    perceptual hash with the last few frames of the same session.
+    """
+
+    def __init__(self, max_entries: int = FRAME_CACHE_SIZE, ttl: float = FRAME_CACHE_TTL,
+                 near_duplicates: bool = NEAR_DUPLICATES, near_distance: int = NEAR_DISTANCE):
+        if max_entries < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.near_duplicates = near_duplicates
+        self.near_distance = near_distance
+
+        self._entries = OrderedDict()
+        self._recent = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._near_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _lookup(self, full_key, now: float) -> Optional[_Entry]:
+        """Return a live entry and mark it recently used. Must hold ``_lock``."""
+        entry = self._entries.get(full_key)
+        if entry is None:
+            return None
+        if entry.expires_at <= now:
+            del self._entries[full_key]
+            self._expirations += 1
+            return None
+        self._entries.move_to_end(full_key)
+        return entry
+
+    def get(self, scope: Optional[str], key: str) -> Optional[_Entry]:
+        """
+        Look up an exact repeat of a frame.
+
+        Args:
+            scope: Session id, or None for stateless requests
+            key: Frame key from frame_key()
+
+        Returns:
+            Cached entry, or None on a miss
+        """
+        with self._lock:
+            entry = self._lookup((scope, key), time.monotonic())
+            if entry is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return entry
+
+    def get_near(self, scope: str, phash: np.ndarray) -> Optional[_Entry]:
+        """
+        Look up a near-identical recent frame of the same session.
+
+        Args:
+            scope: Session id
+            phash: Perceptual hash from perceptual_hash()
+
+        Returns:
+            Cached entry of the most recent matching frame, or None
+        """
+        with self._lock:
+            now = time.monotonic()
+            for recent_hash, key in reversed(self._recent.get(scope, ())):
+                if int(np.unpackbits(recent_hash ^ phash).sum()) > self.near_distance:
+                    continue
+                entry = self._lookup((scope, key), now)
+                if entry is not None:
+                    self._near_hits += 1
+                    return entry
+            return None
+
+    def put(self, scope: Optional[str], key: str, result: dict,
+            probabilities: Optional[np.ndarray], phash: Optional[np.ndarray] = None):
+        """
+        Store a frame result.
+
+        Args:
+            scope: Session id, or None for stateless requests
+            key: Frame key from frame_key()
+            result: Pipeline result without per-session fields
+            probabilities: Class probabilities, or None if no hand was found
+            phash: Perceptual hash, recorded for near-duplicate lookups
+        """
+        with self._lock:
+            full_key = (scope, key)
+            self._entries[full_key] = _Entry(result, probabilities, time.monotonic() + self.ttl)
+            self._entries.move_to_end(full_key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+            if phash is not None and scope is not None:
+                recent = self._recent.get(scope)
+                if recent is None:
+                    recent = self._recent[scope] = deque(maxlen=NEAR_WINDOW)
+                recent.append((phash, key))
+                self._recent.move_to_end(scope)
+                # Forget the near-duplicate index of sessions that went quiet
+                while len(self._recent) > self.max_entries:
+                    self._recent.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries (e.g. after the model changes)."""
+        with self._lock:
+            self._entries.clear()
+            self._recent.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache configuration and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "near_duplicates": self.near_duplicates,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "near_hits": self._near_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": (self._hits + self._near_hits) / lookups if lookups else 0.0
+            }
+
+
+# Global cache (one per worker process)
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> Optional[FrameCache]:
+    """
+    Get the process-wide frame cache, creating it on first use.
+
+    Returns:
+        FrameCache instance, or None if FRAME_CACHE is disabled
+    """
+    global _cache
+
+    if not FRAME_CACHE_ENABLED:
+        return None
+
+    if _cache is not None:
+        return _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = FrameCache()
+            logger.info(f"Frame cache enabled ({_cache.max_entries} entries, {_cache.ttl}s TTL, "
+                        f"near duplicates {'on' if _cache.near_duplicates else 'off'})")
+        return _cache
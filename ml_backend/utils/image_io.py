@@ -0,0 +1,324 @@
+"""
+Image input module for ASL sign language recognition.
+Reads, validates and decodes request images: raw binary bodies,
+uncompressed RGB frames, file uploads and base64 data URIs. The checks here
+are shared by the Flask app (app.py) and the ASGI app (asgi_app.py), which
+only adapt their request objects.
+"""
+
+import os
+import base64
+import struct
+import logging
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from utils.metrics import timed
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Request body types accepted as raw binary images
+ENCODED_IMAGE_TYPES = {'image/jpeg', 'image/png'}
+RAW_FRAME_TYPE = 'application/octet-stream'
+BINARY_IMAGE_TYPES = ENCODED_IMAGE_TYPES | {RAW_FRAME_TYPE}
+
+# Encoded images (uploads, binary bodies, data URIs) up to 2MB
+MAX_FILE_SIZE = 2 * 1024 * 1024
+ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg'}
+
+# Error messages of the size and type checks
+IMAGE_TOO_LARGE = f"Image size exceeds limit. Max size is {MAX_FILE_SIZE // (1024*1024)}MB."
+FILE_TOO_LARGE = f"File size exceeds limit. Max size is {MAX_FILE_SIZE // (1024*1024)}MB."
+FILE_TYPE_NOT_ALLOWED = "File type not allowed. Only png, jpg, jpeg are accepted."
+
+# Raw RGB frames are uncompressed, so they get their own size limit (default 1080p)
+MAX_RAW_FRAME_SIZE = int(os.getenv('MAX_RAW_FRAME_SIZE', 1920 * 1080 * 3))
+
+# Read size when the body stream has no readinto()
+READ_CHUNK_SIZE = 64 * 1024
+
+# Large uploads are decoded at 1/2, 1/4 or 1/8 scale (libjpeg scales while
+# decoding), as long as the longer side stays at or above DECODE_TARGET_SIZE.
+# MediaPipe downsamples to a few hundred pixels internally anyway. 0 disables.
+DECODE_TARGET_SIZE = int(os.getenv('DECODE_TARGET_SIZE', 640))
+
+# (scale factor, imdecode flag), largest reduction first
+REDUCED_DECODE_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2)
+)
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# JPEG start-of-frame markers (SOF0-SOF15 except DHT, JPG and DAC)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def allowed_file(filename: str) -> bool:
+    """Check if an uploaded file's extension is allowed."""
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+
+
+def check_binary_frame(mimetype: str, length: Optional[int], frame_width: Optional[str],
+                       frame_height: Optional[str]) -> Tuple[Optional[Tuple[int, int]], Optional[str]]:
+    """
+    Validate a raw binary image body from its headers, before it is read:
+    - image/jpeg or image/png: encoded image bytes, up to MAX_FILE_SIZE
+    - application/octet-stream: uncompressed RGB frame, with X-Frame-Width
+      and X-Frame-Height headers, up to MAX_RAW_FRAME_SIZE
+
+    Args:
+        mimetype: Content type of the body
+        length: Content-Length, or None if missing or invalid
+        frame_width: X-Frame-Width header value
+        frame_height: X-Frame-Height header value
+
+    Returns:
+        Tuple of (raw_size, error_message); raw_size is (width, height) for
+        raw RGB frames and None for encoded images
+    """
+    if length is None:
+        return None, "Content-Length header is required for binary image uploads"
+
+    if mimetype == RAW_FRAME_TYPE:
+        try:
+            width = int(frame_width or '')
+            height = int(frame_height or '')
+        except ValueError:
+            return None, "Raw frames need integer X-Frame-Width and X-Frame-Height headers"
+
+        if width <= 0 or height <= 0:
+            return None, "Raw frame dimensions must be positive"
+
+        if length > MAX_RAW_FRAME_SIZE:
+            logger.error(f"Raw frame size ({length} bytes) exceeds limit")
+            return None, f"Raw frame size exceeds limit. Max size is {MAX_RAW_FRAME_SIZE} bytes."
+
+        if length != width * height * 3:
+            return None, f"Raw frame is {length} bytes, expected {width * height * 3} for {width}x{height} RGB"
+
+        logger.debug(f"Received raw RGB frame: {width}x{height}")
+        return (width, height), None
+
+    if length > MAX_FILE_SIZE:
+        logger.error(f"Binary image size ({length} bytes) exceeds limit")
+        return None, IMAGE_TOO_LARGE
+
+    logger.debug(f"Received binary image: {length} bytes")
+    return None, None
+
+
+def read_body(stream, length: int) -> bytearray:
+    """
+    Read exactly ``length`` bytes from a request body stream into one
+    preallocated buffer.
+
+    Args:
+        stream: File-like request body
+        length: Number of bytes to read (the request's Content-Length)
+
+    Returns:
+        bytearray holding the body
+
+    Raises:
+        ValueError: If the stream ends before ``length`` bytes
+    """
+    buffer = bytearray(length)
+    view = memoryview(buffer)
+    readinto = getattr(stream, 'readinto', None)
+    offset = 0
+
+    while offset < length:
+        if readinto is not None:
+            read = readinto(view[offset:])
+        else:
+            chunk = stream.read(min(READ_CHUNK_SIZE, length - offset))
+            read = len(chunk)
+            view[offset:offset + read] = chunk
+        if not read:
+            raise ValueError(f"Request body ended after {offset} of {length} bytes")
+        offset += read
+
+    return buffer
+
+
+def image_dimensions(buffer) -> Optional[Tuple[int, int]]:
+    """
+    Read the dimensions of a JPEG or PNG image from its header, without decoding.
+
+    Args:
+        buffer: bytes, bytearray or memoryview with the encoded image
+
+    Returns:
+        (width, height), or None if the header is not recognized
+    """
+    data = memoryview(buffer)
+
+    if len(data) >= 24 and data[:8] == PNG_SIGNATURE and data[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', data[16:24])
+        return width, height
+
+    if len(data) < 4 or data[0] != 0xFF or data[1] != 0xD8:
+        return None
+
+    # Walk the JPEG marker segments up to the start-of-frame header
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:  # Fill byte
+            offset += 1
+            continue
+        if marker == 0xD8 or 0xD0 <= marker <= 0xD7 or marker == 0x01:  # No payload
+            offset += 2
+            continue
+        if marker in (0xD9, 0xDA):  # End of image / start of scan, no SOF found
+            return None
+
+        segment_length = struct.unpack('>H', data[offset + 2:offset + 4])[0]
+        if marker in JPEG_SOF_MARKERS:
+            if offset + 9 > len(data):
+                return None
+            height, width = struct.unpack('>HH', data[offset + 5:offset + 9])
+            return width, height
+        offset += 2 + segment_length
+
+    return None
+
+
+def decode_flags(buffer, target_size: int = DECODE_TARGET_SIZE) -> int:
+    """
+    Pick the imdecode flag that scales an image down as far as possible
+    while its longer side stays at or above ``target_size``.
+
+    Args:
+        buffer: Encoded image
+        target_size: Minimum longer side after decoding (0 disables scaling)
+
+    Returns:
+        cv2.IMREAD_COLOR or one of the cv2.IMREAD_REDUCED_COLOR_* flags
+    """
+    if target_size <= 0:
+        return cv2.IMREAD_COLOR
+
+    dimensions = image_dimensions(buffer)
+    if dimensions is None:
+        return cv2.IMREAD_COLOR
+
+    longer_side = max(dimensions)
+    for factor, flag in REDUCED_DECODE_FLAGS:
+        if longer_side // factor >= target_size:
+            return flag
+    return cv2.IMREAD_COLOR
+
+
+def decode_image_buffer(buffer, rgb: bool = False, target_size: int = DECODE_TARGET_SIZE) -> Optional[np.ndarray]:
+    """
+    Decode an encoded (JPEG/PNG) image without copying the input buffer.
+    Images much larger than ``target_size`` are decoded at reduced resolution
+    (see DECODE_TARGET_SIZE).
+
+    Args:
+        buffer: bytes, bytearray or memoryview with the encoded image
+        rgb: Convert to RGB in place, so no second full-size copy is made
+        target_size: Minimum longer side after decoding (0 for full resolution)
+
+    Returns:
+        Image as numpy array (BGR format, or RGB with ``rgb``), or None if
+        decoding fails
+    """
+    with timed("imdecode"):
+        flags = decode_flags(buffer, target_size)
+        image = cv2.imdecode(np.frombuffer(buffer, np.uint8), flags)
+    if image is None or image.size == 0:
+        return None
+
+    if flags != cv2.IMREAD_COLOR:
+        logger.debug(f"Decoded image at reduced resolution: {image.shape[1]}x{image.shape[0]}")
+
+    if rgb:
+        with timed("color_convert"):
+            cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+    return image
+
+
+def raw_rgb_frame(buffer, width: int, height: int) -> np.ndarray:
+    """
+    View an uncompressed, row-major RGB buffer as an image (no copy).
+
+    Args:
+        buffer: Buffer of exactly width * height * 3 bytes
+        width: Frame width in pixels
+        height: Frame height in pixels
+
+    Returns:
+        Image as numpy array of shape (height, width, 3) in RGB order
+
+    Raises:
+        ValueError: If the buffer size does not match the dimensions
+    """
+    expected = width * height * 3
+    if len(buffer) != expected:
+        raise ValueError(f"Raw frame is {len(buffer)} bytes, expected {expected} for {width}x{height} RGB")
+    return np.frombuffer(buffer, np.uint8).reshape(height, width, 3)
+
+
+def data_uri_size(image_data_base64: str) -> int:
+    """
+    Bound the decoded size of a base64 data URI without decoding it
+    (base64 inflates by 4/3), so oversized images are rejected up front.
+
+    Args:
+        image_data_base64: String like "data:image/jpeg;base64,..."
+
+    Returns:
+        Maximum number of bytes the payload decodes to
+    """
+    return (len(image_data_base64) - image_data_base64.find(',') - 1) * 3 // 4
+
+
+def read_data_uri(image_data_base64) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Validate a base64 data URI and decode it to encoded image bytes.
+    The size limit is checked on the encoded length, before decoding.
+
+    Args:
+        image_data_base64: Client value, expected "data:image/...;base64,..."
+
+    Returns:
+        Tuple of (image_bytes, error_message); image_bytes is None on error
+    """
+    if not isinstance(image_data_base64, str) or not image_data_base64.startswith('data:image'):
+        logger.error("Invalid base64 image format")
+        return None, "Invalid base64 image format."
+
+    logger.debug(f"Received base64 image data with length: {len(image_data_base64)}")
+
+    if data_uri_size(image_data_base64) > MAX_FILE_SIZE:
+        logger.error("Base64 image size exceeds limit")
+        return None, IMAGE_TOO_LARGE
+
+    try:
+        return decode_data_uri(image_data_base64), None
+    except Exception as e:
+        logger.error(f"Error decoding base64 image: {str(e)}")
+        return None, f"Error decoding base64 image: {str(e)}"
+
+
+def decode_data_uri(image_data_base64: str) -> bytes:
+    """
+    Strip the data URI prefix from a base64 image string and decode it.
+
+    Args:
+        image_data_base64: String like "data:image/jpeg;base64,..."
+
+    Returns:
+        Encoded image bytes
+    """
+    with timed("base64_decode"):
+        return base64.b64decode(image_data_base64.split(',')[1])
@@ -0,0 +1,190 @@
+"""
+Logging configuration module for ASL sign language recognition.
+Sends records through a queue to a background writer thread, so request
+threads never block on log I/O, with optional JSON output, per-logger
+(per-stage) levels and per-request sampling of routine records.
+"""
+
+import os
+import re
+import json
+import uuid
+import queue
+import atexit
+import random
+import logging
+import threading
+import contextvars
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional, Tuple
+
+# Logging configuration (overridable through environment variables)
+# LOG_LEVEL: root log level
+# LOG_LEVELS: per-logger levels, e.g. "utils.feature_extraction=DEBUG,utils.predict=WARNING"
+# LOG_FORMAT: "text" (human readable) or "json" (one object per line)
+# LOG_SAMPLE_RATE: fraction of requests whose DEBUG/INFO records are written;
+#   warnings and errors are always written
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'text').lower()
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 1.0))
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Client-supplied request ids are echoed into every log record and the
+# response header, so anything else is replaced by a generated id
+REQUEST_ID_PATTERN = re.compile(r'[A-Za-z0-9._:-]{1,64}')
+
+# Per-request logging context; outside a request everything is sampled
+_request_id = contextvars.ContextVar('log_request_id', default=None)
+_sampled = contextvars.ContextVar('log_sampled', default=True)
+
+# Background writer (one per process)
+_listener = None
+_queue_handler = None
+_configure_lock = threading.Lock()
+
+
+def begin_request(request_id: Optional[str] = None) -> Tuple[contextvars.Token, contextvars.Token]:
+    """
+    Start the logging context of a request: assign a request id and decide
+    whether its routine records are sampled.
+
+    Args:
+        request_id: Id sent by the client (X-Request-Id), or None to generate
+                    one; ids not matching REQUEST_ID_PATTERN are replaced too
+
+    Returns:
+        Tokens to pass to end_request()
+    """
+    if not request_id or not REQUEST_ID_PATTERN.fullmatch(request_id):
+        request_id = uuid.uuid4().hex[:16]
+    sampled = LOG_SAMPLE_RATE >= 1.0 or random.random() < LOG_SAMPLE_RATE
+    return _request_id.set(request_id), _sampled.set(sampled)
+
+
+def end_request(tokens: Tuple[contextvars.Token, contextvars.Token]):
+    """Restore the logging context from before begin_request()."""
+    request_token, sampled_token = tokens
+    _request_id.reset(request_token)
+    _sampled.reset(sampled_token)
+
+
+def current_request_id() -> Optional[str]:
+    """Id of the request being handled in this context, if any."""
+    return _request_id.get()
+
+
+def log_enabled(logger: logging.Logger, level: int) -> bool:
+    """
+    Check whether a record would actually be written, including request
+    sampling. Use it to skip work done only to build a log message.
+
+    Args:
+        logger: Logger the record would go to
+        level: Record level
+
+    Returns:
+        True if the record would be written
+    """
+    return logger.isEnabledFor(level) and (level >= logging.WARNING or _sampled.get())
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Drop routine records of unsampled requests and tag records with the
+    request id. Runs in the thread that logs, before the record is queued,
+    where the request context is set.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING and not _sampled.get():
+            return False
+        record.request_id = _request_id.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, 'request_id', None),
+            "process": record.process,
+            "thread": record.threadName
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def _parse_levels(spec: str) -> List[Tuple[str, str]]:
+    """Parse LOG_LEVELS ("name=LEVEL,name=LEVEL") into (name, level) pairs."""
+    levels = []
+    for item in spec.split(','):
+        name, _, level = item.strip().partition('=')
+        if name and level:
+            levels.append((name.strip(), level.strip().upper()))
+    return levels
+
+
+def configure_logging():
+    """
+    Set up process-wide logging (replaces logging.basicConfig in the apps).
+
+    Records go through a QueueHandler to a QueueListener thread that formats
+    and writes them to stderr. Like basicConfig, it does nothing if the root
+    logger already has handlers; per-logger levels are applied either way.
+    """
+    global _listener, _queue_handler
+
+    with _configure_lock:
+        for name, level in _parse_levels(LOG_LEVELS):
+            logging.getLogger(name).setLevel(level)
+
+        root = logging.getLogger()
+        if _listener is not None or root.handlers:
+            return
+
+        handler = logging.StreamHandler()
+        handler.setFormatter(JsonFormatter() if LOG_FORMAT == 'json' else logging.Formatter(TEXT_FORMAT))
+
+        log_queue = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter())
+
+        root.setLevel(LOG_LEVEL)
+        root.addHandler(_queue_handler)
+
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """
+    Flush queued records and stop the writer thread. Later records (e.g.
+    from other exit handlers) are written directly.
+    """
+    global _listener, _queue_handler
+
+    with _configure_lock:
+        listener, _listener = _listener, None
+        queue_handler, _queue_handler = _queue_handler, None
+
+    if listener is None:
+        return
+
+    listener.stop()
+
+    root = logging.getLogger()
+    root.removeHandler(queue_handler)
+    for handler in listener.handlers:
+        handler.addFilter(SamplingFilter())
+        root.addHandler(handler)
@@ -0,0 +1,310 @@
+"""
+Metrics module for ASL sign language recognition.
+Lightweight, thread-safe histograms for recording latencies and sizes, and a
+registry of labeled counters, gauges and histograms exported at /api/metrics
+in the Prometheus text format.
+
+Metrics live in process memory, so under gunicorn each worker reports its
+own values; scrape the workers individually or aggregate by instance.
+"""
+
+import os
+import time
+import threading
+from bisect import bisect_left
+from typing import Dict, Sequence, Tuple
+
+# Bucket upper bounds for latencies in milliseconds
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Same bounds in seconds, the Prometheus convention for exported latencies
+LATENCY_BUCKETS_SECONDS = tuple(bound / 1000 for bound in LATENCY_BUCKETS_MS)
+
+# METRICS: record exported metrics (/api/metrics keeps answering, without samples, when off)
+METRICS_ENABLED = os.getenv('METRICS', 'true').lower() in ('1', 'true', 'yes')
+
+# Content type of the Prometheus text exposition format
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram (Prometheus semantics: a value is counted in
+    the first bucket whose upper bound is >= the value).
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)  # last slot is +Inf
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one value."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def snapshot(self) -> dict:
+        """
+        Get the current histogram state.
+
+        Returns:
+            Dictionary with cumulative bucket counts, total count, sum and mean
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            value_sum = self._sum
+
+        cumulative = {}
+        running = 0
+        for bound, count in zip(self.buckets, counts):
+            running += count
+            cumulative[str(bound)] = running
+        cumulative["+Inf"] = total
+
+        return {
+            "buckets": cumulative,
+            "count": total,
+            "sum": value_sum,
+            "mean": value_sum / total if total else 0.0
+        }
+
+
+def _escape(value) -> str:
+    """Escape a label value for the text format."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    """Render a label set like {stage="predict",le="0.1"}."""
+    pairs = [
+        f'{name}="{_escape(value)}"'
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    """Base class: a named metric family with optional labels."""
+
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _check_labels(self, values: Tuple[str, ...]):
+        if len(values) != len(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {values}")
+
+    def samples(self) -> list:
+        """Return (suffix, label string, value) tuples for rendering."""
+        with self._lock:
+            return [
+                ("", _format_labels(self.labels, key), value)
+                for key, value in sorted(self._values.items())
+            ]
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (requests, frames by status, ...)."""
+
+    type_name = "counter"
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        """
+        Increase the counter.
+
+        Args:
+            label_values: One value per label name, in order
+            amount: Increment (must not be negative)
+        """
+        if not METRICS_ENABLED:
+            return
+        self._check_labels(label_values)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (in-flight requests, ...)."""
+
+    type_name = "gauge"
+
+    def inc(self, *label_values: str, amount: float = 1.0):
+        """Increase the gauge by ``amount``."""
+        if not METRICS_ENABLED:
+            return
+        self._check_labels(label_values)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, *label_values: str, amount: float = 1.0):
+        """Decrease the gauge by ``amount``."""
+        self.inc(*label_values, amount=-amount)
+
+    def set(self, value: float, *label_values: str):
+        """Set the gauge to ``value``."""
+        if not METRICS_ENABLED:
+            return
+        self._check_labels(label_values)
+        with self._lock:
+            self._values[label_values] = float(value)
+
+
+class HistogramFamily(_Metric):
+    """
+    Labeled histogram: one Histogram per label set. Buckets are only made
+    cumulative when rendered, so observe() stays a bisect and one locked
+    increment.
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Tuple[str, ...] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS_SECONDS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *label_values: str):
+        """
+        Record one observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms)
+            label_values: One value per label name, in order
+        """
+        if not METRICS_ENABLED:
+            return
+        self._check_labels(label_values)
+        histogram = self._values.get(label_values)
+        if histogram is None:
+            with self._lock:
+                histogram = self._values.setdefault(label_values, Histogram(self.buckets))
+        histogram.observe(value)
+
+    def samples(self) -> list:
+        with self._lock:
+            children = sorted(self._values.items())
+
+        samples = []
+        for key, histogram in children:
+            snapshot = histogram.snapshot()
+            for bound, count in snapshot["buckets"].items():
+                samples.append(("_bucket", _format_labels(self.labels, key, f'le="{bound}"'), count))
+            labels = _format_labels(self.labels, key)
+            samples.append(("_sum", labels, snapshot["sum"]))
+            samples.append(("_count", labels, snapshot["count"]))
+        return samples
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Add a metric family.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered
+        """
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text, ending with a newline
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+# Process-wide registry and the pipeline's metrics
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(HistogramFamily(
+    "asl_stage_duration_seconds",
+    "Time spent in each processing stage",
+    labels=("stage",)
+))
+FRAMES = REGISTRY.register(Counter(
+    "asl_frames_total",
+    "Single frames (translate, realtime, stream) by result status: success, no_hand or error",
+    labels=("status",)
+))
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "asl_http_requests_total",
+    "HTTP requests by route and status code",
+    labels=("route", "code")
+))
+HTTP_REQUEST_SECONDS = REGISTRY.register(HistogramFamily(
+    "asl_http_request_duration_seconds",
+    "HTTP request latency by route",
+    labels=("route",)
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "asl_http_requests_in_flight",
+    "HTTP requests currently being handled"
+))
+
+
+class timed:
+    """
+    Context manager that records the duration of a pipeline stage.
+
+    Usage:
+        with timed("imdecode"):
+            image = cv2.imdecode(...)
+    """
+
+    __slots__ = ("stage", "start")
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        STAGE_SECONDS.observe(time.perf_counter() - self.start, self.stage)
+        return False
+
+
+def render_metrics() -> str:
+    """Render the process-wide registry (see MetricsRegistry.render)."""
+    return REGISTRY.render()
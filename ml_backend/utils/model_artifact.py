@@ -0,0 +1,202 @@
+"""
+Model artifact module for ASL sign language recognition.
+Exports the RandomForest to a flat, versioned binary file and loads it back
+through a read-only memory map, so all workers on a host share one copy of
+the model in the page cache.
+
+File layout:
+    MAGIC (8 bytes) | format version (uint32 LE) | header length (uint32 LE)
+    | JSON header | zero padding | arrays, each aligned to ARRAY_ALIGNMENT
+
+Usage:
+    python -m utils.model_artifact export models/model.p models/model.forest
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import pickle
+import struct
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from utils.compiled_forest import CompiledForest, verify_compiled
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+MAGIC = b"ASLFRST\x00"
+FORMAT_VERSION = 1
+ARRAY_ALIGNMENT = 64
+
+# Arrays stored in the artifact, in file order
+ARRAY_NAMES = ("feature", "threshold", "children", "leaf_value", "roots")
+
+_PREAMBLE = struct.Struct("<8sII")
+
+
+def is_forest_artifact(path) -> bool:
+    """
+    Check whether a file is a forest artifact (as opposed to a pickle).
+
+    Args:
+        path: Path to the model file
+
+    Returns:
+        True if the file starts with the artifact magic bytes
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _aligned(offset: int) -> int:
+    return (offset + ARRAY_ALIGNMENT - 1) // ARRAY_ALIGNMENT * ARRAY_ALIGNMENT
+
+
+def export_artifact(compiled: CompiledForest, path, source: str = None):
+    """
+    Write a compiled forest to a forest artifact file.
+    The file is written next to the target and renamed into place, so readers
+    never see a partially written artifact.
+
+    Args:
+        compiled: CompiledForest to export
+        path: Destination path
+        source: Optional description of where the model came from
+    """
+    arrays = {name: np.ascontiguousarray(getattr(compiled, name)) for name in ARRAY_NAMES}
+
+    # Offsets are relative to the start of the data section
+    layout = {}
+    offset = 0
+    for name, array in arrays.items():
+        offset = _aligned(offset)
+        layout[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset
+        }
+        offset += array.nbytes
+
+    header = {
+        "format_version": FORMAT_VERSION,
+        "n_features": compiled.n_features_in_,
+        "n_estimators": compiled.n_estimators,
+        "tree_depth": compiled.tree_depth,
+        "max_depth": compiled.max_depth,
+        "classes": np.asarray(compiled.classes_).tolist(),
+        "arrays": layout,
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "source": source
+    }
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = _aligned(_PREAMBLE.size + len(header_bytes))
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays.items():
+            f.write(b"\0" * (data_start + layout[name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+
+    os.replace(tmp_path, path)
+    logger.info(f"Exported forest artifact to {path} ({path.stat().st_size / (1024 * 1024):.1f}MB)")
+
+
+def load_artifact(path) -> CompiledForest:
+    """
+    Memory-map a forest artifact read-only and build a CompiledForest whose
+    arrays are views into the mapping (no copies, shared page cache).
+
+    Args:
+        path: Path to the artifact file
+
+    Returns:
+        CompiledForest instance
+
+    Raises:
+        ValueError: If the file is not a supported forest artifact
+    """
+    with open(path, 'rb') as f:
+        # The mapping stays valid after the file is closed
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, header_length = _PREAMBLE.unpack_from(mapped, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a forest artifact")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported forest artifact version {version} (expected {FORMAT_VERSION})")
+
+    header = json.loads(mapped[_PREAMBLE.size:_PREAMBLE.size + header_length].decode('utf-8'))
+    data_start = _aligned(_PREAMBLE.size + header_length)
+
+    arrays = {}
+    for name in ARRAY_NAMES:
+        spec = header["arrays"][name]
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"]))
+        arrays[name] = np.frombuffer(
+            mapped, dtype=dtype, count=count, offset=data_start + spec["offset"]
+        ).reshape(spec["shape"])
+
+    compiled = CompiledForest(
+        feature=arrays["feature"],
+        threshold=arrays["threshold"],
+        children=arrays["children"],
+        leaf_value=arrays["leaf_value"],
+        roots=arrays["roots"],
+        classes=np.asarray(header["classes"]),
+        n_features=header["n_features"],
+        tree_depth=header["tree_depth"],
+        max_depth=header["max_depth"]
+    )
+    # Keep the mapping alive for as long as the forest is in use
+    compiled.mapping = mapped
+
+    logger.info(f"Memory-mapped forest artifact from {path} "
+                f"({compiled.n_estimators} trees, format v{version})")
+
+    return compiled
+
+
+def export_from_pickle(pickle_path, artifact_path):
+    """
+    Convert a pickled {'model': RandomForestClassifier} file into a forest
+    artifact, checking that the exported forest matches predict_proba.
+
+    Args:
+        pickle_path: Path to the pickle model file
+        artifact_path: Destination path for the artifact
+
+    Raises:
+        ValueError: If the exported artifact does not reproduce the model
+    """
+    with open(pickle_path, 'rb') as f:
+        model = pickle.load(f)['model']
+
+    export_artifact(CompiledForest.from_sklearn(model), artifact_path, source=Path(pickle_path).name)
+
+    if not verify_compiled(load_artifact(artifact_path), model):
+        raise ValueError("Exported artifact does not match the pickled model's predict_proba")
+
+    logger.info("Artifact verified against predict_proba")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if len(sys.argv) != 4 or sys.argv[1] != "export":
+        print("Usage: python -m utils.model_artifact export <model.p> <model.forest>")
+        sys.exit(2)
+
+    export_from_pickle(sys.argv[2], sys.argv[3])
@@ -0,0 +1,150 @@
+"""
+Model reload module for ASL sign language recognition.
+Watches the model file for changes and checks a newly loaded model (input
+width, classes, a warm-up prediction) before utils/predict.py swaps it in,
+so a new model can be deployed without restarting the workers.
+"""
+
+import os
+import hmac
+import hashlib
+import logging
+import threading
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Reload configuration (overridable through environment variables)
+# MODEL_WATCH_INTERVAL: seconds between checks of MODEL_PATH for a new file (0 = do not watch)
+# MODEL_RELOAD_TOKEN: token required by POST /api/model/reload (unset = endpoint disabled)
+MODEL_WATCH_INTERVAL = float(os.getenv('MODEL_WATCH_INTERVAL', 5))
+MODEL_RELOAD_TOKEN = os.getenv('MODEL_RELOAD_TOKEN', '')
+
+# Rows pushed through a new model before it serves requests
+WARMUP_ROWS = 8
+
+
+def file_hash(path) -> str:
+    """
+    Hash a model file's content.
+
+    Args:
+        path: Model file
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_signature(path) -> Optional[Tuple[int, int, int]]:
+    """
+    Cheap change check for a file: (inode, size, modification time).
+
+    Returns:
+        Signature tuple, or None if the file does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def validate_model(model, n_features: int, classes: List[str]):
+    """
+    Check that a loaded model can replace the active one, and warm it up.
+
+    Args:
+        model: Loaded RandomForestClassifier or CompiledForest
+        n_features: Expected input width
+        classes: Class labels the predictions are mapped to
+
+    Raises:
+        ValueError: If the model does not fit the features or classes, or
+                    its warm-up prediction is not a probability distribution
+    """
+    if not hasattr(model, 'predict_proba'):
+        raise ValueError("Model has no predict_proba")
+
+    model_features = getattr(model, 'n_features_in_', n_features)
+    if model_features != n_features:
+        raise ValueError(f"Model expects {model_features} features, the pipeline produces {n_features}")
+
+    model_classes = getattr(model, 'classes_', None)
+    if model_classes is not None:
+        if len(model_classes) != len(classes):
+            raise ValueError(f"Model has {len(model_classes)} classes, expected {len(classes)}")
+        if model_classes.dtype.kind in 'US' and list(model_classes) != list(classes):
+            raise ValueError("Model class labels do not match CLASSES")
+
+    # The first calls are slow (lazy allocation, page faults on mapped artifacts)
+    rows = np.random.default_rng(0).random((WARMUP_ROWS, n_features))
+    probabilities = model.predict_proba(rows)
+    model.predict_proba(rows[:1])
+
+    if probabilities.shape != (WARMUP_ROWS, len(classes)):
+        raise ValueError(f"Warm-up prediction has shape {probabilities.shape}, "
+                         f"expected {(WARMUP_ROWS, len(classes))}")
+    if not np.isfinite(probabilities).all() or not np.allclose(probabilities.sum(axis=1), 1.0, atol=1e-3):
+        raise ValueError("Warm-up prediction is not a probability distribution")
+
+
+def reload_token_valid(token: Optional[str]) -> bool:
+    """
+    Check the admin token of a reload request (constant-time comparison).
+
+    Args:
+        token: Token sent by the client (X-Admin-Token header)
+
+    Returns:
+        True if reloading over HTTP is enabled and the token matches
+    """
+    if not MODEL_RELOAD_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode('utf-8'), MODEL_RELOAD_TOKEN.encode('utf-8'))
+
+
+class ModelFileWatcher:
+    """
+    Background thread that polls a model file and calls ``on_change`` when
+    it was replaced. Deploy new models by writing a temporary file and
+    renaming it over MODEL_PATH: a file still being written fails validation
+    and is retried at its next change.
+    """
+
+    def __init__(self, path, on_change: Callable[[], None], interval: float = MODEL_WATCH_INTERVAL):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+
+        self._signature = file_signature(path)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="model-watcher", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        logger.info(f"Watching {self.path} for model changes every {self.interval:g}s")
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            signature = file_signature(self.path)
+            if signature is None or signature == self._signature:
+                continue
+            self._signature = signature
+
+            try:
+                self.on_change()
+            except Exception as e:
+                logger.error(f"Model reload after file change failed: {str(e)}")
+
+    def stop(self):
+        """Stop polling (does not wait for a reload in progress)."""
+        self._stop.set()
@@ -0,0 +1,129 @@
+"""
+Motion gating module for ASL sign language recognition.
+Compares each realtime frame with the last fully processed frame of the same
+session on a tiny grayscale thumbnail, and reuses that frame's result while
+the scene has not changed, skipping MediaPipe and the model.
+"""
+
+import os
+import logging
+import threading
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Gate configuration (overridable through environment variables)
+# MOTION_GATING: enable the gate for realtime session frames
+# MOTION_THRESHOLD: mean absolute difference (in 0-255 gray levels) between
+#   thumbnails below which a frame counts as unchanged; higher is less sensitive
+# MOTION_MAX_REUSE: consecutive frames that may reuse one result before a
+#   frame is processed again regardless of motion
+MOTION_GATING = os.getenv('MOTION_GATING', 'true').lower() in ('1', 'true', 'yes')
+MOTION_THRESHOLD = float(os.getenv('MOTION_THRESHOLD', 2.0))
+MOTION_MAX_REUSE = int(os.getenv('MOTION_MAX_REUSE', 5))
+
+# Thumbnail size (width, height); small enough that sensor noise averages out
+THUMBNAIL_SIZE = (32, 24)
+
+
+def motion_thumbnail(image: np.ndarray, is_rgb: bool = False) -> np.ndarray:
+    """
+    Downscale a frame to a small grayscale thumbnail for motion comparison.
+
+    Args:
+        image: Decoded image (BGR, or RGB with ``is_rgb``)
+        is_rgb: True if a 3-channel image is in RGB order
+
+    Returns:
+        Thumbnail as a float32 array of shape (24, 32)
+    """
+    if image.ndim == 2:
+        gray = image
+    elif image.shape[2] == 4:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+    else:
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY if is_rgb else cv2.COLOR_BGR2GRAY)
+
+    return cv2.resize(gray, THUMBNAIL_SIZE, interpolation=cv2.INTER_AREA).astype(np.float32)
+
+
+class MotionGate:
+    """
+    Per-session pre-filter that decides whether a frame needs inference.
+
+    The reference is the last frame that was actually processed, not the
+    previous frame, so slow drift still adds up to a change. After
+    ``max_reuse`` reused frames in a row the next frame is processed anyway,
+    so a stale result is always re-verified. A result is only reused for
+    the model generation it was computed with, so a reloaded model is not
+    answered with the previous model's prediction.
+    """
+
+    def __init__(self, threshold: float = MOTION_THRESHOLD, max_reuse: int = MOTION_MAX_REUSE):
+        self.threshold = threshold
+        self.max_reuse = max_reuse
+
+        self._reference = None
+        self._result = None
+        self._probabilities = None
+        self._reused = 0
+        self._generation = None
+        self._lock = threading.Lock()
+
+    def check(self, thumbnail: np.ndarray, generation: int = 0) -> Optional[Tuple[dict, Optional[np.ndarray]]]:
+        """
+        Decide whether a frame can reuse the last processed result.
+
+        Args:
+            thumbnail: Thumbnail of the new frame from motion_thumbnail()
+            generation: Generation of the active model (see predict.model_generation)
+
+        Returns:
+            Tuple of (result, probabilities) to reuse, or None if the frame
+            must be processed
+        """
+        with self._lock:
+            if self._reference is None or self._reference.shape != thumbnail.shape:
+                return None
+            if self._generation != generation:
+                return None
+            if self._reused >= self.max_reuse:
+                return None
+
+            change = float(np.mean(np.abs(thumbnail - self._reference)))
+            if change >= self.threshold:
+                return None
+
+            self._reused += 1
+            return self._result, self._probabilities
+
+    def update(self, thumbnail: np.ndarray, result: dict, probabilities: Optional[np.ndarray],
+               generation: int = 0):
+        """
+        Record a processed frame as the new reference.
+
+        Args:
+            thumbnail: Thumbnail of the processed frame
+            result: Pipeline result without per-session fields
+            probabilities: Class probabilities, or None if no hand was found
+            generation: Model generation read before the frame was processed
+        """
+        with self._lock:
+            self._reference = thumbnail
+            self._result = result
+            self._probabilities = probabilities
+            self._reused = 0
+            self._generation = generation
+
+    def reset(self):
+        """Forget the reference frame, so the next frame is processed."""
+        with self._lock:
+            self._reference = None
+            self._result = None
+            self._probabilities = None
+            self._reused = 0
+            self._generation = None
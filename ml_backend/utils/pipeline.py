@@ -0,0 +1,227 @@
+"""
+Translation pipeline module for ASL sign language recognition.
+Framework-independent extract -> predict steps shared by the Flask app (app.py)
+and the ASGI app (asgi_app.py), so both return the same response schema.
+"""
+
+import logging
+import numpy as np
+from typing import Optional, Tuple
+from utils.feature_extraction import extract_hand_landmarks
+from utils.frame_cache import get_frame_cache, frame_key, perceptual_hash
+from utils.image_io import decode_image_buffer, raw_rgb_frame
+from utils.metrics import FRAMES, timed
+from utils.motion_gate import MOTION_GATING, motion_thumbnail
+from utils.predict import predict_sign_with_probabilities, model_generation
+from utils.process_pool import get_extraction_pool
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+
+def extraction_error_result(error_info: dict) -> dict:
+    """
+    Build the response for a frame where feature extraction did not succeed.
+    
+    Args:
+        error_info: Error info returned by extract_hand_landmarks
+        
+    Returns:
+        Dictionary with no_hand or error status
+    """
+    # Handle no hand detected (not an error, just no hand in frame)
+    if error_info.get("status") == "no_hand":
+        logger.info("No hand detected in frame")
+        return {
+            "status": "no_hand",
+            "message": error_info.get("message", "No hand detected"),
+            "predicted_sign": None,
+            "confidence": 0.0
+        }
+    
+    # Handle actual errors
+    error_msg = error_info.get("message", "Feature extraction failed")
+    logger.error(f"Feature extraction error: {error_msg}")
+    return {
+        "status": "error",
+        "error": error_msg,
+        "predicted_sign": None,
+        "confidence": 0.0
+    }
+
+
+def extract_landmarks(image: np.ndarray, session=None, is_rgb: bool = False) -> tuple:
+    """
+    Extract hand landmarks, offloading stateless frames to the extraction
+    process pool when it is enabled (EXTRACT_PROCESSES > 0). Session frames
+    stay in-process because their landmark tracker is per-session state.
+    
+    Returns:
+        Tuple of (features, error_info) - same as extract_hand_landmarks()
+    """
+    pool = get_extraction_pool()
+    if pool is not None and session is None:
+        # Stages inside the worker process are not visible here, so the
+        # round trip (queueing, copy, MediaPipe) is recorded as one stage
+        with timed("extraction_pool"):
+            return pool.extract(image, is_rgb=is_rgb)
+    return extract_hand_landmarks(image, session=session, is_rgb=is_rgb)
+
+
+def _process_decoded(image: np.ndarray, session=None, is_rgb: bool = False) -> Tuple[dict, Optional[np.ndarray]]:
+    """
+    Extract features and make a prediction for one decoded frame.
+    
+    Returns:
+        Tuple of (result, probabilities); the result has no per-session
+        fields yet and probabilities is None unless a sign was predicted
+    """
+    try:
+        # Step 1: Extract hand landmarks (42 features)
+        features, error_info = extract_landmarks(image, session=session, is_rgb=is_rgb)
+        
+        # Handle no hand detected and actual errors
+        if error_info:
+            return extraction_error_result(error_info), None
+        
+        # Step 2: Make prediction using RandomForest model
+        logger.debug("Making prediction with extracted features")
+        prediction_stats = {}
+        predicted_sign, confidence, probabilities = predict_sign_with_probabilities(features, prediction_stats)
+        
+        logger.info(f"Prediction successful: {predicted_sign} (confidence: {confidence:.4f})")
+        
+        # Return result
+        result = {
+            "status": "success",
+            "predicted_sign": predicted_sign,
+            "confidence": float(confidence)
+        }
+        # Early-exit evaluation reports how much of the forest was scored
+        if "trees_evaluated" in prediction_stats:
+            result["trees_evaluated"] = prediction_stats["trees_evaluated"]
+        return result, probabilities
+        
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Error in process_image: {error_message}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return {
+            "status": "error",
+            "error": f"Processing failed: {error_message}",
+            "predicted_sign": None,
+            "confidence": 0.0
+        }, None
+
+
+def _session_result(result: dict, probabilities: Optional[np.ndarray], session=None) -> dict:
+    """
+    Add the realtime session's temporally smoothed output and committed text.
+    A frame without a hand ends the current letter for the session decoder.
+    """
+    result = dict(result)
+    if session is not None:
+        if result["status"] == "success":
+            result["sequence"] = session.decode(probabilities)
+        elif result["status"] == "no_hand":
+            result["sequence"] = session.decode(None)
+    return result
+
+
+def process_image(image: np.ndarray, session=None, is_rgb: bool = False) -> dict:
+    """
+    Common processing function for both endpoints.
+    Extracts features and makes prediction.
+    
+    Args:
+        image: Input image as numpy array (BGR format)
+        session: Optional RealtimeSession for tracked realtime frames
+        is_rgb: True if the image is already in RGB order (raw frames)
+        
+    Returns:
+        Dictionary with prediction results or error information
+    """
+    result, probabilities = _process_decoded(image, session=session, is_rgb=is_rgb)
+    return _session_result(result, probabilities, session)
+
+
+def process_frame(buffer, session=None, raw_size: Optional[Tuple[int, int]] = None,
+                  decode_error: str = "Invalid image file") -> dict:
+    """
+    Decode and process one frame exactly as the client sent it.
+    Repeated frames are answered from the frame cache (see utils/frame_cache.py)
+    without decoding or running MediaPipe; near-duplicates are matched within
+    a session when enabled. Session frames that barely differ from the last
+    processed frame reuse its result, marked with "reused" (see
+    utils/motion_gate.py).
+    
+    Args:
+        buffer: Encoded JPEG/PNG bytes, or a raw RGB buffer with ``raw_size``
+        session: Optional RealtimeSession for tracked realtime frames
+        raw_size: (width, height) of a raw RGB frame, None for encoded images
+        decode_error: Error message if the image cannot be decoded
+        
+    Returns:
+        Dictionary with prediction results or error information (same
+        format as process_image)
+    """
+    result = _process_frame(buffer, session, raw_size, decode_error)
+    FRAMES.inc(result["status"])
+    return result
+
+
+def _process_frame(buffer, session, raw_size: Optional[Tuple[int, int]], decode_error: str) -> dict:
+    """Body of process_frame(); every outcome returns through the caller's counter."""
+    cache = get_frame_cache()
+    scope = session.session_id if session is not None else None
+    
+    key = None
+    if cache is not None:
+        key = frame_key(buffer, raw_size)
+        entry = cache.get(scope, key)
+        if entry is not None:
+            logger.info("Repeated frame, using cached result")
+            return _session_result(entry.result, entry.probabilities, session)
+    
+    # Raw frames are RGB already, encoded images are converted while decoding,
+    # so MediaPipe gets the frame without another full-size copy
+    is_rgb = True
+    image = raw_rgb_frame(buffer, *raw_size) if raw_size is not None else decode_image_buffer(buffer, rgb=True)
+    if image is None:
+        logger.error("Failed to decode image frame")
+        return {"status": "error", "error": decode_error}
+    
+    logger.debug(f"Decoded frame: {image.shape}")
+    
+    phash = None
+    if cache is not None and cache.near_duplicates and scope is not None:
+        phash = perceptual_hash(image, is_rgb)
+        entry = cache.get_near(scope, phash)
+        if entry is not None:
+            logger.info("Near-duplicate frame, using cached result")
+            return _session_result(entry.result, entry.probabilities, session)
+    
+    thumbnail = None
+    if MOTION_GATING and session is not None:
+        # Read before processing, so a reload during this frame invalidates its result
+        generation = model_generation()
+        thumbnail = motion_thumbnail(image, is_rgb)
+        reused = session.motion.check(thumbnail, generation)
+        if reused is not None:
+            logger.info("No motion since last processed frame, reusing its result")
+            with session.lock:
+                session.reused_frames += 1
+            result, probabilities = reused
+            return _session_result(dict(result, reused=True), probabilities, session)
+    
+    result, probabilities = _process_decoded(image, session=session, is_rgb=is_rgb)
+    
+    # Errors may be transient (busy pool, timeouts), so only outcomes are cached
+    if result["status"] != "error":
+        if cache is not None:
+            cache.put(scope, key, result, probabilities, phash)
+        if thumbnail is not None:
+            session.motion.update(thumbnail, result, probabilities, generation)
+    
+    return _session_result(result, probabilities, session)
@@ -3,13 +3,25 @@ Model prediction module for ASL sign language recognition.
 Loads the trained RandomForestClassifier and makes predictions on hand landmark features.
 """
 
+import atexit
 import pickle
 import numpy as np
 import os
 import logging
 from pathlib import Path
 import threading
-from typing import Tuple, List
+import time
+from datetime import datetime, timezone
+from typing import Tuple, List, Optional
+from utils.batching import MicroBatcher, BATCHING_ENABLED
+from utils.compiled_forest import CompiledForest, verify_compiled
+from utils.early_exit import EarlyExitEvaluator, EARLY_EXIT_ENABLED, CASCADE_TREES, supports_early_exit
+from utils.frame_cache import get_frame_cache
+from utils.log_config import log_enabled
+from utils.metrics import timed
+from utils.model_artifact import is_forest_artifact, load_artifact
+from utils.model_reload import MODEL_WATCH_INTERVAL, ModelFileWatcher, file_hash, validate_model
+from utils.prediction_cache import PredictionCache, PREDICTION_CACHE_SIZE
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -25,26 +37,126 @@ CLASSES = [
 # Confidence threshold - predictions below this will be rejected
 CONFIDENCE_THRESHOLD = 0.5
 
+# Inference backend: "sklearn" uses the unpickled forest as-is, "compiled"
+# flattens it into NumPy arrays for lower per-call latency (see utils/compiled_forest.py)
+MODEL_BACKEND = os.getenv('MODEL_BACKEND', 'sklearn').lower()
+
 # Global model cache
 _model = None
+_model_format = None
 _model_lock = threading.Lock()
 
+# Active model metadata (version, content hash, load time) and hot reload state
+_model_details = {}
+_reload_count = 0
+_reload_lock = threading.Lock()
+_watcher = None
+
+# Global micro-batcher (created on first prediction when enabled)
+_batcher = None
+_batcher_lock = threading.Lock()
+
+# Global landmark-level prediction cache (created on first prediction when enabled)
+_prediction_cache = None
+_prediction_cache_lock = threading.Lock()
+
+# Global early-exit forest evaluator (created on first prediction when enabled)
+_evaluator = None
+_evaluator_lock = threading.Lock()
+
+
+def _resolve_model_path() -> Path:
+    """
+    Resolve MODEL_PATH to the model file.
+    
+    Raises:
+        FileNotFoundError: If MODEL_PATH is not set or the file does not exist
+    """
+    model_path_env = os.getenv('MODEL_PATH')
+    
+    if not model_path_env:
+        raise FileNotFoundError("MODEL_PATH environment variable is not set")
+    
+    prospective_model_path = Path(model_path_env).resolve()
+    
+    if not prospective_model_path.exists():
+        raise FileNotFoundError(f"Model file not found at {prospective_model_path}")
+    
+    return prospective_model_path
+
+
+def _read_model(model_path: Path) -> tuple:
+    """
+    Read a model file: a forest artifact (see utils/model_artifact.py), which
+    is memory-mapped read-only and shared between workers, or the pickle file
+    with {'model': RandomForestClassifier}.
+    
+    Args:
+        model_path: Resolved path of the model file
+        
+    Returns:
+        Tuple of (model, model format, version); version is the pickle's
+        optional 'version' entry, or None
+        
+    Raises:
+        ValueError: If the file does not contain a usable model
+    """
+    if is_forest_artifact(model_path):
+        # Arrays are views into a shared read-only mapping, no unpickling
+        return load_artifact(model_path), "artifact", None
+    
+    # Load the pickle file
+    with open(model_path, 'rb') as f:
+        model_dict = pickle.load(f)
+    
+    # Extract the model from the dictionary
+    # The pickle file contains: {'model': RandomForestClassifier}
+    if not isinstance(model_dict, dict) or 'model' not in model_dict:
+        raise ValueError("Model dictionary does not contain 'model' key")
+    
+    model = model_dict['model']
+    
+    # Verify it's a valid sklearn model
+    if not hasattr(model, 'predict') or not hasattr(model, 'predict_proba'):
+        raise ValueError("Loaded object is not a valid sklearn classifier")
+    
+    if MODEL_BACKEND == 'compiled':
+        model = _compile_model(model)
+    
+    version = model_dict.get('version')
+    return model, "pickle", str(version) if version is not None else None
+
+
+def _describe_model(model_path: Path, version: Optional[str], content_hash: str, load_seconds: float) -> dict:
+    """Build the metadata reported for the active model by get_model_info()."""
+    return {
+        "version": version or content_hash[:12],
+        "content_hash": content_hash,
+        "path": str(model_path),
+        "loaded_at": datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        "load_seconds": round(load_seconds, 3)
+    }
+
 
 def _load_model():
     """
-    Load the trained RandomForestClassifier model from pickle file.
-    Uses thread-safe singleton pattern to load model only once.
+    Load the trained model from MODEL_PATH.
+    Uses thread-safe singleton pattern to load model only once; later
+    changes to the file are picked up by reload_model().
+    
+    MODEL_PATH may point to a forest artifact (see utils/model_artifact.py),
+    which is memory-mapped read-only and shared between workers, or to the
+    pickle file with {'model': RandomForestClassifier}.
     
     Returns:
-        Loaded RandomForestClassifier model
+        Loaded CompiledForest or RandomForestClassifier model
         
     Raises:
         FileNotFoundError: If model file not found
+        ValueError: If the model does not fit the features or classes
         Exception: If model loading fails
     """
-    global _model
-    
-    logger.info(f"[_load_model] Called in PID: {os.getpid()}, _model is {'set' if _model is not None else 'None'}")
+    global _model, _model_format, _model_details
     
     # Return cached model if already loaded
     if _model is not None:
@@ -56,40 +168,30 @@ def _load_model():
         if _model is not None:
             return _model
         
-        logger.info("Loading RandomForest model for the first time...")
-        
-        # Get model path from environment variable
-        model_path_env = os.getenv('MODEL_PATH')
+        logger.info(f"Loading RandomForest model for the first time in PID {os.getpid()}...")
         
-        if not model_path_env:
-            raise FileNotFoundError("MODEL_PATH environment variable is not set")
-        
-        # Resolve the model path
-        prospective_model_path = Path(model_path_env).resolve()
-        
-        if not prospective_model_path.exists():
-            raise FileNotFoundError(f"Model file not found at {prospective_model_path}")
+        prospective_model_path = _resolve_model_path()
         
         logger.info(f"Loading model from: {prospective_model_path}")
         
         try:
-            # Load the pickle file
-            with open(prospective_model_path, 'rb') as f:
-                model_dict = pickle.load(f)
-            
-            # Extract the model from the dictionary
-            # The pickle file contains: {'model': RandomForestClassifier}
-            if 'model' not in model_dict:
-                raise ValueError("Model dictionary does not contain 'model' key")
+            start = time.perf_counter()
+            model, model_format, version = _read_model(prospective_model_path)
+            # Same checks as a reload, so a bad file fails at startup, not per request
+            validate_model(model, 42, CLASSES)
+            content_hash = file_hash(prospective_model_path)
             
-            _model = model_dict['model']
+            _model_details = _describe_model(prospective_model_path, version, content_hash,
+                                             time.perf_counter() - start)
+            _model = model
+            _model_format = model_format
             
-            # Verify it's a valid sklearn model
-            if not hasattr(_model, 'predict') or not hasattr(_model, 'predict_proba'):
-                raise ValueError("Loaded object is not a valid sklearn classifier")
-            
-            logger.info("✅ RandomForest model loaded and cached successfully!")
-            logger.info(f"Model type: {type(_model).__name__}")
+            if model_format == "artifact":
+                logger.info("✅ Forest artifact memory-mapped and cached successfully!")
+            else:
+                logger.info("✅ RandomForest model loaded and cached successfully!")
+                logger.info(f"Model type: {type(_model).__name__}")
+            logger.info(f"Model version: {_model_details['version']} (sha256 {content_hash[:12]})")
             
             # Log model information if available
             if hasattr(_model, 'n_estimators'):
@@ -97,6 +199,8 @@ def _load_model():
             if hasattr(_model, 'n_features_in_'):
                 logger.info(f"Expected features: {_model.n_features_in_}")
             
+            _start_model_watcher()
+            
             return _model
             
         except Exception as e:
@@ -104,25 +208,266 @@ def _load_model():
             raise
 
 
-def predict_sign(features: List[float]) -> Tuple[str, float]:
+def reload_model(force: bool = False) -> dict:
     """
-    Predict ASL sign from hand landmark features.
+    Load MODEL_PATH again and swap it in if the file changed.
+    The new model is read, validated (42 features, CLASSES) and warmed up
+    while requests keep using the active model, then replaces it in one
+    assignment: in-flight predictions finish on the model they started with.
+    The prediction cache notices the new model by itself; the frame cache
+    is cleared, since its results came from the old model, and motion gates
+    stop reusing results once model_generation() changes.
+    
+    Only this process is affected; under gunicorn every worker reloads
+    through its own file watcher.
+    
+    Args:
+        force: Reload even if the file content has not changed
+        
+    Returns:
+        Dictionary with "reloaded" (False if the content was unchanged) and
+        the active model's version, content_hash, path and loaded_at
+        
+    Raises:
+        FileNotFoundError: If MODEL_PATH is not set or the file does not exist
+        ValueError: If the new model fails validation (the active model stays)
+    """
+    global _model, _model_format, _model_details, _reload_count
+    
+    with _reload_lock:
+        model_path = _resolve_model_path()
+        content_hash = file_hash(model_path)
+        
+        if not force and _model is not None and content_hash == _model_details.get("content_hash"):
+            logger.debug(f"Model file unchanged (sha256 {content_hash[:12]}), not reloading")
+            return {"reloaded": False, **_model_details}
+        
+        logger.info(f"Reloading model from: {model_path}")
+        start = time.perf_counter()
+        model, model_format, version = _read_model(model_path)
+        
+        try:
+            validate_model(model, 42, CLASSES)
+        except ValueError as e:
+            logger.error(f"New model rejected, keeping version {_model_details.get('version')}: {str(e)}")
+            raise
+        
+        details = _describe_model(model_path, version, content_hash, time.perf_counter() - start)
+        
+        with _model_lock:
+            previous_version = _model_details.get("version")
+            _model = model
+            _model_format = model_format
+            _model_details = details
+            _reload_count += 1
+            _start_model_watcher()
+        
+        frame_cache = get_frame_cache()
+        if frame_cache is not None:
+            frame_cache.clear()
+        
+        logger.info(f"✅ Model version {details['version']} active (was {previous_version}), "
+                    f"loaded and validated in {details['load_seconds']:.3f}s")
+        return {"reloaded": True, **details}
+
+
+def model_generation() -> int:
+    """
+    Generation of the active model: the number of models swapped in by
+    reload_model() in this process. Results computed under one generation
+    must not be reused for another (see utils/motion_gate.py).
+    """
+    return _reload_count
+
+
+def _reload_on_change():
+    """File watcher callback: reload if the new file's content differs."""
+    reload_model()
+
+
+def _start_model_watcher():
+    """Start watching MODEL_PATH for new models, once per process. Must hold ``_model_lock``."""
+    global _watcher
+    
+    if MODEL_WATCH_INTERVAL <= 0 or _watcher is not None:
+        return
+    
+    # Watch the configured path, not the resolved one, so a symlink that is
+    # switched to a new file counts as a change
+    _watcher = ModelFileWatcher(os.getenv('MODEL_PATH'), _reload_on_change)
+    _watcher.start()
+
+
+def stop_model_watcher():
+    """Stop the model file watcher if it was started."""
+    global _watcher
+    
+    with _model_lock:
+        watcher, _watcher = _watcher, None
+    
+    if watcher is not None:
+        watcher.stop()
+
+
+def _compile_model(model):
+    """
+    Compile a sklearn forest into a CompiledForest, keeping the sklearn model
+    if compilation fails or the compiled output differs from predict_proba.
+    
+    Args:
+        model: Loaded sklearn forest
+        
+    Returns:
+        CompiledForest, or the original model as a fallback
+    """
+    try:
+        compiled = CompiledForest.from_sklearn(model)
+    except Exception as e:
+        logger.error(f"Could not compile model, using sklearn backend: {str(e)}")
+        return model
+    
+    if not verify_compiled(compiled, model):
+        logger.error("Compiled model does not match predict_proba, using sklearn backend")
+        return model
+    
+    logger.info("Using compiled forest backend (verified against predict_proba)")
+    return compiled
+
+
+def _batched_predict_proba(features_matrix: np.ndarray) -> np.ndarray:
+    """Predict probabilities for a stacked batch of rows (micro-batcher callback)."""
+    return _load_model().predict_proba(features_matrix)
+
+
+def get_batcher() -> Optional[MicroBatcher]:
+    """
+    Get the process-wide prediction micro-batcher.
+    Single-row predictions from concurrent requests are coalesced into one
+    predict_proba call (see utils/batching.py).
+    
+    Returns:
+        MicroBatcher instance, or None if batching is disabled
+    """
+    global _batcher
+    
+    if not BATCHING_ENABLED:
+        return None
+    
+    if _batcher is not None:
+        return _batcher
+    
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = MicroBatcher(_batched_predict_proba)
+        return _batcher
+
+
+def shutdown_batcher():
+    """Finish queued rows and stop the process-wide micro-batcher if it was created."""
+    global _batcher
+    
+    with _batcher_lock:
+        batcher, _batcher = _batcher, None
+    
+    if batcher is not None:
+        batcher.shutdown()
+
+
+atexit.register(shutdown_batcher)
+
+
+def get_prediction_cache() -> Optional[PredictionCache]:
+    """
+    Get the process-wide prediction cache.
+    Repeated (quantized) landmark vectors reuse their probabilities instead
+    of re-running the forest (see utils/prediction_cache.py).
+    
+    Returns:
+        PredictionCache instance, or None if PREDICTION_CACHE_SIZE is 0
+    """
+    global _prediction_cache
+    
+    if PREDICTION_CACHE_SIZE < 1:
+        return None
+    
+    if _prediction_cache is not None:
+        return _prediction_cache
+    
+    with _prediction_cache_lock:
+        if _prediction_cache is None:
+            _prediction_cache = PredictionCache()
+        return _prediction_cache
+
+
+def get_forest_evaluator() -> Optional[EarlyExitEvaluator]:
+    """
+    Get the process-wide early-exit forest evaluator.
+    Trees are scored in chunks and a row stops once its result is decided,
+    optionally after a small first-stage forest (see utils/early_exit.py).
+    
+    Returns:
+        EarlyExitEvaluator instance, or None if FOREST_EARLY_EXIT is off
+        and no FOREST_CASCADE_TREES are set
+    """
+    global _evaluator
+    
+    if not EARLY_EXIT_ENABLED and CASCADE_TREES < 1:
+        return None
+    
+    if _evaluator is not None:
+        return _evaluator
+    
+    with _evaluator_lock:
+        if _evaluator is None:
+            _evaluator = EarlyExitEvaluator(CONFIDENCE_THRESHOLD)
+        return _evaluator
+
+
+def _label_for(probabilities: np.ndarray) -> Tuple[str, float, int]:
+    """
+    Map a probability vector to a class label, applying the confidence threshold.
+    
+    Args:
+        probabilities: Array of shape (n_classes,) from predict_proba
+        
+    Returns:
+        Tuple of (predicted_sign, confidence, predicted_class_idx)
+    """
+    predicted_class_idx = int(np.argmax(probabilities))
+    confidence = float(probabilities[predicted_class_idx])
+    
+    if confidence < CONFIDENCE_THRESHOLD:
+        predicted_sign = "uncertain"
+    elif predicted_class_idx < len(CLASSES):
+        predicted_sign = CLASSES[predicted_class_idx]
+    else:
+        predicted_sign = f"Unknown_{predicted_class_idx}"
+        logger.warning(f"Predicted class index {predicted_class_idx} out of range (max: {len(CLASSES)-1})")
+    
+    return predicted_sign, confidence, predicted_class_idx
+
+
+def predict_sign_with_probabilities(features: List[float], stats: Optional[dict] = None) -> Tuple[str, float, np.ndarray]:
+    """
+    Predict ASL sign from hand landmark features, also returning the full
+    class probability vector (used by the realtime temporal decoder).
     
     Args:
         features: List of 42 float values (21 landmarks × 2 coordinates)
+        stats: Optional dictionary; with early-exit evaluation enabled it
+               receives "trees_evaluated" (0 for a prediction cache hit)
         
     Returns:
-        Tuple of (predicted_sign, confidence)
+        Tuple of (predicted_sign, confidence, probabilities)
         - predicted_sign: The predicted class label (A-Z, Space, nothing)
         - confidence: Probability score between 0 and 1
+        - probabilities: Array of shape (n_classes,) in CLASSES order
         
     Raises:
         ValueError: If features are invalid
         Exception: If prediction fails
     """
     try:
-        logger.info(f"[predict_sign] Called in PID: {os.getpid()}")
-        
         # Ensure model is loaded
         model = _load_model()
         
@@ -141,42 +486,68 @@ def predict_sign(features: List[float]) -> Tuple[str, float]:
         # sklearn expects shape (n_samples, n_features)
         features_array = np.asarray(features).reshape(1, -1)
         
-        logger.info(f"Feature array shape: {features_array.shape}")
-        logger.info(f"Feature range: [{features_array.min():.3f}, {features_array.max():.3f}]")
+        if log_enabled(logger, logging.DEBUG):
+            logger.debug(f"Feature array shape: {features_array.shape}, "
+                         f"range: [{features_array.min():.3f}, {features_array.max():.3f}]")
         
-        # Get prediction probabilities
-        # predict_proba returns array of shape (n_samples, n_classes)
-        probabilities = model.predict_proba(features_array)[0]
+        # A pose seen recently (same quantized landmarks) reuses its probabilities
+        cache = get_prediction_cache()
+        cache_key = cache.key(features_array[0]) if cache is not None else None
+        probabilities = cache.get(model, cache_key) if cache is not None else None
         
-        # Get the class with highest probability
-        predicted_class_idx = np.argmax(probabilities)
-        confidence = float(probabilities[predicted_class_idx])
+        evaluator = get_forest_evaluator()
         
-        logger.info(f"Raw prediction - Class index: {predicted_class_idx}, Confidence: {confidence:.4f}")
-        
-        # Check confidence threshold
-        if confidence < CONFIDENCE_THRESHOLD:
-            logger.warning(f"Prediction confidence {confidence:.4f} below threshold {CONFIDENCE_THRESHOLD}")
-            predicted_sign = "uncertain"
-            logger.info(f"Returning 'uncertain' due to low confidence")
+        if probabilities is not None:
+            logger.debug("Landmarks match a cached prediction")
+            if evaluator is not None and stats is not None:
+                stats["trees_evaluated"] = 0
+        elif evaluator is not None and supports_early_exit(model):
+            # Exits are decided per row, so these rows skip the micro-batcher
+            with timed("predict"):
+                probabilities, trees = evaluator.predict_proba(model, features_array)
+            probabilities = probabilities[0]
+            if stats is not None:
+                stats["trees_evaluated"] = int(trees[0])
+            
+            if cache is not None:
+                cache.put(model, cache_key, probabilities)
         else:
-            # Map index to class label
-            if predicted_class_idx < len(CLASSES):
-                predicted_sign = CLASSES[predicted_class_idx]
-            else:
-                predicted_sign = f"Unknown_{predicted_class_idx}"
-                logger.warning(f"Predicted class index {predicted_class_idx} out of range (max: {len(CLASSES)-1})")
+            # Get prediction probabilities
+            # predict_proba returns array of shape (n_samples, n_classes); under
+            # concurrent load the micro-batcher stacks rows from several requests
+            batcher = get_batcher()
+            with timed("predict"):
+                if batcher is not None:
+                    probabilities = batcher.predict(features_array[0])
+                else:
+                    probabilities = model.predict_proba(features_array)[0]
+            
+            if evaluator is not None and stats is not None:
+                stats["trees_evaluated"] = model.n_estimators
+            
+            # The batcher predicts with the model active when the batch runs;
+            # after a reload in between, the result must not be cached for the old one
+            if cache is not None and (batcher is None or _load_model() is model):
+                cache.put(model, cache_key, probabilities)
         
-        logger.info(f"✅ Final Prediction: {predicted_sign}, Confidence: {confidence:.4f}")
+        # Get the class with highest probability and apply the confidence threshold
+        predicted_sign, confidence, predicted_class_idx = _label_for(probabilities)
         
-        # Log top 3 predictions for debugging
-        top_3_indices = np.argsort(probabilities)[-3:][::-1]
-        logger.info("Top 3 predictions:")
-        for idx in top_3_indices:
-            if idx < len(CLASSES):
-                logger.info(f"  {CLASSES[idx]}: {probabilities[idx]:.4f}")
+        # Everything below only builds log messages, so skip it unless it is written
+        if log_enabled(logger, logging.DEBUG):
+            logger.debug(f"Raw prediction - Class index: {predicted_class_idx}, Confidence: {confidence:.4f}")
+            
+            if predicted_sign == "uncertain":
+                logger.debug(f"Prediction confidence {confidence:.4f} below threshold {CONFIDENCE_THRESHOLD}, "
+                             f"returning 'uncertain'")
+            
+            # Top 3 predictions for debugging
+            top_3_indices = np.argsort(probabilities)[-3:][::-1]
+            logger.debug("Top 3 predictions: " + ", ".join(
+                f"{CLASSES[idx]}: {probabilities[idx]:.4f}" for idx in top_3_indices if idx < len(CLASSES)
+            ))
         
-        return predicted_sign, confidence
+        return predicted_sign, confidence, probabilities
         
     except Exception as e:
         logger.error(f"Error during prediction: {str(e)}")
@@ -185,6 +556,100 @@ def predict_sign(features: List[float]) -> Tuple[str, float]:
         raise
 
 
+def predict_sign(features: List[float]) -> Tuple[str, float]:
+    """
+    Predict ASL sign from hand landmark features.
+    
+    Args:
+        features: List of 42 float values (21 landmarks × 2 coordinates)
+        
+    Returns:
+        Tuple of (predicted_sign, confidence)
+        - predicted_sign: The predicted class label (A-Z, Space, nothing)
+        - confidence: Probability score between 0 and 1
+        
+    Raises:
+        ValueError: If features are invalid
+        Exception: If prediction fails
+    """
+    predicted_sign, confidence, _ = predict_sign_with_probabilities(features)
+    return predicted_sign, confidence
+
+
+def validate_feature_matrix(features) -> np.ndarray:
+    """
+    Validate a batch of feature vectors and convert it to a float array.
+    
+    Args:
+        features: Sequence of N vectors with 42 values each, or an (N, 42) array
+        
+    Returns:
+        Float array of shape (N, 42)
+        
+    Raises:
+        ValueError: If the batch is empty, ragged, non-numeric or not 42 wide
+    """
+    try:
+        features_array = np.asarray(features, dtype=np.float64)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Features must be numeric vectors of 42 values: {str(e)}")
+    
+    if features_array.ndim != 2 or features_array.shape[0] == 0:
+        raise ValueError(f"Expected a non-empty batch of feature vectors, got shape {features_array.shape}")
+    
+    if features_array.shape[1] != 42:
+        raise ValueError(f"Expected 42 features, got {features_array.shape[1]}")
+    
+    if not np.isfinite(features_array).all():
+        raise ValueError("Features must be finite numbers")
+    
+    return features_array
+
+
+def predict_signs_batch(features) -> List[Tuple[str, float]]:
+    """
+    Predict ASL signs for many feature vectors with a single predict_proba call.
+    
+    Args:
+        features: Sequence of N vectors with 42 values each, or an (N, 42) array
+        
+    Returns:
+        List of N (predicted_sign, confidence) tuples, in input order
+        
+    Raises:
+        ValueError: If features are invalid
+        Exception: If prediction fails
+    """
+    try:
+        model = _load_model()
+        
+        if model is None:
+            raise ValueError("Failed to load model - model is None")
+        
+        features_array = validate_feature_matrix(features)
+        
+        # One vectorized call for the whole batch, shape (N, n_classes)
+        evaluator = get_forest_evaluator()
+        with timed("predict"):
+            if evaluator is not None and supports_early_exit(model, len(features_array)):
+                probabilities, _ = evaluator.predict_proba(model, features_array)
+            else:
+                probabilities = model.predict_proba(features_array)
+        
+        predictions = []
+        for row in probabilities:
+            predicted_sign, confidence, _ = _label_for(row)
+            predictions.append((predicted_sign, confidence))
+        
+        logger.info(f"Batch prediction completed for {len(predictions)} samples")
+        
+        return predictions
+        
+    except Exception as e:
+        logger.error(f"Error during batch prediction: {str(e)}")
+        raise
+
+
 def get_model_info() -> dict:
     """
     Get information about the loaded model.
@@ -198,6 +663,14 @@ def get_model_info() -> dict:
         
         info = {
             "model_type": type(model).__name__,
+            "backend": "compiled" if isinstance(model, CompiledForest) else "sklearn",
+            "model_format": _model_format,
+            "model_version": _model_details.get("version"),
+            "content_hash": _model_details.get("content_hash"),
+            "model_path": _model_details.get("path"),
+            "loaded_at": _model_details.get("loaded_at"),
+            "load_seconds": _model_details.get("load_seconds"),
+            "reloads": _reload_count,
             "num_classes": len(CLASSES),
             "classes": CLASSES,
             "confidence_threshold": CONFIDENCE_THRESHOLD,
@@ -0,0 +1,138 @@
+"""
+Prediction cache module for ASL sign language recognition.
+Memoizes class probabilities per quantized landmark vector, so a sign held
+steady across frames does not re-run the forest for every frame.
+"""
+
+import os
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Cache configuration (overridable through environment variables)
+# PREDICTION_CACHE_SIZE: maximum number of cached landmark vectors (0 disables the cache);
+#   off by default because a hit returns the prediction of the first vector seen
+#   in the grid cell, which can differ slightly from the exact vector's prediction
+# PREDICTION_CACHE_GRID: quantization step for landmark coordinates; MediaPipe
+#   coordinates are normalized to [0, 1], so 0.005 is about 3px on a 640px frame
+PREDICTION_CACHE_SIZE = int(os.getenv('PREDICTION_CACHE_SIZE', 0))
+PREDICTION_CACHE_GRID = float(os.getenv('PREDICTION_CACHE_GRID', 0.005))
+
+
+class PredictionCache:
+    """
+    Thread-safe LRU cache from quantized feature vectors to probabilities.
+
+    Landmarks that fall in the same grid cell share one prediction. The
+    cache remembers which model filled it and empties itself the first time
+    it is used with a different model, so a reloaded model never serves
+    predictions of the previous one.
+    """
+
+    def __init__(self, max_entries: int = PREDICTION_CACHE_SIZE, grid: float = PREDICTION_CACHE_GRID):
+        if max_entries < 1:
+            raise ValueError(f"Cache size must be at least 1, got {max_entries}")
+        if grid <= 0:
+            raise ValueError(f"Quantization grid must be positive, got {grid}")
+
+        self.max_entries = max_entries
+        self.grid = grid
+
+        self._entries = OrderedDict()
+        self._model_ref = None
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    def key(self, features: np.ndarray) -> bytes:
+        """
+        Quantize a feature vector to the cache grid.
+
+        Args:
+            features: Feature vector of shape (n_features,)
+
+        Returns:
+            Hashable key for the vector's grid cell
+        """
+        return np.rint(np.asarray(features, dtype=np.float64) / self.grid).astype(np.int32).tobytes()
+
+    def _check_model(self, model):
+        """Empty the cache if it was filled by another model. Must hold ``_lock``."""
+        if self._model_ref is not None and self._model_ref() is model:
+            return
+        if self._entries:
+            self._entries.clear()
+            self._invalidations += 1
+            logger.info("Model changed, prediction cache cleared")
+        self._model_ref = weakref.ref(model)
+
+    def get(self, model, key: bytes) -> Optional[np.ndarray]:
+        """
+        Look up the probabilities for a grid cell.
+
+        Args:
+            model: Model the prediction is for
+            key: Key from key()
+
+        Returns:
+            Cached probability vector, or None on a miss
+        """
+        with self._lock:
+            self._check_model(model)
+            probabilities = self._entries.get(key)
+            if probabilities is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return probabilities
+
+    def put(self, model, key: bytes, probabilities: np.ndarray):
+        """
+        Store the probabilities for a grid cell.
+
+        Args:
+            model: Model that made the prediction
+            key: Key from key()
+            probabilities: Probability vector of shape (n_classes,)
+        """
+        with self._lock:
+            self._check_model(model)
+            # Copy, so a row of a batched result does not pin the whole batch
+            self._entries[key] = np.array(probabilities, copy=True)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache configuration and hit/miss/eviction counters
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "max_entries": self.max_entries,
+                "grid": self.grid,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "hit_rate": self._hits / lookups if lookups else 0.0
+            }
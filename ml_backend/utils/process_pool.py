@@ -0,0 +1,308 @@
+"""
+Extraction process pool module for ASL sign language recognition.
+Runs MediaPipe landmark extraction in separate processes so one HTTP front
+end can use every core. Frames are handed over through shared memory slots
+instead of being pickled.
+"""
+
+import os
+import time
+import queue
+import atexit
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils.detector_pool import configure_detector_pool
+from utils.feature_extraction import extract_hand_landmarks
+from utils.image_io import MAX_RAW_FRAME_SIZE
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Pool configuration (overridable through environment variables)
+# EXTRACT_PROCESSES: extraction processes per server worker (0 = extract in the request thread)
+# EXTRACT_MAX_PENDING: frames queued or in flight before new frames are rejected
+# EXTRACT_TASK_TIMEOUT: seconds a frame may wait and run before the request gives up
+# EXTRACT_SLOT_SIZE: bytes per shared memory slot; larger frames are extracted in-thread
+EXTRACT_PROCESSES = int(os.getenv('EXTRACT_PROCESSES', 0))
+EXTRACT_MAX_PENDING = int(os.getenv('EXTRACT_MAX_PENDING', 2 * EXTRACT_PROCESSES))
+EXTRACT_TASK_TIMEOUT = float(os.getenv('EXTRACT_TASK_TIMEOUT', 5))
+EXTRACT_SLOT_SIZE = int(os.getenv('EXTRACT_SLOT_SIZE', MAX_RAW_FRAME_SIZE))
+
+# Frame pushed through every process during warm-up
+WARMUP_FRAME_SHAPE = (256, 256, 3)
+
+# Shared memory slots attached by the current extraction process
+_worker_slots: Dict[int, SharedMemory] = {}
+
+
+def _init_worker(slot_names: List[str]):
+    """Attach the shared memory slots and create this process's detector."""
+    for index, name in enumerate(slot_names):
+        _worker_slots[index] = SharedMemory(name=name)
+
+    # One task runs at a time per process, so one detector is enough
+    configure_detector_pool(max_size=1, min_size=1)
+
+
+def _extract_in_worker(slot: int, shape: Tuple[int, ...], is_rgb: bool,
+                       deadline: float) -> Tuple[Optional[List[float]], Optional[dict]]:
+    """Extract landmarks from the frame in ``slot`` (runs in an extraction process)."""
+    if time.time() > deadline:
+        return None, {
+            "status": "error",
+            "message": "Frame expired in the extraction queue"
+        }
+
+    image = np.ndarray(shape, dtype=np.uint8, buffer=_worker_slots[slot].buf)
+    return extract_hand_landmarks(image, is_rgb=is_rgb)
+
+
+class ExtractionProcessPool:
+    """
+    Process pool that owns the MediaPipe detectors used for stateless frames.
+
+    The parent copies each decoded frame into a free shared memory slot and
+    submits only the slot index and shape. The number of slots bounds the
+    queue: when all slots are taken for ``task_timeout`` seconds the frame is
+    rejected. Each task carries a deadline, so frames whose caller already
+    gave up are skipped instead of processed.
+    """
+
+    def __init__(self, processes: int = EXTRACT_PROCESSES, max_pending: int = EXTRACT_MAX_PENDING,
+                 task_timeout: float = EXTRACT_TASK_TIMEOUT, slot_size: int = EXTRACT_SLOT_SIZE):
+        if processes < 1:
+            raise ValueError(f"Process count must be at least 1, got {processes}")
+
+        self.processes = processes
+        self.max_pending = max(processes, max_pending)
+        self.task_timeout = task_timeout
+        self.slot_size = slot_size
+
+        self._slots = [SharedMemory(create=True, size=slot_size) for _ in range(self.max_pending)]
+        self._free = queue.Queue()
+        for index in range(self.max_pending):
+            self._free.put(index)
+
+        # Statistics
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timeouts = 0
+        self._crashes = 0
+        self._restarts = 0
+        self._in_thread = 0
+        self._closed = False
+
+        self._executor_lock = threading.Lock()
+        self._executor = self._create_executor()
+
+        logger.info(f"Extraction process pool started ({processes} processes, {self.max_pending} slots "
+                    f"of {slot_size / (1024 * 1024):.1f}MB)")
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        # spawn: MediaPipe and the server's threads do not survive fork()
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=([slot.name for slot in self._slots],)
+        )
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        """
+        Replace an executor whose process died (crash or OOM kill).
+
+        The shared memory slots are kept: the new processes attach the same
+        names. Requests that hit the same broken executor restart it once.
+        """
+        with self._executor_lock:
+            if self._executor is not broken or self._closed:
+                return
+            self._executor = self._create_executor()
+            self._restarts += 1
+
+        broken.shutdown(wait=False, cancel_futures=True)
+        logger.error("Extraction process died, restarted the process pool")
+
+    def _count(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _release(self, slot: int):
+        self._free.put(slot)
+
+    def extract(self, image: np.ndarray, is_rgb: bool = False) -> Tuple[Optional[List[float]], Optional[dict]]:
+        """
+        Extract hand landmarks in an extraction process.
+
+        Args:
+            image: Decoded uint8 image (BGR, or RGB with ``is_rgb``)
+            is_rgb: True if a 3-channel image is already in RGB order
+
+        Returns:
+            Tuple of (features, error_info) - same as extract_hand_landmarks()
+        """
+        if self._closed:
+            raise RuntimeError("Extraction process pool is shut down")
+
+        if image is None or image.dtype != np.uint8 or image.nbytes > self.slot_size:
+            # Does not fit a slot: extract in the calling thread
+            self._count('_in_thread')
+            return extract_hand_landmarks(image, is_rgb=is_rgb)
+
+        deadline = time.time() + self.task_timeout
+
+        try:
+            slot = self._free.get(timeout=self.task_timeout)
+        except queue.Empty:
+            self._count('_rejected')
+            logger.warning("Extraction queue is full, rejecting frame")
+            return None, {
+                "status": "error",
+                "message": "Server is busy, please retry"
+            }
+
+        executor = self._executor
+        try:
+            view = np.ndarray(image.shape, dtype=np.uint8, buffer=self._slots[slot].buf)
+            view[...] = image
+            del view
+            future = executor.submit(_extract_in_worker, slot, image.shape, is_rgb, deadline)
+        except BrokenProcessPool:
+            self._release(slot)
+            return self._crashed(executor)
+        except Exception:
+            self._release(slot)
+            raise
+
+        # The slot is reusable only once the process is done with it, even if we time out
+        future.add_done_callback(lambda _: self._release(slot))
+        self._count('_submitted')
+
+        try:
+            result = future.result(timeout=max(0.0, deadline - time.time()))
+        except FutureTimeoutError:
+            self._count('_timeouts')
+            logger.warning(f"Landmark extraction exceeded {self.task_timeout}s deadline")
+            return None, {
+                "status": "error",
+                "message": "Landmark extraction timed out"
+            }
+        except BrokenProcessPool:
+            return self._crashed(executor)
+
+        self._count('_completed')
+        return result
+
+    def _crashed(self, executor: ProcessPoolExecutor) -> Tuple[None, dict]:
+        """Count a frame lost to a dead extraction process and restart the pool."""
+        self._count('_crashes')
+        self._restart(executor)
+        return None, {
+            "status": "error",
+            "message": "Landmark extraction failed, please retry"
+        }
+
+    def warm_up(self):
+        """Start every process and run one frame through each detector."""
+        slot = self._free.get()
+        try:
+            view = np.ndarray(WARMUP_FRAME_SHAPE, dtype=np.uint8, buffer=self._slots[slot].buf)
+            view[...] = 0
+            del view
+            deadline = time.time() + 60
+            # Submitting all at once makes the executor spawn every process
+            futures = [
+                self._executor.submit(_extract_in_worker, slot, WARMUP_FRAME_SHAPE, False, deadline)
+                for _ in range(self.processes)
+            ]
+            for future in futures:
+                future.result()
+        finally:
+            self._release(slot)
+
+    def stats(self) -> dict:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with pool configuration and task counters
+        """
+        with self._lock:
+            return {
+                "processes": self.processes,
+                "max_pending": self.max_pending,
+                "pending": self.max_pending - self._free.qsize(),
+                "task_timeout": self.task_timeout,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timeouts": self._timeouts,
+                "crashes": self._crashes,
+                "restarts": self._restarts,
+                "in_thread": self._in_thread,
+                "closed": self._closed
+            }
+
+    def shutdown(self):
+        """Stop the extraction processes and free the shared memory slots."""
+        if self._closed:
+            return
+        with self._executor_lock:
+            self._closed = True
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        for slot in self._slots:
+            slot.close()
+            slot.unlink()
+
+        logger.info("Extraction process pool shut down")
+
+
+# Global pool (one per server worker process)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_extraction_pool() -> Optional[ExtractionProcessPool]:
+    """
+    Get the process-wide extraction pool, creating it on first use.
+
+    Returns:
+        ExtractionProcessPool instance, or None if EXTRACT_PROCESSES is 0
+    """
+    global _pool
+
+    if EXTRACT_PROCESSES < 1:
+        return None
+
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ExtractionProcessPool()
+        return _pool
+
+
+def shutdown_extraction_pool():
+    """Shut down the process-wide extraction pool if it was created."""
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_extraction_pool)
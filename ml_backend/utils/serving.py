@@ -0,0 +1,87 @@
+"""
+Serving lifecycle module for ASL sign language recognition.
+Warms up a worker process before it accepts traffic and drains it on
+shutdown. Used by the gunicorn hooks in gunicorn.conf.py.
+"""
+
+import os
+import time
+import logging
+import threading
+
+import numpy as np
+
+from utils.detector_pool import get_detector_pool, shutdown_detector_pool
+from utils.feature_extraction import extract_hand_landmarks
+from utils.predict import _load_model, get_batcher, shutdown_batcher, stop_model_watcher
+from utils.process_pool import get_extraction_pool, shutdown_extraction_pool
+from utils.sessions import shutdown_session_manager
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Size of the blank frame pushed through MediaPipe during warm-up
+WARMUP_FRAME_SIZE = 256
+
+# Set once the worker has been asked to stop
+_draining = threading.Event()
+
+
+def warm_up():
+    """
+    Load everything a request needs so the first real request is not slow:
+    the model, every pre-initialized detector (with its first inference run), the
+    prediction micro-batcher and the extraction processes, if enabled.
+
+    Raises:
+        Exception: If the model or detectors cannot be loaded; the worker
+                   should not serve traffic in that case
+    """
+    start = time.perf_counter()
+
+    model = _load_model()
+    model.predict_proba(np.zeros((1, model.n_features_in_)))
+
+    batcher = get_batcher()
+    if batcher is not None:
+        batcher.predict(np.zeros(model.n_features_in_))
+
+    # The first process() call per detector initializes the TFLite graph
+    blank = np.zeros((WARMUP_FRAME_SIZE, WARMUP_FRAME_SIZE, 3), dtype=np.uint8)
+    get_detector_pool().warm_up(blank)
+    _, error_info = extract_hand_landmarks(blank)
+    if error_info is not None and error_info.get("status") == "error":
+        raise RuntimeError(f"Detector warm-up failed: {error_info.get('message')}")
+
+    extraction_pool = get_extraction_pool()
+    if extraction_pool is not None:
+        extraction_pool.warm_up()
+
+    logger.info(f"Worker {os.getpid()} warmed up in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+
+def begin_drain():
+    """Mark this worker as draining: health checks fail and streams close."""
+    if not _draining.is_set():
+        logger.info(f"Worker {os.getpid()} draining")
+        _draining.set()
+
+
+def is_draining() -> bool:
+    """Check whether this worker is shutting down."""
+    return _draining.is_set()
+
+
+def shutdown():
+    """
+    Release per-worker resources after in-flight requests have finished:
+    finish queued predictions, close realtime sessions, detectors and
+    extraction processes.
+    """
+    begin_drain()
+    stop_model_watcher()
+    shutdown_extraction_pool()
+    shutdown_batcher()
+    shutdown_session_manager()
+    shutdown_detector_pool()
+    logger.info(f"Worker {os.getpid()} shut down")
@@ -0,0 +1,267 @@
+"""
+Realtime session module for ASL sign language recognition.
+Keeps per-client state for webcam streams so consecutive frames from the same
+user can reuse a MediaPipe Hands tracker instead of running full detection.
+"""
+
+import atexit
+import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import mediapipe as mp
+
+from utils.motion_gate import MotionGate
+from utils.temporal_decoder import TemporalDecoder
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+mp_hands = mp.solutions.hands
+
+# Session configuration (overridable through environment variables)
+SESSION_TTL = float(os.getenv('SESSION_TTL', 60))
+MAX_SESSIONS = int(os.getenv('MAX_SESSIONS', 32))
+MAX_SESSION_ID_LENGTH = 128
+
+# Tracker settings - static_image_mode=False enables the landmark tracker,
+# so palm detection only re-runs when tracking confidence drops
+TRACKER_OPTIONS = {
+    "static_image_mode": False,
+    "max_num_hands": 2,
+    "min_detection_confidence": 0.5,
+    "min_tracking_confidence": 0.5
+}
+
+
+class RealtimeSession:
+    """
+    State for one realtime client.
+
+    Frames from the same session are processed one at a time (``lock``),
+    since the tracker carries state from one frame to the next.
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self.lock = threading.Lock()
+        self.created_at = time.monotonic()
+        self.last_seen = self.created_at
+        self.frames = 0
+        self.tracked_frames = 0
+        self.fallback_frames = 0
+        self.reused_frames = 0
+        self.tracking_hand = False
+        self.closed = False
+        self._tracker = None
+        self.decoder = TemporalDecoder()
+        self.motion = MotionGate()
+
+    @property
+    def tracker(self):
+        """MediaPipe Hands instance in video/tracking mode, created on first use."""
+        if self._tracker is None:
+            self._tracker = mp_hands.Hands(**TRACKER_OPTIONS)
+        return self._tracker
+
+    def decode(self, probabilities) -> dict:
+        """
+        Feed a frame's class probabilities (None if no hand) into the
+        session's temporal decoder.
+
+        Returns:
+            Decoder output (stable sign and committed text)
+        """
+        with self.lock:
+            return self.decoder.update(probabilities)
+
+    def close(self):
+        """Release the tracker. Waits for an in-flight frame to finish."""
+        with self.lock:
+            self.closed = True
+            if self._tracker is not None:
+                try:
+                    self._tracker.close()
+                except Exception as e:
+                    logger.warning(f"Error closing tracker for session {self.session_id}: {str(e)}")
+                self._tracker = None
+
+
+class SessionManager:
+    """
+    Thread-safe registry of realtime sessions with TTL eviction and a cap
+    on the number of concurrent sessions.
+    """
+
+    def __init__(self, ttl: float = SESSION_TTL, max_sessions: int = MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self._created = 0
+        self._expired = 0
+        self._rejected = 0
+
+    def _evict_expired(self, now: float) -> list:
+        """Remove sessions idle past the TTL. Must hold ``_lock``."""
+        expired = []
+        # Least recently seen sessions sit at the front
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if now - session.last_seen < self.ttl:
+                break
+            self._sessions.popitem(last=False)
+            expired.append(session)
+        self._expired += len(expired)
+        return expired
+
+    def get(self, session_id: str) -> Optional[RealtimeSession]:
+        """
+        Get the session for a client, creating it if needed.
+
+        Args:
+            session_id: Client-provided session identifier
+
+        Returns:
+            RealtimeSession, or None if the session cap is reached
+            (callers should fall back to stateless processing)
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            expired = self._evict_expired(now)
+            session = self._sessions.get(session_id)
+
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            elif len(self._sessions) < self.max_sessions:
+                session = RealtimeSession(session_id)
+                self._sessions[session_id] = session
+                self._created += 1
+            else:
+                self._rejected += 1
+
+            if session is not None:
+                session.last_seen = now
+
+        for old in expired:
+            logger.info(f"Session {old.session_id} expired after {self.ttl:.0f}s idle")
+            old.close()
+
+        if session is None:
+            logger.warning(f"Session cap ({self.max_sessions}) reached, processing frame without session")
+
+        return session
+
+    def remove(self, session_id: str) -> bool:
+        """
+        Close and forget a session.
+
+        Returns:
+            True if the session existed
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+
+        if session is None:
+            return False
+
+        session.close()
+        return True
+
+    def stats(self) -> dict:
+        """
+        Get session statistics.
+
+        Returns:
+            Dictionary with session statistics
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            stats = {
+                "active": len(sessions),
+                "max_sessions": self.max_sessions,
+                "ttl_seconds": self.ttl,
+                "created": self._created,
+                "expired": self._expired,
+                "rejected": self._rejected
+            }
+
+        stats["frames"] = sum(s.frames for s in sessions)
+        stats["tracked_frames"] = sum(s.tracked_frames for s in sessions)
+        stats["fallback_frames"] = sum(s.fallback_frames for s in sessions)
+        stats["reused_frames"] = sum(s.reused_frames for s in sessions)
+        return stats
+
+    def shutdown(self):
+        """Close every session."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+
+# Global session manager (one per worker process)
+_manager = None
+_manager_lock = threading.Lock()
+
+
+def get_session_manager() -> SessionManager:
+    """
+    Get the process-wide session manager, creating it on first use.
+
+    Returns:
+        SessionManager instance
+    """
+    global _manager
+
+    if _manager is not None:
+        return _manager
+
+    with _manager_lock:
+        if _manager is None:
+            _manager = SessionManager()
+        return _manager
+
+
+def get_request_session(header_session_id: Optional[str], data) -> Optional[RealtimeSession]:
+    """
+    Look up the realtime session of a request.
+    The session id comes from the X-Session-Id header or a "session_id" JSON field.
+
+    Args:
+        header_session_id: X-Session-Id header value, or None
+        data: Parsed JSON body (or None)
+
+    Returns:
+        RealtimeSession, or None for stateless processing
+    """
+    session_id = header_session_id
+    if not session_id and isinstance(data, dict):
+        session_id = data.get('session_id')
+
+    if not session_id or not isinstance(session_id, str) or len(session_id) > MAX_SESSION_ID_LENGTH:
+        return None
+
+    return get_session_manager().get(session_id)
+
+
+def shutdown_session_manager():
+    """Close all sessions of the process-wide manager if it was created."""
+    global _manager
+
+    with _manager_lock:
+        manager, _manager = _manager, None
+
+    if manager is not None:
+        manager.shutdown()
+
+
+atexit.register(shutdown_session_manager)
@@ -0,0 +1,150 @@
+"""
+Temporal decoder module for ASL sign language recognition.
+Smooths per-frame class probabilities over a realtime stream and turns them
+into committed fingerspelled text.
+"""
+
+import os
+import logging
+from typing import Optional
+
+import numpy as np
+
+from utils.predict import CLASSES
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+# Decoder configuration (overridable through environment variables)
+# DECODER_ALPHA: weight of the newest frame in the exponential moving average
+# DECODER_ENTER: smoothed confidence a letter needs before it can be committed
+# DECODER_EXIT: smoothed confidence below which a committed letter is released
+# DECODER_MIN_FRAMES: consecutive frames a letter must lead before it is committed
+DECODER_ALPHA = float(os.getenv('DECODER_ALPHA', 0.5))
+DECODER_ENTER = float(os.getenv('DECODER_ENTER', 0.6))
+DECODER_EXIT = float(os.getenv('DECODER_EXIT', 0.4))
+DECODER_MIN_FRAMES = int(os.getenv('DECODER_MIN_FRAMES', 2))
+
+# Keep only the tail of the committed text per session
+MAX_TEXT_LENGTH = 500
+
+SPACE_LABEL = "Space"
+NOTHING_LABEL = "nothing"
+
+
+class TemporalDecoder:
+    """
+    Per-session letter-sequence decoder.
+
+    Probabilities are smoothed with an exponential moving average. A letter
+    is committed once it has led with smoothed confidence >= ``enter`` for
+    ``min_frames`` consecutive frames, and stays latched (not re-emitted)
+    until its confidence falls below ``exit`` or another letter takes over.
+    ``Space`` commits a space. ``nothing``, ``Space`` and frames without a
+    hand are segment boundaries: the latch on the previous letter is released,
+    so the same letter can be committed again after them.
+    """
+
+    def __init__(self, alpha: float = DECODER_ALPHA, enter: float = DECODER_ENTER,
+                 exit: float = DECODER_EXIT, min_frames: int = DECODER_MIN_FRAMES):
+        if not 0 < alpha <= 1:
+            raise ValueError(f"alpha must be in (0, 1], got {alpha}")
+        if exit > enter:
+            raise ValueError(f"exit threshold ({exit}) must not exceed enter threshold ({enter})")
+
+        self.alpha = alpha
+        self.enter = enter
+        self.exit = exit
+        self.min_frames = max(1, min_frames)
+
+        self._smoothed = None
+        self._candidate = None
+        self._candidate_frames = 0
+        self._latched = None
+        self._text = ""
+
+    def _boundary(self):
+        """End the current segment: forget smoothing and release the latch."""
+        self._smoothed = None
+        self._candidate = None
+        self._candidate_frames = 0
+        self._latched = None
+
+    def _commit(self, class_idx: int) -> str:
+        label = CLASSES[class_idx] if class_idx < len(CLASSES) else None
+
+        if label is None or label == NOTHING_LABEL:
+            return ""
+        if label == SPACE_LABEL:
+            # Collapse repeated spaces and skip leading ones
+            if not self._text or self._text.endswith(" "):
+                return ""
+            new_text = " "
+        else:
+            new_text = label
+
+        self._text = (self._text + new_text)[-MAX_TEXT_LENGTH:]
+        return new_text
+
+    def update(self, probabilities: Optional[np.ndarray]) -> dict:
+        """
+        Feed one frame into the decoder.
+
+        Args:
+            probabilities: Class probability vector for the frame, or None
+                           if no hand was detected
+
+        Returns:
+            Dictionary with the stable sign, its smoothed confidence, the text
+            committed by this frame and the full committed text
+        """
+        new_text = ""
+
+        if probabilities is None:
+            self._boundary()
+        else:
+            probabilities = np.asarray(probabilities, dtype=np.float64)
+            if self._smoothed is None:
+                self._smoothed = probabilities.copy()
+            else:
+                self._smoothed = self.alpha * probabilities + (1 - self.alpha) * self._smoothed
+
+            top = int(np.argmax(self._smoothed))
+            confidence = float(self._smoothed[top])
+
+            # Hysteresis: a latched letter holds until it drops below the exit threshold
+            if self._latched is not None and (top != self._latched or confidence < self.exit):
+                self._latched = None
+
+            if self._latched is None:
+                if confidence >= self.enter:
+                    if top == self._candidate:
+                        self._candidate_frames += 1
+                    else:
+                        self._candidate = top
+                        self._candidate_frames = 1
+
+                    if self._candidate_frames >= self.min_frames:
+                        self._latched = top
+                        new_text = self._commit(top)
+                else:
+                    self._candidate = None
+                    self._candidate_frames = 0
+
+        stable_sign = None
+        stable_confidence = 0.0
+        if self._latched is not None and self._latched < len(CLASSES):
+            stable_sign = CLASSES[self._latched]
+            stable_confidence = float(self._smoothed[self._latched])
+
+        return {
+            "stable_sign": stable_sign,
+            "stable_confidence": stable_confidence,
+            "new_text": new_text,
+            "committed_text": self._text
+        }
+
+    def reset(self):
+        """Clear smoothing state and committed text."""
+        self._boundary()
+        self._text = ""